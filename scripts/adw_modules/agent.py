@@ -29,6 +29,7 @@ from .opencode_http_client import (
     extract_text_response,
     OpenCodeHTTPClient,
     estimate_metrics_from_parts,
+    decode_json,
 )
 from .token_utils import count_tokens, calculate_overage_percentage
 from .model_limits import get_model_limit
@@ -282,7 +283,8 @@ def invoke_opencode_model(prompt: str, model_id: str) -> AgentPromptResponse:
         )
         msg_resp.raise_for_status()
 
-        response_body = msg_resp.json()
+        # Code generation replies can be large; parse them with orjson
+        response_body = decode_json(msg_resp)
         parts = response_body.get("parts", [])
 
         # Extract text from parts using the new output parser function
@@ -1,9 +1,11 @@
+import logging
 import os
-import sys
 import yaml
 from pathlib import Path
 from typing import Dict, Any, Optional
 
+logger = logging.getLogger(__name__)
+
 
 class ADWConfig:
     def __init__(self, project_dir: Optional[Path] = None):
@@ -50,10 +52,11 @@ class ADWConfig:
                 p = current / cand
                 if p.exists() and p.is_file():
                     self._config_path = p.resolve()  # Use absolute path
-                    print(
-                        f"Deprecation warning: Using legacy config file {p}. "
-                        f"Please migrate to ADWS/config.yaml. Legacy config support will be removed in a future version.",
-                        file=sys.stderr,
+                    logger.warning(
+                        "Deprecation warning: Using legacy config file %s. "
+                        "Please migrate to ADWS/config.yaml. Legacy config "
+                        "support will be removed in a future version.",
+                        p,
                     )
                     self._load_config_from_file(p)
                     return
@@ -71,10 +74,7 @@ class ADWConfig:
             with open(path, "r", encoding="utf-8") as f:
                 self._data = yaml.safe_load(f) or {}
         except Exception as e:
-            print(
-                f"Warning: Failed to load config from {path}: {e}",
-                file=sys.stderr,
-            )
+            logger.warning("Failed to load config from %s: %s", path, e)
             self._data = {}
 
     def reinitialize_for_project(self, project_dir: Path):
@@ -198,6 +198,46 @@ class ADWConfig:
         """Get OpenCode read timeout (seconds)."""
         return self._data.get("opencode", {}).get("read_timeout", 600)
 
+    @property
+    def opencode_decision_cache(self) -> bool:
+        """Get whether repeated lightweight prompt responses are cached."""
+        return self._data.get("opencode", {}).get("decision_cache", False)
+
+    @property
+    def opencode_async_logging(self) -> bool:
+        """Get whether OpenCode response/error logs are written in the background."""
+        return self._data.get("opencode", {}).get("async_logging", False)
+
+    @property
+    def opencode_compress_requests(self) -> bool:
+        """Get whether large OpenCode request bodies are sent gzip-compressed."""
+        return self._data.get("opencode", {}).get("compress_requests", False)
+
+    @property
+    def opencode_circuit_breaker(self) -> bool:
+        """Get whether OpenCode clients fail fast while the server is down."""
+        return self._data.get("opencode", {}).get("circuit_breaker", False)
+
+    @property
+    def opencode_health_cache_ttl(self) -> float:
+        """Get seconds a successful OpenCode health check is reused (0 disables)."""
+        return self._data.get("opencode", {}).get("health_cache_ttl", 10.0)
+
+    @property
+    def opencode_transport(self) -> str:
+        """Get the HTTP transport used by the OpenCode client."""
+        return self._data.get("opencode", {}).get("transport", "requests")
+
+    @property
+    def opencode_pool_connections(self) -> int:
+        """Get number of per-host connection pools kept by the OpenCode client."""
+        return self._data.get("opencode", {}).get("pool_connections", 16)
+
+    @property
+    def opencode_pool_maxsize(self) -> int:
+        """Get maximum keep-alive connections per OpenCode host."""
+        return self._data.get("opencode", {}).get("pool_maxsize", 64)
+
     @property
     def unit_test_timeout(self) -> int:
         """Get unit test execution timeout in seconds.
@@ -6,6 +6,7 @@ providing an additional validation layer beyond log parsing.
 
 import subprocess
 import logging
+import re
 from typing import List, Dict, Optional, Tuple
 from dataclasses import dataclass, field
 
@@ -82,7 +83,6 @@ def get_file_changes(cwd: Optional[str] = None) -> GitChangeSet:
 
     if success and stdout:
         # Extract insertion/deletion counts from stats
-        import re
         for line in stdout.split('\n'):
             if 'insertion' in line or 'deletion' in line:
                 ins = re.search(r'(\d+)\s+insertion', line)
@@ -4,10 +4,82 @@ This module provides functions to format rich implementation summaries
 with specific metrics, errors, and warnings for Jira issue comments.
 """
 
-from typing import Optional, List
+from typing import Optional, List, Tuple
 from .data_types import AgentPromptResponse
 
 
+_SUCCESS_HEADER = "## ✅ Implementation Completed Successfully"
+_FAILURE_HEADER = "## ❌ Implementation Failed"
+_PLAN_EXECUTION_HEADER = "### Plan Execution"
+
+_CODE_FENCE = "```"
+_METRICS_TABLE_HEADER = "| Metric | Value |\n|--------|-------|"
+
+_STATUS_ICONS = {
+    "passed": "✅ Passed",
+    "failed": "❌ Failed",
+    "partial": "⚠️ Partial",
+    "unknown": "❓ Unknown",
+    "empty": "⚠️ No Output",
+}
+
+# (attribute, report label, inline format) for each code-change metric
+_METRICS = (
+    ("files_changed", "Files Changed", "{} files"),
+    ("lines_added", "Lines Added", "+{} lines"),
+    ("lines_removed", "Lines Removed", "-{} lines"),
+)
+
+
+def _present_metrics(response: AgentPromptResponse) -> List[Tuple[str, str, int]]:
+    """Collect (label, inline format, value) for metrics set on a response."""
+    present = []
+    for attr, label, inline in _METRICS:
+        value = getattr(response, attr)
+        if value is not None:
+            present.append((label, inline, value))
+    return present
+
+
+def _append_section(lines: List[str], header: str, body: List[str]) -> None:
+    """Append a markdown section (header, body, blank separator) to lines.
+
+    Args:
+        lines: Output lines being built by a formatter
+        header: Section header line
+        body: Section content lines
+    """
+    lines.append(header)
+    lines += body
+    lines.append("")
+
+
+def _join_lines(lines: List[str]) -> str:
+    """Join formatter lines, dropping trailing blank lines and whitespace.
+
+    Equivalent to ``"\n".join(lines).strip()`` for lines that start with a
+    header, without building a second stripped copy of the comment.
+
+    Args:
+        lines: Output lines built by a formatter (modified in place)
+
+    Returns:
+        Joined markdown string
+    """
+    while lines:
+        last = lines[-1].rstrip()
+        if last:
+            lines[-1] = last
+            break
+        lines.pop()
+    return "\n".join(lines)
+
+
+def _plan_step_count(plan_validation) -> str:
+    """Format executed/total step counts of a plan validation result."""
+    return f"{plan_validation.executed_steps}/{plan_validation.total_steps}"
+
+
 def format_implementation_summary(
     response: AgentPromptResponse, plan_validation=None
 ) -> str:
@@ -20,26 +92,31 @@ def format_implementation_summary(
     Returns:
         Formatted markdown string suitable for Jira comment
     """
+    # Fast path: a plain success carries nothing beyond the header
+    if (
+        response.success
+        and not response.validation_status
+        and response.files_changed is None
+        and response.lines_added is None
+        and not plan_validation
+        and not response.warnings
+        and not response.errors
+    ):
+        return _SUCCESS_HEADER
+
     lines = []
 
     # Header
     if response.success:
-        lines.append("## ✅ Implementation Completed Successfully")
+        lines.append(_SUCCESS_HEADER)
     else:
-        lines.append("## ❌ Implementation Failed")
+        lines.append(_FAILURE_HEADER)
 
     lines.append("")
 
     # Validation Status
     if response.validation_status:
-        status_icons = {
-            "passed": "✅ Passed",
-            "failed": "❌ Failed",
-            "partial": "⚠️ Partial",
-            "unknown": "❓ Unknown",
-            "empty": "⚠️ No Output",
-        }
-        status_text = status_icons.get(
+        status_text = _STATUS_ICONS.get(
             response.validation_status, response.validation_status
         )
         lines.append(f"**Validation Status:** {status_text}")
@@ -47,67 +124,51 @@ def format_implementation_summary(
 
     # Metrics Summary
     if response.files_changed is not None or response.lines_added is not None:
-        lines.append("### Implementation Metrics")
-
-        if response.files_changed is not None:
-            lines.append(f"- **Files Changed:** {response.files_changed}")
-
-        if response.lines_added is not None:
-            lines.append(f"- **Lines Added:** {response.lines_added}")
-
-        if response.lines_removed is not None:
-            lines.append(f"- **Lines Removed:** {response.lines_removed}")
-
+        body = [
+            f"- **{label}:** {value}"
+            for label, _, value in _present_metrics(response)
+        ]
         if response.test_results:
-            lines.append(f"- **Test Results:** {response.test_results}")
-
-        lines.append("")
+            body.append(f"- **Test Results:** {response.test_results}")
+        _append_section(lines, "### Implementation Metrics", body)
 
     # Plan Validation Details
     if plan_validation:
-        lines.append("### Plan Execution")
-        lines.append(
-            f"- **Steps Executed:** {plan_validation.executed_steps}/{plan_validation.total_steps}"
-        )
+        body = [f"- **Steps Executed:** {_plan_step_count(plan_validation)}"]
 
         if plan_validation.missing_steps:
-            lines.append(
+            body.append(
                 f"- **Missing Steps:** {', '.join(plan_validation.missing_steps)}"
             )
 
         if plan_validation.optional_steps_skipped:
-            lines.append(
-                f"- **Optional Steps Skipped:** {', '.join(plan_validation.optional_steps_skipped)}"
-            )
+            skipped = ", ".join(plan_validation.optional_steps_skipped)
+            body.append(f"- **Optional Steps Skipped:** {skipped}")
 
-        lines.append("")
+        _append_section(lines, _PLAN_EXECUTION_HEADER, body)
 
     # Warnings
     if response.warnings:
-        lines.append("### ⚠️ Warnings")
-        for warning in response.warnings:
-            lines.append(f"- {warning}")
-        lines.append("")
+        _append_section(
+            lines, "### ⚠️ Warnings", [f"- {w}" for w in response.warnings]
+        )
 
     # Errors
     if response.errors:
-        lines.append("### 🔴 Errors")
-        for error in response.errors:
-            lines.append(f"- {error}")
-        lines.append("")
+        _append_section(lines, "### 🔴 Errors", [f"- {e}" for e in response.errors])
 
     # Raw output preview (first 500 chars if needed)
     if not response.success and response.output and len(response.output) > 0:
-        lines.append("### Implementation Output (Preview)")
         preview = response.output[:500]
         if len(response.output) > 500:
             preview += "\n... (truncated)"
-        lines.append("```")
-        lines.append(preview)
-        lines.append("```")
-        lines.append("")
+        _append_section(
+            lines,
+            "### Implementation Output (Preview)",
+            [_CODE_FENCE, preview, _CODE_FENCE],
+        )
 
-    return "\n".join(lines).strip()
+    return _join_lines(lines)
 
 
 def format_error_summary(response: AgentPromptResponse) -> str:
@@ -131,7 +192,7 @@ def format_error_summary(response: AgentPromptResponse) -> str:
         error_msg += f": {response.errors[0]}"
     elif response.output:
         # Use first line of output as error
-        first_line = response.output.split("\n")[0][:100]
+        first_line = response.output.partition("\n")[0][:100]
         error_msg += f": {first_line}"
 
     return error_msg
@@ -146,16 +207,7 @@ def format_metrics_only(response: AgentPromptResponse) -> str:
     Returns:
         Single-line metrics summary
     """
-    metrics = []
-
-    if response.files_changed is not None:
-        metrics.append(f"{response.files_changed} files")
-
-    if response.lines_added is not None:
-        metrics.append(f"+{response.lines_added} lines")
-
-    if response.lines_removed is not None:
-        metrics.append(f"-{response.lines_removed} lines")
+    metrics = [inline.format(value) for _, inline, value in _present_metrics(response)]
 
     if metrics:
         return " | ".join(metrics)
@@ -175,60 +227,40 @@ def format_validation_report(
     Returns:
         Detailed validation report
     """
-    lines = []
-
-    lines.append("## Validation Report")
-    lines.append("")
+    lines = ["## Validation Report", ""]
 
     # Overall Status
-    lines.append("### Overall Status")
     status_emoji = "✅" if response.success else "❌"
-    lines.append(f"{status_emoji} **{response.validation_status or 'unknown'}**")
-    lines.append("")
+    _append_section(
+        lines,
+        "### Overall Status",
+        [f"{status_emoji} **{response.validation_status or 'unknown'}**"],
+    )
 
     # Code Metrics
-    lines.append("### Code Changes")
-    lines.append(f"| Metric | Value |")
-    lines.append("|--------|-------|")
-
-    files = response.files_changed or 0
-    lines.append(f"| Files Changed | {files} |")
-
-    added = response.lines_added or 0
-    lines.append(f"| Lines Added | {added} |")
-
-    removed = response.lines_removed or 0
-    lines.append(f"| Lines Removed | {removed} |")
-
-    lines.append("")
+    body = [_METRICS_TABLE_HEADER]
+    body += [
+        f"| {label} | {getattr(response, attr) or 0} |"
+        for attr, label, _ in _METRICS
+    ]
+    _append_section(lines, "### Code Changes", body)
 
     # Test Results
     if response.test_results:
-        lines.append("### Test Results")
-        lines.append(response.test_results)
-        lines.append("")
+        _append_section(lines, "### Test Results", [response.test_results])
 
     # Issues
-    all_issues = []
-    if response.errors:
-        all_issues.extend([(f"🔴 ERROR", e) for e in response.errors])
-    if response.warnings:
-        all_issues.extend([(f"⚠️ WARNING", w) for w in response.warnings])
-
-    if all_issues:
+    if response.errors or response.warnings:
         lines.append("### Issues Found")
-        for issue_type, issue_text in all_issues:
-            lines.append(f"- {issue_type}: {issue_text}")
+        lines += [f"- 🔴 ERROR: {e}" for e in response.errors or ()]
+        lines += [f"- ⚠️ WARNING: {w}" for w in response.warnings or ()]
         lines.append("")
 
     # Plan Execution if provided
     if plan_validation:
-        lines.append("### Plan Execution")
-        lines.append(
-            f"- Steps: {plan_validation.executed_steps}/{plan_validation.total_steps}"
-        )
+        body = [f"- Steps: {_plan_step_count(plan_validation)}"]
         if plan_validation.missing_steps:
-            lines.append(f"- Missing: {', '.join(plan_validation.missing_steps)}")
-        lines.append("")
+            body.append(f"- Missing: {', '.join(plan_validation.missing_steps)}")
+        _append_section(lines, _PLAN_EXECUTION_HEADER, body)
 
-    return "\n".join(lines).strip()
+    return _join_lines(lines)
@@ -41,6 +41,12 @@ MODEL_TOKEN_LIMITS = {
 # Default fallback limit if model not found (conservative estimate)
 DEFAULT_TOKEN_LIMIT = 100_000
 
+# Lowercased registry for the partial-match fallback, so misses don't
+# re-lowercase every known model ID
+_LOWERCASE_LIMITS = tuple(
+    (model.lower(), limit) for model, limit in MODEL_TOKEN_LIMITS.items()
+)
+
 
 def get_model_limit(model_id: str) -> int:
     """
@@ -68,11 +74,8 @@ def get_model_limit(model_id: str) -> int:
         model_id_stripped = model_id.strip()
         if model_id_stripped:
             model_id_lower = model_id_stripped.lower()
-            for known_model, known_limit in MODEL_TOKEN_LIMITS.items():
-                if (
-                    model_id_lower in known_model.lower()
-                    or known_model.lower() in model_id_lower
-                ):
+            for known_model, known_limit in _LOWERCASE_LIMITS:
+                if model_id_lower in known_model or known_model in model_id_lower:
                     return known_limit
 
         # No match found, return default
@@ -8,21 +8,64 @@ It handles session management, connection validation, authentication, prompt exe
 - Story 1.10: Configuration loading from ADWConfig
 """
 
-import uuid
+import atexit
+import copy
+import functools
+import gzip
+import hashlib
+import queue
+import socket
+import threading
 import requests
 import time
 import json
+import logging
+import math
+import random
 import re
 import os
-from datetime import datetime
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from pathlib import Path
-from typing import Optional, Dict, Any, Literal, List
-from urllib.parse import urlparse
-import sys
+from types import MappingProxyType
+from typing import (
+    Any,
+    Dict,
+    List,
+    Literal,
+    Mapping,
+    NoReturn,
+    Optional,
+    Tuple,
+)
+from collections import OrderedDict, deque
+from concurrent.futures import Future
+
+import urllib3
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+from urllib3.util import Retry
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import httpx
+    import h2  # noqa: F401 - required by httpx for http2=True
+
+    HTTPX_HTTP2_AVAILABLE = True
+except ImportError:
+    HTTPX_HTTP2_AVAILABLE = False
 
 # Import configuration singleton
 from .config import config, ADWConfig
 
+logger = logging.getLogger(__name__)
+
 # Task type definitions for intelligent model routing
 TaskType = Literal[
     # Lightweight tasks - Use Claude Haiku 4.5 (GitHub Copilot)
@@ -57,40 +100,418 @@ class OpenCodeConnectionError(OpenCodeHTTPClientError):
     pass
 
 
-# Task type definitions for intelligent model routing
-TaskType = Literal[
-    # Lightweight tasks - Use Claude Haiku 4.5 (GitHub Copilot)
-    "classify",  # Issue classification
-    "extract_adw",  # ADW info extraction
-    "plan",  # Implementation planning
-    "branch_gen",  # Branch name generation
-    "commit_msg",  # Commit message generation
-    "pr_creation",  # Pull request creation
-    # Heavy lifting tasks - Use Claude Sonnet 4 (GitHub Copilot)
-    "implement",  # Code implementation
-    "test_fix",  # Test failure resolution
-    "review",  # Code review
-]
+class _TransientServerError(Exception):
+    """Internal signal for a 5xx response, retried like a transport error."""
+
+    def __init__(self, response: Any):
+        super().__init__(f"Server error {response.status_code}")
+        self.response = response
+
+    @functools.cached_property
+    def text(self) -> str:
+        """Response body, read lazily and decoded once for message and log."""
+        return self.response.text
+
 
 # Model routing configuration
 MODEL_LIGHTWEIGHT = "github-copilot/claude-haiku-4.5"
 MODEL_HEAVY_LIFTING = "github-copilot/claude-sonnet-4.5"
 
-# Task type to model mapping
-TASK_TYPE_TO_MODEL = {
-    # Lightweight tasks
-    "classify": MODEL_LIGHTWEIGHT,
-    "extract_adw": MODEL_LIGHTWEIGHT,
-    "plan": MODEL_LIGHTWEIGHT,
-    "branch_gen": MODEL_LIGHTWEIGHT,
-    "commit_msg": MODEL_LIGHTWEIGHT,
-    "pr_creation": MODEL_LIGHTWEIGHT,
-    # Heavy lifting tasks
-    "implement": MODEL_HEAVY_LIFTING,
-    "test_fix": MODEL_HEAVY_LIFTING,
-    "review": MODEL_HEAVY_LIFTING,
+# Task type to model mapping (read-only)
+TASK_TYPE_TO_MODEL: Mapping[str, str] = MappingProxyType(
+    {
+        # Lightweight tasks
+        "classify": MODEL_LIGHTWEIGHT,
+        "extract_adw": MODEL_LIGHTWEIGHT,
+        "plan": MODEL_LIGHTWEIGHT,
+        "branch_gen": MODEL_LIGHTWEIGHT,
+        "commit_msg": MODEL_LIGHTWEIGHT,
+        "pr_creation": MODEL_LIGHTWEIGHT,
+        # Heavy lifting tasks
+        "implement": MODEL_HEAVY_LIFTING,
+        "test_fix": MODEL_HEAVY_LIFTING,
+        "review": MODEL_HEAVY_LIFTING,
+    }
+)
+
+# Routing decisions precomputed from the static table; only the configured model
+# IDs are read at call time, so config reloads still take effect
+_LIGHTWEIGHT_TASKS = frozenset(
+    task for task, model in TASK_TYPE_TO_MODEL.items() if model == MODEL_LIGHTWEIGHT
+)
+_HEAVY_LIFTING_TASKS = frozenset(
+    task for task, model in TASK_TYPE_TO_MODEL.items() if model == MODEL_HEAVY_LIFTING
+)
+_SUPPORTED_TASKS_MSG = "Supported task types: " + ", ".join(TASK_TYPE_TO_MODEL)
+
+# scheme://host[:port] prefix; stricter than urlparse (no whitespace in the host)
+_URL_RE = re.compile(r"^[A-Za-z][A-Za-z0-9+.\-]*://[^/\s?#]+", re.ASCII)
+
+
+@functools.lru_cache(maxsize=32)
+def _is_valid_server_url(url: str) -> bool:
+    """Check a server URL against _URL_RE; a process talks to few servers."""
+    return _URL_RE.match(url) is not None
+
+
+# Transport errors retried by send_prompt, for whichever HTTP library is in use
+_TIMEOUT_ERRORS: tuple = (
+    requests.exceptions.Timeout,
+    urllib3.exceptions.TimeoutError,
+)
+_CONNECTION_ERRORS: tuple = (
+    requests.exceptions.ConnectionError,
+    urllib3.exceptions.HTTPError,
+)
+if HTTPX_HTTP2_AVAILABLE:
+    _TIMEOUT_ERRORS += (httpx.TimeoutException,)
+    _CONNECTION_ERRORS += (httpx.TransportError,)
+_RETRYABLE_ERRORS = (_TransientServerError,) + _TIMEOUT_ERRORS + _CONNECTION_ERRORS
+
+# Non-retryable auth failures on the message endpoint
+_AUTH_ERROR_MESSAGES = {
+    401: "Authentication failed (401). Invalid API key or session expired.",
+    403: "Access forbidden (403). Insufficient permissions.",
 }
 
+# (retry operation, final operation) logged for each kind of transient failure
+_RETRY_OPERATIONS = {
+    "server": ("send_prompt_retry", "send_prompt_final_failure"),
+    "timeout": ("send_prompt_timeout_retry", "send_prompt_timeout_final"),
+    "connection": ("send_prompt_connection_retry", "send_prompt_connection_final"),
+}
+
+Transport = Literal["requests", "urllib3", "httpx-http2"]
+
+# Lightweight tasks whose answers depend only on the prompt, eligible for caching
+_CACHEABLE_TASKS = frozenset({"classify", "extract_adw", "branch_gen", "commit_msg"})
+
+# Process-wide LRU of cached responses, shared by clients with the cache enabled
+_DECISION_CACHE: "OrderedDict[bytes, Dict[str, Any]]" = OrderedDict()
+_DECISION_CACHE_LOCK = threading.Lock()
+# Cache keys of cacheable prompts currently being sent -> Future of the response,
+# so identical concurrent prompts wait for one request instead of each sending
+# their own; guarded by _DECISION_CACHE_LOCK
+_INFLIGHT: Dict[bytes, Future] = {}
+
+
+def _route_task(task_type: str) -> Tuple[str, bool]:
+    """
+    Resolve the configured model ID and timeout tier for a task type.
+
+    Args:
+        task_type: The task type string to route
+
+    Returns:
+        Tuple[str, bool]: Configured model ID and whether the task is lightweight
+
+    Raises:
+        ValueError: If the task type is not supported
+    """
+    # Use configuration to get actual model IDs
+    if task_type in _HEAVY_LIFTING_TASKS:
+        return config.opencode_model_heavy_lifting, False
+    if task_type in _LIGHTWEIGHT_TASKS:
+        return config.opencode_model_lightweight, True
+
+    raise ValueError(f"Unsupported task_type: {task_type}. {_SUPPORTED_TASKS_MSG}")
+
+
+def _model_for_task(task_type: str) -> str:
+    """
+    Resolve the configured model ID for a task type.
+
+    Args:
+        task_type: The task type string to route
+
+    Returns:
+        str: Configured heavy lifting or lightweight model ID
+
+    Raises:
+        ValueError: If the task type is not supported
+    """
+    return _route_task(task_type)[0]
+
+
+def _transient_kind(error: BaseException) -> str:
+    """Classify a retryable error as "server", "timeout" or "connection"."""
+    if isinstance(error, _TransientServerError):
+        return "server"
+    # httpx timeouts are also transport errors, so test timeouts first
+    if isinstance(error, _TIMEOUT_ERRORS):
+        return "timeout"
+    return "connection"
+
+
+def _describe_transient(error: BaseException) -> str:
+    """Short description of a retryable error for retry warnings."""
+    kind = _transient_kind(error)
+    if kind == "server":
+        return str(error)
+    if kind == "timeout":
+        return "Request timeout"
+    return f"Connection error: {error}"
+
+
+def _retry_after_seconds(response: Any) -> Optional[float]:
+    """
+    Parse a Retry-After header given as delta-seconds or an HTTP-date.
+
+    Args:
+        response: HTTP response carrying the header
+
+    Returns:
+        Optional[float]: Seconds to wait (never negative), or None if the header
+        is missing or malformed
+    """
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+# Model tiers recorded in per-call telemetry, indexed by record[0]
+_TELEMETRY_TIERS = ("lightweight", "heavy_lifting")
+
+
+def _percentile(sorted_values: List[int], fraction: float) -> int:
+    """Nearest-rank percentile of an ascending, non-empty list."""
+    rank = math.ceil(fraction * len(sorted_values))
+    return sorted_values[max(0, rank - 1)]
+
+
+class _BackgroundLogWriter:
+    """Daemon thread that writes response/error logs off the request path.
+
+    Log calls are queued and run in order on one worker thread. When the
+    queue is full the call runs inline instead of being dropped. Pending
+    logs are flushed at interpreter exit.
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        self._queue: "queue.Queue[tuple]" = queue.Queue(maxsize=maxsize)
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def submit(self, func: Any, **kwargs: Any) -> None:
+        """Queue func(**kwargs) for the worker thread."""
+        if self._thread is None:
+            with self._lock:
+                if self._thread is None:
+                    self._thread = threading.Thread(
+                        target=self._run, name="opencode-log-writer", daemon=True
+                    )
+                    self._thread.start()
+                    atexit.register(self.flush)
+        try:
+            self._queue.put_nowait((func, kwargs))
+        except queue.Full:
+            _run_log_call(func, kwargs)
+
+    def flush(self) -> None:
+        """Block until every queued log has been written."""
+        if self._thread is not None:
+            self._queue.join()
+
+    def _run(self) -> None:
+        while True:
+            func, kwargs = self._queue.get()
+            try:
+                _run_log_call(func, kwargs)
+            finally:
+                self._queue.task_done()
+
+
+def _run_log_call(func: Any, kwargs: Dict[str, Any]) -> None:
+    """Run a logging call, reporting rather than raising its failure."""
+    try:
+        func(**kwargs)
+    except Exception as log_error:
+        logger.warning("Failed to write OpenCode log: %s", log_error)
+
+
+_LOG_WRITER = _BackgroundLogWriter()
+
+
+# urllib3's defaults (TCP_NODELAY, so small prompt POSTs are not held back by
+# Nagle) plus TCP keepalive probes. Pooled connections sit idle between ADW
+# steps, and a NAT or proxy that silently drops them would otherwise only be
+# noticed when the next prompt hangs until its read timeout
+_SOCKET_OPTIONS: List[Tuple[int, int, int]] = [
+    *HTTPConnection.default_socket_options,
+    (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+]
+if hasattr(socket, "TCP_KEEPIDLE"):  # Linux; macOS/Windows keep OS defaults
+    _SOCKET_OPTIONS += [
+        (socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, 60),
+        (socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, 10),
+        (socket.IPPROTO_TCP, socket.TCP_KEEPCNT, 3),
+    ]
+
+
+class _SharedHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter whose connection pool is shared by every client session.
+
+    requests.Session.close() closes the adapters mounted on it; this adapter
+    ignores that so warm keep-alive connections outlive short-lived clients.
+    Call shutdown() to actually release the pooled connections. Its sockets
+    are opened with _SOCKET_OPTIONS.
+    """
+
+    def init_poolmanager(self, *args: Any, **pool_kwargs: Any) -> None:
+        pool_kwargs.setdefault("socket_options", _SOCKET_OPTIONS)
+        super().init_poolmanager(*args, **pool_kwargs)
+
+    def close(self) -> None:
+        pass
+
+    def shutdown(self) -> None:
+        super().close()
+
+
+# urllib3 retries nothing. Timeouts, 5xx and 429 Retry-After waits are all
+# handled by _send_prompt_with_retry, which caps the waits at
+# RATE_LIMIT_MAX_WAIT. read=False re-raises read timeouts as-is; otherwise
+# urllib3 wraps them in MaxRetryError and requests reports a ConnectionError
+_NO_RETRY = Retry(total=0, read=False, redirect=False, raise_on_status=False)
+_SHARED_ADAPTER: Optional[_SharedHTTPAdapter] = None
+_SHARED_ADAPTER_LOCK = threading.Lock()
+
+
+def _shared_adapter() -> _SharedHTTPAdapter:
+    """
+    Get the process-wide pooled adapter, creating it on first use.
+
+    Built lazily so the pool sizes come from the project's config once it
+    has been loaded, not from whatever was on disk at import time.
+
+    Returns:
+        _SharedHTTPAdapter: Adapter mounted by every requests-based client
+    """
+    global _SHARED_ADAPTER
+    if _SHARED_ADAPTER is None:
+        with _SHARED_ADAPTER_LOCK:
+            if _SHARED_ADAPTER is None:
+                adapter = _SharedHTTPAdapter(
+                    pool_connections=config.opencode_pool_connections,
+                    pool_maxsize=config.opencode_pool_maxsize,
+                    max_retries=_NO_RETRY,
+                )
+                atexit.register(adapter.shutdown)
+                _SHARED_ADAPTER = adapter
+    return _SHARED_ADAPTER
+
+
+_SHARED_POOL: Optional[urllib3.PoolManager] = None
+
+
+def _shared_pool() -> urllib3.PoolManager:
+    """
+    Get the process-wide urllib3 pool used by the urllib3 transport.
+
+    Sized from the same config keys as the requests adapter pool.
+
+    Returns:
+        urllib3.PoolManager: Pool shared by every urllib3-based client
+    """
+    global _SHARED_POOL
+    if _SHARED_POOL is None:
+        with _SHARED_ADAPTER_LOCK:
+            if _SHARED_POOL is None:
+                pool = urllib3.PoolManager(
+                    num_pools=config.opencode_pool_connections,
+                    maxsize=config.opencode_pool_maxsize,
+                    retries=_NO_RETRY,
+                    socket_options=_SOCKET_OPTIONS,
+                )
+                atexit.register(pool.clear)
+                _SHARED_POOL = pool
+    return _SHARED_POOL
+
+
+class _Urllib3Response:
+    """The parts of requests.Response the client reads, over a urllib3 response."""
+
+    def __init__(self, raw: Any) -> None:
+        self.status_code = raw.status
+        self.headers = raw.headers
+        self.content = raw.data
+
+    @property
+    def text(self) -> str:
+        return self.content.decode("utf-8", errors="replace")
+
+    def json(self) -> Any:
+        return decode_json(self)
+
+    def close(self) -> None:
+        pass
+
+
+# Compression codecs urllib3 can decode here (gzip and deflate, plus br and
+# zstd when their packages are installed), as requests and httpx advertise
+_ACCEPT_ENCODING = urllib3.util.make_headers(accept_encoding=True)
+
+
+class _Urllib3Session:
+    """
+    requests.Session look-alike that sends straight through urllib3.
+
+    Skips requests' per-call PreparedRequest, hooks, cookie merging and
+    environment lookups, which this client never uses. Bodies are read in
+    full and the connection returned to the shared pool before post()
+    returns, so close() on the session or a response has nothing to do.
+    Like requests, it asks for compressed responses; urllib3 decompresses
+    them before the body is parsed.
+    """
+
+    def __init__(self, pool: urllib3.PoolManager) -> None:
+        self._pool = pool
+
+    def get(self, url: str, headers: Any = None, timeout: Any = None) -> Any:
+        return self._request("GET", url, headers, None, timeout)
+
+    def post(
+        self,
+        url: str,
+        headers: Any = None,
+        data: Optional[bytes] = None,
+        timeout: Any = None,
+        **kwargs: Any,
+    ) -> Any:
+        if "json" in kwargs:
+            data = _encode_json(kwargs["json"])
+        return self._request("POST", url, headers, data, timeout)
+
+    def _request(
+        self, method: str, url: str, headers: Any, body: Any, timeout: Any
+    ) -> _Urllib3Response:
+        headers = {**_ACCEPT_ENCODING, **headers} if headers else _ACCEPT_ENCODING
+        try:
+            raw = self._pool.request(
+                method,
+                url,
+                body=body,
+                headers=headers,
+                timeout=urllib3.Timeout(connect=timeout, read=timeout),
+            )
+        except urllib3.exceptions.MaxRetryError as e:
+            # Raise the underlying timeout/connection error like requests does
+            raise (e.reason or e) from e
+        return _Urllib3Response(raw)
+
+    def close(self) -> None:
+        pass
+
 
 class OpenCodeHTTPClient:
     """
@@ -101,7 +522,7 @@ class OpenCodeHTTPClient:
 
     Attributes:
         server_url (str): Base URL of OpenCode HTTP server
-        session_id (Optional[str]): Unique session identifier (UUID format)
+        session_id (Optional[str]): OpenCode session ID assigned by the server
         api_key (Optional[str]): API key for authentication
         timeout (float): Request timeout in seconds
     """
@@ -109,6 +530,32 @@ class OpenCodeHTTPClient:
     DEFAULT_TIMEOUT = 30.0
     DEFAULT_LIGHTWEIGHT_TIMEOUT = 15.0
     MAX_RETRIES = 3
+    RETRY_BASE_DELAY = 1.0
+    RETRY_MAX_DELAY = 30.0
+    RETRY_JITTER = 0.5
+    RATE_LIMIT_MAX_WAIT = 30.0
+    RATE_LIMIT_MAX_RETRIES = 5
+    DECISION_CACHE_SIZE = 256
+    TELEMETRY_SIZE = 2048
+    # With compress_requests, message bodies at least this large are gzipped
+    COMPRESS_MIN_BYTES = 1024
+
+    # (tier index, status code, duration ns, attempt - 1) of recent message
+    # calls across all clients; deque.append is atomic, so no lock is needed
+    _telemetry: "deque[tuple]" = deque(maxlen=TELEMETRY_SIZE)
+
+    # Circuit breaker (opt-in): after CIRCUIT_FAILURE_THRESHOLD consecutive
+    # timeouts or connection failures, the client's prompts fail fast for
+    # CIRCUIT_COOLDOWN seconds instead of sitting through the retry ladder
+    CIRCUIT_FAILURE_THRESHOLD = 5
+    CIRCUIT_COOLDOWN = 30.0
+
+    # A successful health check is trusted for health_cache_ttl seconds
+    # (default HEALTH_CACHE_TTL), so clients constructed back to back skip the
+    # /global/health round trip.
+    # (health URL, auth headers) -> monotonic time the result expires
+    HEALTH_CACHE_TTL = 10.0
+    _verified: Dict[Tuple[str, Tuple], float] = {}
 
     def __init__(
         self,
@@ -116,6 +563,12 @@ class OpenCodeHTTPClient:
         api_key: Optional[str] = None,
         timeout: Optional[float] = None,
         lightweight_timeout: Optional[float] = None,
+        enable_decision_cache: bool = False,
+        transport: Transport = "requests",
+        async_logging: bool = False,
+        compress_requests: bool = False,
+        circuit_breaker: bool = False,
+        health_cache_ttl: Optional[float] = None,
     ):
         """
         Initialize OpenCodeHTTPClient with server connection details.
@@ -125,9 +578,33 @@ class OpenCodeHTTPClient:
             api_key: Optional API key for authentication
             timeout: Request timeout in seconds (default: 30.0)
             lightweight_timeout: Timeout for lightweight operations (default: 15.0)
+            enable_decision_cache: Reuse responses for repeated classify,
+                extract_adw, branch_gen and commit_msg prompts (default: False).
+                The cache is shared by all clients that enable it, so it also
+                hits when each call builds a new client.
+            transport: "requests" (default), "urllib3" to send through a
+                pooled urllib3.PoolManager without requests' per-call
+                overhead, or "httpx-http2" to multiplex concurrent prompts
+                over one HTTP/2 connection. HTTP/2 is negotiated over TLS,
+                so it only applies to https:// servers.
+            async_logging: Write response/error logs on a background thread
+                instead of before send_prompt returns (default: False). Call
+                flush_logs() before reading the log files.
+            compress_requests: Send message bodies of COMPRESS_MIN_BYTES or
+                more gzip-compressed with Content-Encoding: gzip (default:
+                False). Prompts carrying file contents and diffs shrink
+                several times over; only enable it for servers (or proxies
+                in front of them) that accept compressed request bodies.
+            circuit_breaker: Fail prompts immediately for CIRCUIT_COOLDOWN
+                seconds once CIRCUIT_FAILURE_THRESHOLD consecutive attempts
+                on this client timed out or could not connect (default: False).
+            health_cache_ttl: Seconds a successful health check for this
+                server and API key is reused by other clients (default:
+                HEALTH_CACHE_TTL). 0 checks the server every time.
 
         Raises:
-            ValueError: If server_url is empty or invalid
+            ValueError: If server_url is empty or invalid, or transport is
+                unknown or its dependencies are not installed
             TypeError: If server_url is None
         """
         # Validate server_url
@@ -144,8 +621,25 @@ class OpenCodeHTTPClient:
         if not self._is_valid_url(server_url):
             raise ValueError(f"Invalid URL format: {server_url}")
 
+        if transport not in ("requests", "urllib3", "httpx-http2"):
+            raise ValueError(f"Unsupported transport: {transport}")
+        if transport == "httpx-http2" and not HTTPX_HTTP2_AVAILABLE:
+            raise ValueError(
+                "transport='httpx-http2' requires httpx with HTTP/2 support "
+                "(pip install 'httpx[http2]')"
+            )
+
         self.server_url = server_url
         self.api_key = api_key
+        self.transport = transport
+        self.async_logging = async_logging
+        self.compress_requests = compress_requests
+        self.circuit_breaker = circuit_breaker
+        self.health_cache_ttl = (
+            health_cache_ttl
+            if health_cache_ttl is not None
+            else self.HEALTH_CACHE_TTL
+        )
         self.timeout = timeout if timeout is not None else self.DEFAULT_TIMEOUT
         self.lightweight_timeout = (
             lightweight_timeout
@@ -153,13 +647,37 @@ class OpenCodeHTTPClient:
             else self.DEFAULT_LIGHTWEIGHT_TIMEOUT
         )
 
-        # Create unique session ID (will be replaced when session is created)
+        # Headers and endpoints are fixed for the client's lifetime
+        base_url = server_url.rstrip("/")
+        self._auth_headers: Dict[str, str] = (
+            {"Authorization": f"Bearer {api_key}"} if api_key else {}
+        )
+        self._base_headers: Dict[str, str] = {
+            "Content-Type": "application/json",
+            **self._auth_headers,
+        }
+        self._health_url = f"{base_url}/global/health"
+        self._session_url = f"{base_url}/session"
+        # (session_id, message URL) for the last session a prompt was sent to
+        self._message_url: tuple = (None, "")
+
+        # Assigned by the server when the first prompt creates an OpenCode session
         self.session_id: Optional[str] = None
 
         # Store session-related attributes
-        self._session: Optional[requests.Session] = None
+        self._session: Optional[Any] = None
         self._is_authenticated = False
 
+        # Consecutive transport failures, and monotonic time the circuit closes
+        self._circuit_failures = 0
+        self._circuit_open_until = 0.0
+
+        # LRU of responses to deterministic lightweight prompts (opt-in)
+        self._decision_cache: Optional["OrderedDict[bytes, Dict[str, Any]]"] = (
+            _DECISION_CACHE if enable_decision_cache else None
+        )
+        self._cache_lock = _DECISION_CACHE_LOCK
+
     @classmethod
     def from_config(cls, api_key: Optional[str] = None) -> "OpenCodeHTTPClient":
         """
@@ -184,6 +702,12 @@ class OpenCodeHTTPClient:
             api_key=api_key,
             timeout=config.opencode_timeout,
             lightweight_timeout=config.opencode_lightweight_timeout,
+            enable_decision_cache=config.opencode_decision_cache,
+            async_logging=config.opencode_async_logging,
+            compress_requests=config.opencode_compress_requests,
+            transport=config.opencode_transport,
+            circuit_breaker=config.opencode_circuit_breaker,
+            health_cache_ttl=config.opencode_health_cache_ttl,
         )
 
     @staticmethod
@@ -195,13 +719,9 @@ class OpenCodeHTTPClient:
             url: URL string to validate
 
         Returns:
-            bool: True if URL is valid (has scheme and netloc)
+            bool: True if URL is valid (has scheme and host)
         """
-        try:
-            result = urlparse(url)
-            return bool(result.scheme and result.netloc)
-        except Exception:
-            return False
+        return _is_valid_server_url(url)
 
     def _verify_connection(self) -> None:
         """
@@ -209,26 +729,27 @@ class OpenCodeHTTPClient:
 
         Makes a simple health check request to verify the server is accessible
         and authentication (if required) is valid.
+        A success is remembered for health_cache_ttl seconds per server and
+        API key, and repeat checks within that window return without a request.
 
         Raises:
             OpenCodeAuthenticationError: If authentication fails (401, 403, etc.)
             OpenCodeConnectionError: If connection fails
         """
-        try:
-            # Create session if not exists
-            if self._session is None:
-                self._session = requests.Session()
+        verified_key = (self._health_url, tuple(self._auth_headers.items()))
+        if (
+            self.health_cache_ttl > 0
+            and self._verified.get(verified_key, 0.0) > time.monotonic()
+        ):
+            self._is_authenticated = True
+            return
 
-            # Add API key to headers if provided
-            headers = {}
-            if self.api_key:
-                headers["Authorization"] = f"Bearer {self.api_key}"
+        try:
+            session = self._get_session()
 
             # Health check endpoint (OpenCode v1.1+)
-            health_url = f"{self.server_url.rstrip('/')}/global/health"
-
-            response = self._session.get(
-                health_url, headers=headers, timeout=self.timeout
+            response = session.get(
+                self._health_url, headers=self._auth_headers, timeout=self.timeout
             )
 
             # Handle authentication errors
@@ -248,14 +769,20 @@ class OpenCodeHTTPClient:
                 )
 
             self._is_authenticated = True
+            if self.health_cache_ttl > 0:
+                self._verified[verified_key] = (
+                    time.monotonic() + self.health_cache_ttl
+                )
 
-        except requests.exceptions.ConnectionError as e:
+        # Timeouts first: httpx and urllib3 timeouts subclass their libraries'
+        # connection error bases listed in _CONNECTION_ERRORS
+        except _TIMEOUT_ERRORS as e:
             raise OpenCodeConnectionError(
-                f"Failed to connect to OpenCode server at {self.server_url}: {e}"
+                f"Connection timeout to OpenCode server at {self.server_url}: {e}"
             )
-        except requests.exceptions.Timeout as e:
+        except _CONNECTION_ERRORS as e:
             raise OpenCodeConnectionError(
-                f"Connection timeout to OpenCode server at {self.server_url}: {e}"
+                f"Failed to connect to OpenCode server at {self.server_url}: {e}"
             )
         except OpenCodeAuthenticationError:
             raise
@@ -264,18 +791,134 @@ class OpenCodeHTTPClient:
                 f"Unexpected error connecting to OpenCode server: {e}"
             )
 
+    def _get_session(self) -> Any:
+        """
+        Return this client's HTTP session, creating it on first use.
+
+        With the default transport, every requests.Session mounts the
+        module-wide pooled adapter, so consecutive clients talking to the same
+        OpenCode host reuse keep-alive connections instead of paying a new
+        TCP/TLS handshake per ADW step. The urllib3 transport wraps a shared
+        urllib3.PoolManager and the httpx-http2 transport uses an
+        httpx.Client; both have the same get/post/close surface.
+
+        Returns:
+            requests.Session, _Urllib3Session or httpx.Client for this client
+        """
+        if self._session is None:
+            if self.transport == "httpx-http2":
+                # Over TLS, ALPN picks HTTP/2 and prompts share a connection
+                # as streams. Plain http:// (a local OpenCode server) stays on
+                # HTTP/1.1, so allow as many connections as the requests pool
+                # or concurrent prompts would queue for one
+                pool_size = config.opencode_pool_maxsize
+                self._session = httpx.Client(
+                    http2=True,
+                    limits=httpx.Limits(
+                        max_connections=pool_size,
+                        max_keepalive_connections=pool_size,
+                    ),
+                )
+            elif self.transport == "urllib3":
+                self._session = _Urllib3Session(_shared_pool())
+            else:
+                adapter = _shared_adapter()
+                self._session = requests.Session()
+                self._session.mount("http://", adapter)
+                self._session.mount("https://", adapter)
+        return self._session
+
+    @classmethod
+    def dump_telemetry(cls) -> Dict[str, Dict[str, Any]]:
+        """
+        Summarize recent message call timings per model tier.
+
+        Covers the last TELEMETRY_SIZE calls that got an HTTP response, from
+        every client in the process.
+
+        Returns:
+            Dict keyed by "lightweight"/"heavy_lifting" with call count, error
+            count (status >= 400), retried call count and p50/p95 latency in ms.
+            Tiers without recorded calls are omitted.
+        """
+        records = list(cls._telemetry)
+        summary: Dict[str, Dict[str, Any]] = {}
+        for index, tier in enumerate(_TELEMETRY_TIERS):
+            rows = [record for record in records if record[0] == index]
+            if not rows:
+                continue
+            durations = sorted(record[2] for record in rows)
+            summary[tier] = {
+                "calls": len(rows),
+                "errors": sum(1 for record in rows if record[1] >= 400),
+                "retried": sum(1 for record in rows if record[3]),
+                "p50_ms": _percentile(durations, 0.50) / 1e6,
+                "p95_ms": _percentile(durations, 0.95) / 1e6,
+            }
+        return summary
+
+    @classmethod
+    def reset_health_cache(cls) -> None:
+        """Forget recent health checks so the next one hits the server."""
+        cls._verified.clear()
+        _HEALTH_RESULTS.clear()
+
+    def _check_circuit(self) -> None:
+        """
+        Fail fast while this client's server is marked unreachable.
+
+        Raises:
+            OpenCodeConnectionError: If the circuit is open
+        """
+        if not self._circuit_open_until:
+            return
+        remaining = self._circuit_open_until - time.monotonic()
+        if remaining > 0:
+            raise OpenCodeConnectionError(
+                f"OpenCode server {self.server_url} is unreachable after "
+                f"{self._circuit_failures} consecutive failures; not retrying "
+                f"for another {remaining:.0f}s"
+            )
+
+    def _record_transport_failure(self) -> None:
+        """Count a timeout/connection failure, opening the circuit at the limit."""
+        if not self.circuit_breaker:
+            return
+        self._circuit_failures += 1
+        if self._circuit_failures >= self.CIRCUIT_FAILURE_THRESHOLD:
+            self._circuit_open_until = time.monotonic() + self.CIRCUIT_COOLDOWN
+
+    def _record_server_reachable(self) -> None:
+        """Close the circuit once the server answers again."""
+        self._circuit_failures = 0
+        self._circuit_open_until = 0.0
+
+    @classmethod
+    def reset_telemetry(cls) -> None:
+        """Discard all recorded call timings."""
+        cls._telemetry.clear()
+
+    @classmethod
+    def shutdown_pool(cls) -> None:
+        """Close the connections pooled across all clients (runs at exit)."""
+        if _SHARED_ADAPTER is not None:
+            _SHARED_ADAPTER.shutdown()
+        if _SHARED_POOL is not None:
+            _SHARED_POOL.clear()
+
     def close_session(self) -> None:
         """
         Close and cleanup the session.
 
         Closes the underlying requests.Session and clears the session_id.
+        Pooled keep-alive connections stay open for other clients.
         Safe to call multiple times.
         """
         if self._session is not None:
             try:
                 self._session.close()
             except Exception as e:
-                print(f"Warning: Error closing session: {e}", file=sys.stderr)
+                logger.warning("Error closing session: %s", e)
 
         self._session = None
         self.session_id = None
@@ -303,28 +946,18 @@ class OpenCodeHTTPClient:
         """
         Get appropriate model ID for a given task type from configuration.
         """
-        if task_type not in TASK_TYPE_TO_MODEL:
-            supported_tasks = ", ".join(TASK_TYPE_TO_MODEL.keys())
-            raise ValueError(
-                f"Unsupported task_type: {task_type}. "
-                f"Supported task types: {supported_tasks}"
-            )
-
-        # Use configuration to get actual model IDs
-        if TASK_TYPE_TO_MODEL[task_type] == MODEL_HEAVY_LIFTING:
-            return config.opencode_model_heavy_lifting
-        else:
-            return config.opencode_model_lightweight
+        return _model_for_task(task_type)
 
     @staticmethod
-    def get_all_task_types() -> Dict[str, str]:
+    def get_all_task_types() -> Mapping[str, str]:
         """
         Get mapping of all supported task types to their models.
 
         Returns:
-            Dict mapping task_type -> model_id for all supported tasks
+            Read-only mapping of task_type -> model_id for all supported tasks
+            (copy it with dict() if you need to modify it)
         """
-        return TASK_TYPE_TO_MODEL.copy()
+        return TASK_TYPE_TO_MODEL
 
     @staticmethod
     def is_lightweight_task(task_type: str) -> bool:
@@ -337,7 +970,7 @@ class OpenCodeHTTPClient:
         Returns:
             bool: True if task uses lightweight model (Claude Haiku 4.5)
         """
-        return TASK_TYPE_TO_MODEL.get(task_type) == MODEL_LIGHTWEIGHT
+        return task_type in _LIGHTWEIGHT_TASKS
 
     @staticmethod
     def is_heavy_lifting_task(task_type: str) -> bool:
@@ -350,7 +983,26 @@ class OpenCodeHTTPClient:
         Returns:
             bool: True if task uses heavy lifting model (Claude Sonnet 4)
         """
-        return TASK_TYPE_TO_MODEL.get(task_type) == MODEL_HEAVY_LIFTING
+        return task_type in _HEAVY_LIFTING_TASKS
+
+    @staticmethod
+    def is_lightweight_model(model_id: str) -> bool:
+        """
+        Check if a model ID is the lightweight model.
+
+        Matches the built-in lightweight model and the one configured under
+        opencode.models.lightweight, so renamed models keep the short timeout.
+
+        Args:
+            model_id: Full model ID (e.g., "github-copilot/claude-haiku-4.5")
+
+        Returns:
+            bool: True if the model is used for lightweight tasks
+        """
+        return (
+            model_id == MODEL_LIGHTWEIGHT
+            or model_id == config.opencode_model_lightweight
+        )
 
     def send_prompt(
         self,
@@ -403,11 +1055,44 @@ class OpenCodeHTTPClient:
             OpenCodeConnectionError: If connection cannot be established
             OpenCodeAuthenticationError: If authentication fails
         """
+        final_model_id, request_timeout, cache_key = self._prepare_prompt(
+            prompt, model_id, task_type, timeout
+        )
+        if cache_key is not None:
+            return self._send_cacheable(
+                cache_key, prompt, final_model_id, request_timeout, adw_id, agent_name
+            )
+        return self._send_prompt_with_retry(
+            prompt=prompt,
+            model_id=final_model_id,
+            timeout=request_timeout,
+            adw_id=adw_id,
+            agent_name=agent_name,
+        )
+
+    def _prepare_prompt(
+        self,
+        prompt: str,
+        model_id: Optional[str],
+        task_type: Optional[str],
+        timeout: Optional[float],
+    ) -> Tuple[str, float, Optional[bytes]]:
+        """
+        Validate send_prompt() arguments and resolve model, timeout and cache key.
+
+        Returns:
+            Tuple of (model ID, request timeout, decision cache key or None
+            when the prompt is not cacheable)
+
+        Raises:
+            ValueError: If the prompt is empty or no model can be resolved
+        """
         if not prompt or not isinstance(prompt, str):
             raise ValueError("prompt must be a non-empty string")
 
         # Determine model ID - explicit model_id takes precedence over task_type
         final_model_id = model_id
+        lightweight: Optional[bool] = None
         if final_model_id is None:
             if task_type is None:
                 # If neither model_id nor task_type is provided, and we are using configured defaults
@@ -416,7 +1101,8 @@ class OpenCodeHTTPClient:
                     "Model configuration error: Neither model_id nor task_type provided. "
                     "Please ensure 'opencode.models' are configured in ADWS/config.yaml"
                 )
-            final_model_id = self.get_model_for_task(task_type)
+            # Task routing also fixes the timeout tier
+            final_model_id, lightweight = _route_task(task_type)
 
         if not final_model_id or not isinstance(final_model_id, str):
             raise ValueError("Resolved model_id must be a non-empty string")
@@ -424,34 +1110,344 @@ class OpenCodeHTTPClient:
         # Use provided timeout or select based on model type (lightweight vs heavy)
         request_timeout = timeout
         if request_timeout is None:
-            request_timeout = (
-                self.lightweight_timeout
-                if "haiku" in final_model_id.lower()
-                else self.timeout
-            )
-
-        return self._send_prompt_with_retry(
+            if lightweight is None:
+                lightweight = self.is_lightweight_model(final_model_id)
+            request_timeout = self.lightweight_timeout if lightweight else self.timeout
+
+        cache_key = None
+        if self._decision_cache is not None and task_type in _CACHEABLE_TASKS:
+            cache_key = hashlib.blake2b(
+                f"{self.server_url}|{task_type}|{final_model_id}|{prompt}".encode(),
+                digest_size=16,
+            ).digest()
+        return final_model_id, request_timeout, cache_key
+
+    def _send_cacheable(
+        self,
+        key: bytes,
+        prompt: str,
+        model_id: str,
+        timeout: float,
+        adw_id: Optional[str],
+        agent_name: Optional[str],
+    ) -> Dict[str, Any]:
+        """Answer a cacheable prompt from the decision cache or send it once."""
+        cached = self._get_cached_response(key)
+        if cached is not None:
+            return cached
+        return self._send_single_flight(
+            key,
             prompt=prompt,
-            model_id=final_model_id,
-            timeout=request_timeout,
+            model_id=model_id,
+            timeout=timeout,
             adw_id=adw_id,
             agent_name=agent_name,
         )
 
+    def _send_single_flight(self, key: bytes, **kwargs: Any) -> Dict[str, Any]:
+        """
+        Send a cacheable prompt, sharing one request among identical callers.
+
+        The first caller for a key sends the prompt and caches the response;
+        callers arriving while it is in flight wait for that result (or
+        exception) instead of sending a duplicate. Only the sending caller
+        writes a response log.
+
+        Args:
+            key: Decision cache key of the prompt
+            **kwargs: Arguments for _send_prompt_with_retry
+
+        Returns:
+            A response dict owned by the caller
+        """
+        with self._cache_lock:
+            future = _INFLIGHT.get(key)
+            owner = future is None
+            if owner:
+                future = _INFLIGHT[key] = Future()
+        if not owner:
+            return copy.deepcopy(future.result())
+
+        try:
+            response = self._send_prompt_with_retry(**kwargs)
+            self._cache_response(key, response)
+            future.set_result(copy.deepcopy(response))
+            return response
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._cache_lock:
+                _INFLIGHT.pop(key, None)
+
+    def _get_cached_response(self, key: bytes) -> Optional[Dict[str, Any]]:
+        """Return a copy of a cached response and mark it recently used."""
+        with self._cache_lock:
+            cached = self._decision_cache.get(key)
+            if cached is None:
+                return None
+            self._decision_cache.move_to_end(key)
+        return copy.deepcopy(cached)
+
+    def _cache_response(self, key: bytes, response: Dict[str, Any]) -> None:
+        """Store a copy of a response, evicting the least recently used entry."""
+        snapshot = copy.deepcopy(response)
+        with self._cache_lock:
+            self._decision_cache[key] = snapshot
+            while len(self._decision_cache) > self.DECISION_CACHE_SIZE:
+                self._decision_cache.popitem(last=False)
+
+    @classmethod
+    def clear_decision_cache(cls) -> None:
+        """Drop every cached lightweight prompt response."""
+        with _DECISION_CACHE_LOCK:
+            _DECISION_CACHE.clear()
+
+    def _raise_client_error(
+        self,
+        response: Any,
+        attempt: int,
+        model_id: str,
+        prompt_preview: str,
+        adw_id: Optional[str],
+        agent_name: Optional[str],
+    ) -> NoReturn:
+        """
+        Raise (and optionally log) the error for a non-retryable 4xx response.
+
+        Raises:
+            OpenCodeAuthenticationError: For 401 and 403
+            OpenCodeHTTPClientError: For any other 4xx status
+        """
+        status = response.status_code
+        if status in _AUTH_ERROR_MESSAGES:
+            error: Exception = OpenCodeAuthenticationError(_AUTH_ERROR_MESSAGES[status])
+        else:
+            response_text = response.text
+            error = OpenCodeHTTPClientError(f"Client error {status}: {response_text}")
+        if adw_id and agent_name:
+            context: Dict[str, Any] = {"status_code": status, "attempt": attempt}
+            if status in _AUTH_ERROR_MESSAGES:
+                context["session_id"] = self.session_id
+            else:
+                context["response_text"] = response_text[:500]
+            self._log_failure(
+                adw_id,
+                agent_name,
+                error,
+                "send_prompt",
+                model_id,
+                prompt_preview,
+                context,
+            )
+        raise error
+
+    def _raise_invalid_json(
+        self,
+        error: json.JSONDecodeError,
+        body: bytes,
+        attempt: int,
+        model_id: str,
+        prompt_preview: str,
+        adw_id: Optional[str],
+        agent_name: Optional[str],
+    ) -> NoReturn:
+        """
+        Raise (and optionally log) the error for a message body that is not JSON.
+
+        The body is passed in as read by _read_body(); a streamed response
+        has no content left to give .text afterwards.
+
+        Raises:
+            OpenCodeHTTPClientError: Always
+        """
+        response_text = body.decode("utf-8", errors="replace")
+        json_error = OpenCodeHTTPClientError(
+            f"Invalid JSON in OpenCode response: {error}. Response: {response_text}"
+        )
+        self._log_failure(
+            adw_id,
+            agent_name,
+            json_error,
+            "send_prompt_json_decode",
+            model_id,
+            prompt_preview,
+            {
+                "attempt": attempt,
+                "response_text": response_text[:1000],
+                "json_error": str(error),
+            },
+        )
+        raise json_error
+
+    def _transient_error(self, error: BaseException, final: bool) -> BaseException:
+        """
+        Build the error to log (or, once retries are exhausted, raise).
+
+        Args:
+            error: Timeout, connection error or _TransientServerError
+            final: Whether retries are exhausted
+
+        Returns:
+            The exception describing the failed attempt
+        """
+        kind = _transient_kind(error)
+        if kind == "server":
+            response = error.response
+            message = f"Server error {response.status_code}: {error.text}"
+            if final:
+                message += f". Max retries ({self.MAX_RETRIES}) exhausted."
+            return OpenCodeHTTPClientError(message)
+        if not final:
+            return error
+        if kind == "timeout":
+            return TimeoutError(
+                f"Request timeout after {self.MAX_RETRIES} retries to {self.server_url}"
+            )
+        return OpenCodeConnectionError(
+            f"Failed to connect to {self.server_url} after "
+            f"{self.MAX_RETRIES} retries: {error}"
+        )
+
+    @staticmethod
+    def _transient_context(
+        error: BaseException, timeout: float, final: bool
+    ) -> Dict[str, Any]:
+        """Kind-specific additional_context for a logged retryable failure."""
+        kind = _transient_kind(error)
+        if kind == "server":
+            response = error.response
+            return {
+                "status_code": response.status_code,
+                "response_text": error.text[:500],
+            }
+        if kind == "timeout":
+            return {"timeout": timeout}
+        return {"original_error": str(error)} if final else {}
+
+    def _log_failure(
+        self,
+        adw_id: str,
+        agent_name: str,
+        error: Exception,
+        operation: str,
+        model_id: str,
+        prompt_preview: Optional[str],
+        additional_context: Dict[str, Any],
+    ) -> None:
+        """Write an error log for a failed send_prompt attempt, never raising.
+
+        Does nothing unless both adw_id and agent_name are set, so call sites
+        need no guard of their own.
+        """
+        if not (adw_id and agent_name):
+            return
+        if self.async_logging:
+            _LOG_WRITER.submit(
+                log_error_with_context,
+                adw_id=adw_id,
+                agent_name=agent_name,
+                error=error,
+                operation=operation,
+                server_url=self.server_url,
+                model_id=model_id,
+                prompt_preview=prompt_preview,
+                additional_context=copy.deepcopy(additional_context),
+            )
+            return
+        try:
+            log_error_with_context(
+                adw_id=adw_id,
+                agent_name=agent_name,
+                error=error,
+                operation=operation,
+                server_url=self.server_url,
+                model_id=model_id,
+                prompt_preview=prompt_preview,
+                additional_context=additional_context,
+            )
+        except Exception as log_error:
+            logger.warning("Failed to log %s: %s", operation, log_error)
+
+    def _log_response(
+        self,
+        adw_id: str,
+        agent_name: str,
+        response_data: Dict[str, Any],
+        model_id: str,
+        prompt_preview: Optional[str],
+    ) -> None:
+        """Write the response log for a successful send_prompt, never raising."""
+        if not (adw_id and agent_name):
+            return
+        if self.async_logging:
+            # Snapshot: the caller may mutate the response before the writer
+            # thread serializes it
+            _LOG_WRITER.submit(
+                save_response_log,
+                adw_id=adw_id,
+                agent_name=agent_name,
+                response=copy.deepcopy(response_data),
+                server_url=self.server_url,
+                model_id=model_id,
+                prompt_preview=prompt_preview,
+            )
+            return
+        try:
+            save_response_log(
+                adw_id=adw_id,
+                agent_name=agent_name,
+                response=response_data,
+                server_url=self.server_url,
+                model_id=model_id,
+                prompt_preview=prompt_preview,
+            )
+        except Exception as log_error:
+            logger.warning("Failed to log successful response: %s", log_error)
+
+    @staticmethod
+    def flush_logs() -> None:
+        """Wait for logs queued by clients with async_logging to be written."""
+        _LOG_WRITER.flush()
+
+    def _message_endpoint(self) -> str:
+        """Message URL of the current OpenCode session, rebuilt only on change."""
+        session_id, url = self._message_url
+        if session_id != self.session_id:
+            url = f"{self._session_url}/{self.session_id}/message"
+            self._message_url = (self.session_id, url)
+        return url
+
+    def _retry_delay(self, attempt: int) -> float:
+        """
+        Compute the jittered backoff delay before retrying after an attempt.
+
+        Args:
+            attempt: Number of the attempt that just failed (1-based)
+
+        Returns:
+            float: Seconds to sleep before the next attempt
+        """
+        # Clamp the exponent: the delay is capped long before 2**64 anyway
+        backoff = 2.0 ** min(attempt - 1, 64)
+        delay = min(self.RETRY_MAX_DELAY, self.RETRY_BASE_DELAY * backoff)
+        return delay * (1 + random.uniform(0, self.RETRY_JITTER))
+
     def _send_prompt_with_retry(
         self,
         prompt: str,
         model_id: str,
         timeout: float,
-        attempt: int = 1,
-        initial_delay: float = 1.0,
         adw_id: Optional[str] = None,
         agent_name: Optional[str] = None,
     ) -> Dict[str, Any]:
         """
         Send prompt with exponential backoff retry logic.
 
-        Implements exponential backoff with delays: 1s, 2s, 4s for up to 3 retries.
+        Makes up to MAX_RETRIES attempts, sleeping between them for
+        RETRY_BASE_DELAY * 2^(attempt-1) seconds (capped at RETRY_MAX_DELAY)
+        plus up to RETRY_JITTER of random jitter, so many workflows hitting a
+        flapping server do not reconnect in lockstep.
         Retries on transient failures (timeouts, connection errors, 5xx errors).
         Does not retry on client errors (4xx) or authentication errors (401, 403).
 
@@ -459,8 +1455,6 @@ class OpenCodeHTTPClient:
             prompt: The prompt text
             model_id: Model ID for routing
             timeout: Request timeout in seconds
-            attempt: Current attempt number (1-3)
-            initial_delay: Base delay for exponential backoff
             adw_id: Optional ADW ID for logging context
             agent_name: Optional agent name for logging context
 
@@ -469,488 +1463,307 @@ class OpenCodeHTTPClient:
 
         Raises:
             TimeoutError: If all retries exhausted
+            OpenCodeConnectionError: If the server's circuit breaker is open
             OpenCodeHTTPClientError: For other errors
         """
-        response = None
-        try:
-            # Ensure session exists
-            if self._session is None:
-                self._session = requests.Session()
-
-            # Build request
-            headers = {
-                "Content-Type": "application/json",
-            }
-            if self.api_key:
-                headers["Authorization"] = f"Bearer {self.api_key}"
-
-            # Create OpenCode session first (if not exists)
-            if not self.session_id:
-                session_response = self._session.post(
-                    f"{self.server_url.rstrip('/')}/session",
-                    headers=headers,
-                    json={},  # Empty body creates new session
-                    timeout=timeout,
-                )
-                if session_response.status_code in (200, 201):
-                    session_data = session_response.json()
-                    self.session_id = session_data.get("id")
-                else:
-                    raise OpenCodeHTTPClientError(
-                        f"Failed to create session: {session_response.status_code}"
-                    )
-
-            # Prepare message body according to OpenCode API
-            message_body = {
-                "parts": [{"type": "text", "text": prompt}],
-                "model": {
-                    "providerID": model_id.split("/")[0]
-                    if "/" in model_id
-                    else "github-copilot",
-                    "modelID": model_id.split("/")[1] if "/" in model_id else model_id,
-                },
-            }
-
-            # Send message to session
-            endpoint = (
-                f"{self.server_url.rstrip('/')}/session/{self.session_id}/message"
-            )
-
-            # Make request using OpenCode session message API
-            response = self._session.post(
-                endpoint,
-                json=message_body,
-                headers=headers,
-                timeout=timeout,
-            )
-
-            # Handle response status codes
-            if response.status_code == 401:
-                error_msg = (
-                    "Authentication failed (401). Invalid API key or session expired."
+        self._check_circuit()
+        session = self._get_session()
+
+        headers = self._base_headers
+
+        # Serialize once for all attempts. With requests, read message bodies
+        # lazily so retried 5xx pages are not downloaded (httpx reads eagerly
+        # and takes raw bytes as content=)
+        body = _encode_message_body(prompt, model_id)
+        if self.compress_requests and len(body) >= self.COMPRESS_MIN_BYTES:
+            # Level 1: most of the size win on prose and code for little CPU
+            body = gzip.compress(body, compresslevel=1)
+            headers = {**headers, "Content-Encoding": "gzip"}
+        # Logged with every failed attempt; sliced once for all of them
+        prompt_preview = prompt[:200]
+        # Telemetry tier (index into _TELEMETRY_TIERS), fixed for all attempts
+        tier = 0 if self.is_lightweight_model(model_id) else 1
+        if self.transport == "requests":
+            post_kwargs: Dict[str, Any] = {"data": body, "stream": True}
+        elif self.transport == "urllib3":
+            post_kwargs = {"data": body}
+        else:
+            post_kwargs = {"content": body}
+
+        # Waiting out a 429 Retry-After does not use up an attempt; the total
+        # wait is capped at RATE_LIMIT_MAX_WAIT and the number of waits at
+        # RATE_LIMIT_MAX_RETRIES (Retry-After: 0 would otherwise never end)
+        rate_limit_waited = 0.0
+        rate_limit_retries = 0
+        attempt = 0
+        while attempt < self.MAX_RETRIES:
+            attempt += 1
+            response = None
+            try:
+                response = self._post_message(
+                    session, headers, timeout, post_kwargs, tier, attempt
                 )
-                auth_error = OpenCodeAuthenticationError(error_msg)
-                # Log authentication error with context
-                if adw_id and agent_name:
-                    try:
-                        log_error_with_context(
-                            adw_id=adw_id,
-                            agent_name=agent_name,
-                            error=auth_error,
-                            operation="send_prompt",
-                            server_url=self.server_url,
-                            model_id=model_id,
-                            prompt_preview=prompt[:200] if prompt else None,
-                            additional_context={
-                                "status_code": 401,
-                                "attempt": attempt,
-                                "session_id": self.session_id,
-                            },
-                        )
-                    except Exception as log_error:
-                        print(
-                            f"Warning: Failed to log authentication error: {log_error}",
-                            file=sys.stderr,
-                        )
-                raise auth_error
-            elif response.status_code == 403:
-                error_msg = "Access forbidden (403). Insufficient permissions."
-                auth_error = OpenCodeAuthenticationError(error_msg)
-                # Log authorization error with context
-                if adw_id and agent_name:
-                    try:
-                        log_error_with_context(
-                            adw_id=adw_id,
-                            agent_name=agent_name,
-                            error=auth_error,
-                            operation="send_prompt",
-                            server_url=self.server_url,
-                            model_id=model_id,
-                            prompt_preview=prompt[:200] if prompt else None,
-                            additional_context={
-                                "status_code": 403,
-                                "attempt": attempt,
-                                "session_id": self.session_id,
-                            },
-                        )
-                    except Exception as log_error:
-                        print(
-                            f"Warning: Failed to log authorization error: {log_error}",
-                            file=sys.stderr,
+                if response.status_code == 429:
+                    wait = _retry_after_seconds(response)
+                    if (
+                        wait is not None
+                        and rate_limit_retries < self.RATE_LIMIT_MAX_RETRIES
+                        and rate_limit_waited + wait <= self.RATE_LIMIT_MAX_WAIT
+                    ):
+                        rate_limit_retries += 1
+                        rate_limit_waited += wait
+                        logger.warning(
+                            "Rate limited (429). Retrying after %.1fs...", wait
                         )
-                raise auth_error
-            elif response.status_code >= 500:
-                # Server error - retry with exponential backoff
-                if attempt < self.MAX_RETRIES:
-                    delay = initial_delay * (2 ** (attempt - 1))
-                    print(
-                        f"Server error {response.status_code} (attempt {attempt}/{self.MAX_RETRIES}). "
-                        f"Retrying in {delay}s...",
-                        file=sys.stderr,
-                    )
-                    # Log retry attempt
-                    if adw_id and agent_name:
-                        try:
-                            log_error_with_context(
-                                adw_id=adw_id,
-                                agent_name=agent_name,
-                                error=OpenCodeHTTPClientError(
-                                    f"Server error {response.status_code}: {response.text}"
-                                ),
-                                operation="send_prompt_retry",
-                                server_url=self.server_url,
-                                model_id=model_id,
-                                prompt_preview=prompt[:200] if prompt else None,
-                                additional_context={
-                                    "status_code": response.status_code,
-                                    "attempt": attempt,
-                                    "max_retries": self.MAX_RETRIES,
-                                    "retry_delay": delay,
-                                    "response_text": response.text[:500],
-                                },
-                            )
-                        except Exception as log_error:
-                            print(
-                                f"Warning: Failed to log retry attempt: {log_error}",
-                                file=sys.stderr,
-                            )
+                        # Hand the connection back to the pool for the wait
+                        response.close()
+                        response = None
+                        time.sleep(wait)
+                        attempt -= 1
+                        continue
+                    # No usable Retry-After: reported as a client error
+                return self._parse_response(
+                    response, attempt, model_id, prompt_preview, adw_id, agent_name
+                )
 
-                    time.sleep(delay)
-                    return self._send_prompt_with_retry(
-                        prompt=prompt,
-                        model_id=model_id,
-                        timeout=timeout,
-                        attempt=attempt + 1,
-                        initial_delay=initial_delay,
-                        adw_id=adw_id,
-                        agent_name=agent_name,
-                    )
-                else:
-                    final_error = OpenCodeHTTPClientError(
-                        f"Server error {response.status_code}: {response.text}. "
-                        f"Max retries ({self.MAX_RETRIES}) exhausted."
+            except _RETRYABLE_ERRORS as e:
+                # Transient failure - retry with exponential backoff
+                kind = _transient_kind(e)
+                if kind != "server":
+                    self._record_transport_failure()
+                retry_operation, final_operation = _RETRY_OPERATIONS[kind]
+                log_context = bool(adw_id and agent_name)
+                if attempt < self.MAX_RETRIES:
+                    delay = self._retry_delay(attempt)
+                    logger.warning(
+                        "%s (attempt %s/%s). Retrying in %.1fs...",
+                        _describe_transient(e),
+                        attempt,
+                        self.MAX_RETRIES,
+                        delay,
                     )
-                    # Log final failure
-                    if adw_id and agent_name:
-                        try:
-                            log_error_with_context(
-                                adw_id=adw_id,
-                                agent_name=agent_name,
-                                error=final_error,
-                                operation="send_prompt_final_failure",
-                                server_url=self.server_url,
-                                model_id=model_id,
-                                prompt_preview=prompt[:200] if prompt else None,
-                                additional_context={
-                                    "status_code": response.status_code,
-                                    "final_attempt": attempt,
-                                    "total_retries": self.MAX_RETRIES,
-                                    "response_text": response.text[:500],
-                                },
-                            )
-                        except Exception as log_error:
-                            print(
-                                f"Warning: Failed to log final failure: {log_error}",
-                                file=sys.stderr,
-                            )
-                    raise final_error
-            elif response.status_code >= 400:
-                # Client error - don't retry
-                client_error = OpenCodeHTTPClientError(
-                    f"Client error {response.status_code}: {response.text}"
-                )
-                # Log client error
-                if adw_id and agent_name:
-                    try:
-                        log_error_with_context(
-                            adw_id=adw_id,
-                            agent_name=agent_name,
-                            error=client_error,
-                            operation="send_prompt",
-                            server_url=self.server_url,
-                            model_id=model_id,
-                            prompt_preview=prompt[:200] if prompt else None,
-                            additional_context={
-                                "status_code": response.status_code,
-                                "attempt": attempt,
-                                "response_text": response.text[:500],
-                            },
+                    if log_context:
+                        context = self._transient_context(e, timeout, final=False)
+                        context.update(
+                            attempt=attempt,
+                            max_retries=self.MAX_RETRIES,
+                            retry_delay=delay,
                         )
-                    except Exception as log_error:
-                        print(
-                            f"Warning: Failed to log client error: {log_error}",
-                            file=sys.stderr,
+                        self._log_failure(
+                            adw_id,
+                            agent_name,
+                            self._transient_error(e, final=False),
+                            retry_operation,
+                            model_id,
+                            prompt_preview,
+                            context,
                         )
-                raise client_error
-
-            # Success - parse response and optionally log successful response
-            response_data = response.json()
-
-            # Check for server-side errors reported in info block
-            if "info" in response_data and "error" in response_data["info"]:
-                error_info = response_data["info"]["error"]
-                error_name = error_info.get("name", "UnknownError")
-                error_data = error_info.get("data", {})
-                error_details = (
-                    error_data.get("message")
-                    if isinstance(error_data, dict)
-                    else str(error_data)
-                )
 
-                error_msg = f"OpenCode Server Error: {error_name} - {error_details}"
-
-                # Log this error
-                if adw_id and agent_name:
-                    try:
-                        log_error_with_context(
-                            adw_id=adw_id,
-                            agent_name=agent_name,
-                            error=OpenCodeHTTPClientError(error_msg),
-                            operation="send_prompt_server_error",
-                            server_url=self.server_url,
-                            model_id=model_id,
-                            prompt_preview=prompt[:200] if prompt else None,
-                            additional_context={"server_info": response_data["info"]},
-                        )
-                    except Exception:
-                        pass
-
-                raise OpenCodeHTTPClientError(error_msg)
-
-            # Transform OpenCode response to expected ADWS format
-
-            # OpenCode returns: {"info": {...}, "parts": [...]}
-            # ADWS expects: {"message": {...}, "parts": [...]}
-            if "info" in response_data:
-                # Map OpenCode structure to ADWS expected structure
-                transformed_response = {
-                    "message": response_data.get("info", {}),
-                    "parts": response_data.get("parts", []),
-                    "session_id": self.session_id,
-                    "success": True,
-                }
-                response_data = transformed_response
-
-            # Log successful response if context provided
-            if adw_id and agent_name:
-                try:
-                    save_response_log(
-                        adw_id=adw_id,
-                        agent_name=agent_name,
-                        response=response_data,
-                        server_url=self.server_url,
-                        model_id=model_id,
-                        prompt_preview=prompt[:200] if prompt else None,
+                    # Hand the connection back to the pool for the backoff
+                    if response is not None:
+                        response.close()
+                        response = None
+                    time.sleep(delay)
+                    continue
+
+                final_error = self._transient_error(e, final=True)
+                if log_context:
+                    context = self._transient_context(e, timeout, final=True)
+                    context.update(
+                        final_attempt=attempt, total_retries=self.MAX_RETRIES
                     )
-                except Exception as log_error:
-                    print(
-                        f"Warning: Failed to log successful response: {log_error}",
-                        file=sys.stderr,
+                    self._log_failure(
+                        adw_id,
+                        agent_name,
+                        final_error,
+                        final_operation,
+                        model_id,
+                        prompt_preview,
+                        context,
                     )
-
-            return response_data
-
-        except requests.exceptions.Timeout as e:
-            # Timeout - retry with exponential backoff
-            if attempt < self.MAX_RETRIES:
-                delay = initial_delay * (2 ** (attempt - 1))
-                print(
-                    f"Request timeout (attempt {attempt}/{self.MAX_RETRIES}). "
-                    f"Retrying in {delay}s...",
-                    file=sys.stderr,
+                raise final_error
+
+            except (OpenCodeAuthenticationError, OpenCodeHTTPClientError):
+                # Re-raise our custom exceptions without retry
+                raise
+            except json.JSONDecodeError as e:
+                response_text = response.text if response is not None else "No response"
+                json_error = OpenCodeHTTPClientError(
+                    f"Invalid JSON in OpenCode response: {e}. Response: {response_text}"
                 )
-                # Log timeout retry
-                if adw_id and agent_name:
-                    try:
-                        log_error_with_context(
-                            adw_id=adw_id,
-                            agent_name=agent_name,
-                            error=e,
-                            operation="send_prompt_timeout_retry",
-                            server_url=self.server_url,
-                            model_id=model_id,
-                            prompt_preview=prompt[:200] if prompt else None,
-                            additional_context={
-                                "timeout": timeout,
-                                "attempt": attempt,
-                                "max_retries": self.MAX_RETRIES,
-                                "retry_delay": delay,
-                            },
-                        )
-                    except Exception as log_error:
-                        print(
-                            f"Warning: Failed to log timeout retry: {log_error}",
-                            file=sys.stderr,
-                        )
-
-                time.sleep(delay)
-                return self._send_prompt_with_retry(
-                    prompt=prompt,
-                    model_id=model_id,
-                    timeout=timeout,
-                    attempt=attempt + 1,
-                    initial_delay=initial_delay,
-                    adw_id=adw_id,
-                    agent_name=agent_name,
+                self._log_failure(
+                    adw_id,
+                    agent_name,
+                    json_error,
+                    "send_prompt_json_decode",
+                    model_id,
+                    prompt_preview,
+                    {
+                        "attempt": attempt,
+                        "response_text": response_text[:1000],
+                        "json_error": str(e),
+                    },
                 )
-            else:
-                final_timeout_error = TimeoutError(
-                    f"Request timeout after {self.MAX_RETRIES} retries "
-                    f"to {self.server_url}"
+                raise json_error
+            except Exception as e:
+                # Unexpected error
+                logger.exception("Unexpected error calling OpenCode API")
+                unexpected_error = OpenCodeHTTPClientError(
+                    f"Unexpected error calling OpenCode API: {e}"
                 )
-                # Log final timeout failure
-                if adw_id and agent_name:
-                    try:
-                        log_error_with_context(
-                            adw_id=adw_id,
-                            agent_name=agent_name,
-                            error=final_timeout_error,
-                            operation="send_prompt_timeout_final",
-                            server_url=self.server_url,
-                            model_id=model_id,
-                            prompt_preview=prompt[:200] if prompt else None,
-                            additional_context={
-                                "timeout": timeout,
-                                "final_attempt": attempt,
-                                "total_retries": self.MAX_RETRIES,
-                            },
-                        )
-                    except Exception as log_error:
-                        print(
-                            f"Warning: Failed to log final timeout: {log_error}",
-                            file=sys.stderr,
-                        )
-                raise final_timeout_error
-
-        except requests.exceptions.ConnectionError as e:
-            # Connection error - retry with exponential backoff
-            if attempt < self.MAX_RETRIES:
-                delay = initial_delay * (2 ** (attempt - 1))
-                print(
-                    f"Connection error (attempt {attempt}/{self.MAX_RETRIES}): {e}. "
-                    f"Retrying in {delay}s...",
-                    file=sys.stderr,
+                self._log_failure(
+                    adw_id,
+                    agent_name,
+                    unexpected_error,
+                    "send_prompt_unexpected",
+                    model_id,
+                    prompt_preview,
+                    {
+                        "attempt": attempt,
+                        "error_type": type(e).__name__,
+                        "original_error": str(e),
+                    },
                 )
-                # Log connection retry
-                if adw_id and agent_name:
-                    try:
-                        log_error_with_context(
-                            adw_id=adw_id,
-                            agent_name=agent_name,
-                            error=e,
-                            operation="send_prompt_connection_retry",
-                            server_url=self.server_url,
-                            model_id=model_id,
-                            prompt_preview=prompt[:200] if prompt else None,
-                            additional_context={
-                                "attempt": attempt,
-                                "max_retries": self.MAX_RETRIES,
-                                "retry_delay": delay,
-                            },
-                        )
-                    except Exception as log_error:
-                        print(
-                            f"Warning: Failed to log connection retry: {log_error}",
-                            file=sys.stderr,
-                        )
+                raise unexpected_error
+            finally:
+                # Release the connection; bodies of retried 5xx responses are
+                # never downloaded unless they are being logged
+                if response is not None:
+                    response.close()
+
+    def _post_message(
+        self,
+        session: Any,
+        headers: Dict[str, str],
+        timeout: float,
+        post_kwargs: Dict[str, Any],
+        tier: int,
+        attempt: int,
+    ) -> Any:
+        """
+        Make one attempt's HTTP calls, without interpreting the status code.
 
-                time.sleep(delay)
-                return self._send_prompt_with_retry(
-                    prompt=prompt,
-                    model_id=model_id,
-                    timeout=timeout,
-                    attempt=attempt + 1,
-                    initial_delay=initial_delay,
-                    adw_id=adw_id,
-                    agent_name=agent_name,
-                )
+        Creates the OpenCode session first if there is none, then posts the
+        message and records the call in telemetry under the given tier.
+
+        Returns:
+            The message response (still open; the caller closes it)
+
+        Raises:
+            OpenCodeHTTPClientError: If the OpenCode session cannot be created
+        """
+        # Create OpenCode session first (if not exists)
+        if not self.session_id:
+            session_response = session.post(
+                self._session_url,
+                headers=headers,
+                json={},  # Empty body creates new session
+                timeout=timeout,
+            )
+            if session_response.status_code in (200, 201):
+                session_data = decode_json(session_response)
+                self.session_id = session_data.get("id")
             else:
-                final_connection_error = OpenCodeConnectionError(
-                    f"Failed to connect to {self.server_url} after {self.MAX_RETRIES} retries: {e}"
+                raise OpenCodeHTTPClientError(
+                    f"Failed to create session: {session_response.status_code}"
                 )
-                # Log final connection failure
-                if adw_id and agent_name:
-                    try:
-                        log_error_with_context(
-                            adw_id=adw_id,
-                            agent_name=agent_name,
-                            error=final_connection_error,
-                            operation="send_prompt_connection_final",
-                            server_url=self.server_url,
-                            model_id=model_id,
-                            prompt_preview=prompt[:200] if prompt else None,
-                            additional_context={
-                                "final_attempt": attempt,
-                                "total_retries": self.MAX_RETRIES,
-                                "original_error": str(e),
-                            },
-                        )
-                    except Exception as log_error:
-                        print(
-                            f"Warning: Failed to log final connection error: {log_error}",
-                            file=sys.stderr,
-                        )
-                raise final_connection_error
 
-        except (OpenCodeAuthenticationError, OpenCodeHTTPClientError):
-            # Re-raise our custom exceptions without retry
-            raise
+        # Make request using OpenCode session message API
+        started_ns = time.perf_counter_ns()
+        response = session.post(
+            self._message_endpoint(), headers=headers, timeout=timeout, **post_kwargs
+        )
+        self._telemetry.append(
+            (
+                tier,
+                response.status_code,
+                time.perf_counter_ns() - started_ns,
+                attempt - 1,
+            )
+        )
+        self._record_server_reachable()
+        return response
+
+    def _parse_response(
+        self,
+        response: Any,
+        attempt: int,
+        model_id: str,
+        prompt_preview: str,
+        adw_id: Optional[str],
+        agent_name: Optional[str],
+    ) -> Dict[str, Any]:
+        """
+        Turn a message response into the ADWS response format.
+
+        Returns:
+            Dict with structured OpenCode response
+
+        Raises:
+            _TransientServerError: For a 5xx status, for the caller to retry
+            OpenCodeAuthenticationError: For 401 and 403
+            OpenCodeHTTPClientError: For other 4xx statuses, a body that is
+                not valid JSON and errors reported in the response's info block
+        """
+        # Everything below 400 takes the success path straight away
+        status = response.status_code
+        if status >= 400:
+            if status >= 500:
+                # Retried by the caller with timeouts and dropped connections
+                raise _TransientServerError(response)
+            self._raise_client_error(
+                response, attempt, model_id, prompt_preview, adw_id, agent_name
+            )
+
+        # Success - parse response and optionally log successful response
+        body = _read_body(response)
+        try:
+            response_data = _loads(body)
         except json.JSONDecodeError as e:
-            response_text = response.text if response is not None else "No response"
-            json_error = OpenCodeHTTPClientError(
-                f"Invalid JSON in OpenCode response: {e}. Response: {response_text}"
+            self._raise_invalid_json(
+                e, body, attempt, model_id, prompt_preview, adw_id, agent_name
             )
-            # Log JSON decode error
-            if adw_id and agent_name:
-                try:
-                    log_error_with_context(
-                        adw_id=adw_id,
-                        agent_name=agent_name,
-                        error=json_error,
-                        operation="send_prompt_json_decode",
-                        server_url=self.server_url,
-                        model_id=model_id,
-                        prompt_preview=prompt[:200] if prompt else None,
-                        additional_context={
-                            "attempt": attempt,
-                            "response_text": response_text[:1000],
-                            "json_error": str(e),
-                        },
-                    )
-                except Exception as log_error:
-                    print(
-                        f"Warning: Failed to log JSON decode error: {log_error}",
-                        file=sys.stderr,
-                    )
-            raise json_error
-        except Exception as e:
-            # Unexpected error
-            unexpected_error = OpenCodeHTTPClientError(
-                f"Unexpected error calling OpenCode API: {e}"
+
+        # Check for server-side errors reported in info block
+        if "info" in response_data and "error" in response_data["info"]:
+            error_info = response_data["info"]["error"]
+            error_name = error_info.get("name", "UnknownError")
+            error_data = error_info.get("data", {})
+            error_details = (
+                error_data.get("message")
+                if isinstance(error_data, dict)
+                else str(error_data)
             )
-            # Log unexpected error
-            if adw_id and agent_name:
-                try:
-                    log_error_with_context(
-                        adw_id=adw_id,
-                        agent_name=agent_name,
-                        error=unexpected_error,
-                        operation="send_prompt_unexpected",
-                        server_url=self.server_url,
-                        model_id=model_id,
-                        prompt_preview=prompt[:200] if prompt else None,
-                        additional_context={
-                            "attempt": attempt,
-                            "error_type": type(e).__name__,
-                            "original_error": str(e),
-                        },
-                    )
-                except Exception as log_error:
-                    print(
-                        f"Warning: Failed to log unexpected error: {log_error}",
-                        file=sys.stderr,
-                    )
-            raise unexpected_error
+
+            error_msg = f"OpenCode Server Error: {error_name} - {error_details}"
+
+            server_error = OpenCodeHTTPClientError(error_msg)
+            self._log_failure(
+                adw_id,
+                agent_name,
+                server_error,
+                "send_prompt_server_error",
+                model_id,
+                prompt_preview,
+                {"server_info": response_data["info"]},
+            )
+            raise server_error
+
+        # Transform OpenCode response to expected ADWS format
+
+        # OpenCode returns: {"info": {...}, "parts": [...]}
+        # ADWS expects: {"message": {...}, "parts": [...]}
+        if "info" in response_data:
+            # Map OpenCode structure to ADWS expected structure
+            response_data = {
+                "message": response_data.get("info", {}),
+                "parts": response_data.get("parts", []),
+                "session_id": self.session_id,
+                "success": True,
+            }
+
+        self._log_response(adw_id, agent_name, response_data, model_id, prompt_preview)
+        return response_data
 
     def __repr__(self) -> str:
         """String representation of OpenCodeHTTPClient."""
@@ -960,6 +1773,121 @@ class OpenCodeHTTPClient:
         )
 
 
+def _encode_json(payload: Any, indent: bool = False) -> bytes:
+    """
+    Serialize a request payload to JSON bytes.
+
+    Uses orjson when it is installed, which matters for implement prompts
+    that embed tens of KB of context; falls back to the stdlib encoder.
+
+    Args:
+        payload: JSON-serializable request body
+        indent: Pretty-print with two-space indentation (for log files)
+
+    Returns:
+        bytes: UTF-8 encoded JSON document
+    """
+    if ORJSON_AVAILABLE:
+        # OPT_NON_STR_KEYS matches the stdlib, which stringifies int/float keys
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(payload, option=option)
+        except orjson.JSONEncodeError:
+            # orjson rejects strings that are not valid UTF-8 (lone surrogates,
+            # e.g. from truncated emoji); the stdlib escapes them as \udXXX
+            return json.dumps(payload, indent=2 if indent else None).encode("utf-8")
+    if indent:
+        return json.dumps(payload, indent=2, ensure_ascii=False).encode("utf-8")
+    return json.dumps(payload).encode("utf-8")
+
+
+# Message body layout per OpenCode API:
+# {"parts": [{"type": "text", "text": prompt}], "model": {...}}
+_MESSAGE_BODY_PREFIX = b'{"parts":[{"type":"text","text":'
+
+
+@functools.lru_cache(maxsize=32)
+def _message_body_suffix(model_id: str) -> bytes:
+    """Encode the part of a message body after the prompt; fixed per model."""
+    if "/" in model_id:
+        segments = model_id.split("/")
+        model = {"providerID": segments[0], "modelID": segments[1]}
+    else:
+        model = {"providerID": "github-copilot", "modelID": model_id}
+    return b'}],"model":' + _encode_json(model) + b"}"
+
+
+def _encode_message_body(prompt: str, model_id: str) -> bytes:
+    """
+    Encode a send_prompt message body without building the dict first.
+
+    Only the prompt is serialized per call; the model routing fragment is
+    encoded once per model_id.
+
+    Args:
+        prompt: The prompt text
+        model_id: "provider/model" (provider defaults to github-copilot)
+
+    Returns:
+        bytes: UTF-8 encoded JSON message body
+    """
+    return _MESSAGE_BODY_PREFIX + _encode_json(prompt) + _message_body_suffix(model_id)
+
+
+def decode_json(response: Any) -> Any:
+    """
+    Decode a JSON response body.
+
+    Parses the raw bytes with orjson when it is installed, or with the
+    stdlib parser otherwise. Either way this skips response.json(), which
+    first decodes the body to text and may sniff its charset. OpenCode
+    always sends UTF-8 JSON. orjson.JSONDecodeError subclasses
+    json.JSONDecodeError, so callers handle malformed bodies the same way
+    either way.
+
+    Args:
+        response: requests.Response, httpx.Response or urllib3-backed
+            response with a JSON body
+
+    Returns:
+        The decoded JSON document
+    """
+    return _loads(response.content)
+
+
+def _loads(body: bytes) -> Any:
+    """Parse JSON bytes with orjson when installed, else the stdlib parser."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(body)
+    return json.loads(body)
+
+
+def _read_body(response: Any) -> bytes:
+    """
+    Read a message response body, in one pass for streamed requests responses.
+
+    requests builds .content for a stream=True response by joining 10 KB
+    iter_content() chunks, so multi-MB implement/review bodies exist twice
+    in memory while they are joined. Reading the raw stream in a single
+    call avoids the chunk list. Only call this on a message response whose
+    body has not been read yet: the response is left untouched, so its
+    .content and .text are empty afterwards and callers that need the text
+    decode the returned bytes.
+
+    Args:
+        response: requests.Response (streamed), httpx.Response or
+            _Urllib3Response
+
+    Returns:
+        bytes: The decoded (decompressed) response body
+    """
+    if isinstance(response, requests.Response) and response.raw is not None:
+        return response.raw.read(decode_content=True) or b""
+    return response.content
+
+
 # Story 1.5: Output Parser Functions for Structured Part Extraction
 
 
@@ -984,22 +1912,17 @@ def extract_text_response(parts: List[Dict[str, Any]]) -> str:
     if not parts:
         return ""
 
-    text_content = []
+    text_content: List[str] = []
     for part in parts:
         if not isinstance(part, dict):
             continue
 
         part_type = part.get("type")
 
-        # Extract conversational text
-        if part_type == "text":
-            content = part.get("content", "")
-            if content and isinstance(content, str):
-                text_content.append(content.strip())
-
-        # Extract code block content
-        elif part_type == "code_block":
-            content = part.get("content", "")
+        # Conversational text and code blocks both carry their text in
+        # "content"; text comes first as by far the most common part type
+        if part_type == "text" or part_type == "code_block":
+            content = part.get("content")
             if content and isinstance(content, str):
                 text_content.append(content.strip())
 
@@ -1047,7 +1970,8 @@ def extract_tool_execution_details(parts: List[Dict[str, Any]]) -> Dict[str, Any
 
     tool_use_count = 0
     tool_result_count = 0
-    tools_used = []
+    # Insertion-ordered set of tool names, in first-use order
+    tools_used: Dict[str, None] = {}
     tool_executions = []
 
     # Process parts to extract tool information
@@ -1060,8 +1984,8 @@ def extract_tool_execution_details(parts: List[Dict[str, Any]]) -> Dict[str, Any
         if part_type == "tool_use":
             tool_use_count += 1
             tool_name = part.get("tool")
-            if tool_name and tool_name not in tools_used:
-                tools_used.append(tool_name)
+            if tool_name:
+                tools_used[tool_name] = None
 
             # Record tool use details
             tool_executions.append(
@@ -1089,12 +2013,39 @@ def extract_tool_execution_details(parts: List[Dict[str, Any]]) -> Dict[str, Any
     return {
         "tool_use_count": tool_use_count,
         "tool_result_count": tool_result_count,
-        "tools_used": tools_used,
+        "tools_used": list(tools_used),
         "tool_executions": tool_executions,
         "total_tools": tool_use_count + tool_result_count,
     }
 
 
+# Single-pass scanner for estimate_metrics_from_parts. Alternatives, tried in
+# order at each position:
+# - path: "dir/file.ext" (the whole extension, so "a.json" is not cut to
+#   "a.js") or a Unix-style path, preceded by whitespace or start of text
+# - named: path after "File:" or "Creating:"/"Updating:"/"Modifying:"
+# - deletion: remove/delete/rm followed by whitespace, a diff-style "-"
+#   line, or "// TODO: remove". The lookaheads keep whitespace and the word
+#   "remove" unconsumed so later alternatives still see them.
+# Nearly all of estimate_metrics_from_parts' time is spent inside this scan
+# and str.count(), both already in C; per-part Python work is a few lookups.
+_DELETION_PATTERN = r"(?:remove|delete|rm)(?=\s)|^\s*-\s*|// TODO: (?=remove)"
+_METRICS_RE = re.compile(
+    r"(?<!\S)(?P<path>"
+    r"[a-zA-Z0-9_/-]+\.(?:py|js|ts|jsx|tsx|java|cpp|h|css|html|md|yaml|yml|json|txt)"
+    r"(?![a-zA-Z0-9_])"
+    r"|[a-zA-Z0-9_/-]+/[a-zA-Z0-9_.-]+)"
+    r"|(?:File|Creating|Updating|Modifying):\s*(?P<named>[^\s\n]+)"
+    rf"|(?P<deletion>{_DELETION_PATTERN})",
+    re.IGNORECASE | re.MULTILINE,
+)
+
+# Once this many distinct file paths are seen, files_changed stops growing
+# and the rest of the output is only scanned for deletions
+_MAX_FILES_TRACKED = 256
+_DELETION_RE = re.compile(_DELETION_PATTERN, re.IGNORECASE | re.MULTILINE)
+
+
 def estimate_metrics_from_parts(parts: List[Dict[str, Any]]) -> Dict[str, int]:
     """
     Estimate development metrics from OpenCode response parts.
@@ -1117,6 +2068,9 @@ def estimate_metrics_from_parts(parts: List[Dict[str, Any]]) -> Dict[str, int]:
         - lines_removed: Estimated lines of code removed
         - total_content_length: Total character count of all outputs
         - code_blocks: Number of code_block parts found
+        - files_changed_truncated: Present (True) only when more than
+          _MAX_FILES_TRACKED distinct paths were found and files_changed
+          was capped
     """
     if not parts:
         return {
@@ -1140,19 +2094,20 @@ def estimate_metrics_from_parts(parts: List[Dict[str, Any]]) -> Dict[str, int]:
         if not isinstance(part, dict):
             continue
 
+        # Analyze content from various part types, looking up only the field
+        # the part's type carries (tool_use and other parts are skipped
+        # without touching their payload)
         part_type = part.get("type")
-        content = part.get("content", "")
-        output = part.get("output", "")
-
-        # Analyze content from various part types
-        text_to_analyze = ""
-        if part_type == "tool_result" and output:
-            text_to_analyze = output
-        elif part_type == "code_block" and content:
-            text_to_analyze = content
-            code_blocks += 1
-        elif part_type == "text" and content:
-            text_to_analyze = content
+        if part_type == "tool_result":
+            text_to_analyze = part.get("output")
+        elif part_type == "code_block":
+            text_to_analyze = part.get("content")
+            if text_to_analyze:
+                code_blocks += 1
+        elif part_type == "text":
+            text_to_analyze = part.get("content")
+        else:
+            continue
 
         if not text_to_analyze:
             continue
@@ -1160,41 +2115,28 @@ def estimate_metrics_from_parts(parts: List[Dict[str, Any]]) -> Dict[str, int]:
         # Update total content length
         total_content_length += len(text_to_analyze)
 
-        # Estimate files changed by looking for file path patterns
-        file_patterns = [
-            r"(?:^|\s)([a-zA-Z0-9_/-]+\.(?:py|js|ts|jsx|tsx|java|cpp|h|css|html|md|yaml|yml|json|txt))",
-            r"(?:^|\s)([a-zA-Z0-9_/-]+/[a-zA-Z0-9_.-]+)",  # Unix-style paths
-            r"File:\s*([^\s\n]+)",  # "File: path/to/file.py"
-            r"(?:Creating|Updating|Modifying):\s*([^\s\n]+)",  # Action: path
-        ]
-
-        for pattern in file_patterns:
-            matches = re.findall(pattern, text_to_analyze, re.IGNORECASE | re.MULTILINE)
-            for match in matches:
-                if match not in file_paths_seen:
-                    file_paths_seen.add(match)
+        # Estimate files changed from file path patterns and lines removed
+        # from deletion patterns, in one scan of the text
+        # Rough estimate: each deletion removes ~2 lines
+        if files_changed >= _MAX_FILES_TRACKED:
+            lines_removed += 2 * len(_DELETION_RE.findall(text_to_analyze))
+        else:
+            for match in _METRICS_RE.finditer(text_to_analyze):
+                path = match.group("path") or match.group("named")
+                if path is None:
+                    lines_removed += 2
+                elif path not in file_paths_seen:
+                    file_paths_seen.add(path)
                     files_changed += 1
+                    if files_changed >= _MAX_FILES_TRACKED:
+                        rest = _DELETION_RE.findall(text_to_analyze, match.end())
+                        lines_removed += 2 * len(rest)
+                        break
 
-        # Estimate lines added by counting newlines in content
+        # Estimate lines added by counting newlines in content (one less than
+        # its line count, so single-line outputs add nothing)
         # This is a rough approximation - actual additions would need diff analysis
-        lines_in_content = len(text_to_analyze.split("\n"))
-        if lines_in_content > 1:  # Don't count single-line outputs
-            lines_added += max(0, lines_in_content - 1)
-
-        # Look for deletion patterns (very rough estimation)
-        deletion_patterns = [
-            r"(?:remove|delete|rm)\s+",
-            r"^\s*-\s*",  # Diff-style deletions
-            r"// TODO: remove",
-        ]
-
-        for pattern in deletion_patterns:
-            deletions = len(
-                re.findall(pattern, text_to_analyze, re.IGNORECASE | re.MULTILINE)
-            )
-            lines_removed += (
-                deletions * 2
-            )  # Rough estimate: each deletion removes ~2 lines
+        lines_added += text_to_analyze.count("\n")
 
     # Apply some heuristics to make estimates more realistic
 
@@ -1203,23 +2145,56 @@ def estimate_metrics_from_parts(parts: List[Dict[str, Any]]) -> Dict[str, int]:
         files_changed = min(code_blocks, 3)  # Assume up to 3 files for code blocks
 
     # Cap lines_added to reasonable values based on content length
-    if total_content_length > 0:
-        # Rough estimate: average 50 chars per line of code
-        max_estimated_lines = total_content_length // 50
-        lines_added = min(lines_added, max_estimated_lines)
+    # Rough estimate: average 50 chars per line of code (0 when there is no
+    # content, in which case lines_added is 0 already)
+    lines_added = min(lines_added, total_content_length // 50)
 
-    return {
+    metrics = {
         "files_changed": files_changed,
         "lines_added": lines_added,
         "lines_removed": lines_removed,
         "total_content_length": total_content_length,
         "code_blocks": code_blocks,
     }
+    if files_changed >= _MAX_FILES_TRACKED:
+        metrics["files_changed_truncated"] = True
+    return metrics
 
 
 # Story 3.5: OpenCode Server Availability Check
 
 
+_HEALTH_SESSION: Optional[requests.Session] = None
+
+
+def _health_session() -> requests.Session:
+    """
+    Get the session used by check_opencode_server_available().
+
+    It mounts the same pooled adapter as the clients, so repeated checks
+    reuse one keep-alive connection and the first client after a check
+    finds it already open.
+
+    Returns:
+        requests.Session: Process-wide health check session
+    """
+    global _HEALTH_SESSION
+    if _HEALTH_SESSION is None:
+        adapter = _shared_adapter()
+        session = requests.Session()
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        _HEALTH_SESSION = session
+    return _HEALTH_SESSION
+
+
+# Results of recent check_opencode_server_available() calls, so modules that
+# each check at startup share one round trip per server
+# health URL -> (monotonic time checked, available)
+_HEALTH_CHECK_TTL = 2.0
+_HEALTH_RESULTS: Dict[str, Tuple[float, bool]] = {}
+
+
 def check_opencode_server_available(
     server_url: Optional[str] = None,
     timeout: float = 5.0,
@@ -1248,9 +2223,8 @@ def check_opencode_server_available(
         - This is a lightweight check - it doesn't verify authentication
         - Only checks if server is reachable and responding
         - Returns True for 2xx responses, False for errors/timeout
+        - Results are reused for _HEALTH_CHECK_TTL seconds per server
     """
-    import requests
-
     # Determine server URL from parameter or config
     if not server_url:
         try:
@@ -1267,25 +2241,45 @@ def check_opencode_server_available(
     server_url = server_url.rstrip("/")
     health_url = f"{server_url}/global/health"
 
+    cached = _HEALTH_RESULTS.get(health_url)
+    if cached is not None and time.monotonic() - cached[0] < _HEALTH_CHECK_TTL:
+        return cached[1]
+
+    available = _probe_health(health_url, timeout)
+    _HEALTH_RESULTS[health_url] = (time.monotonic(), available)
+    return available
+
+
+def _probe_health(health_url: str, timeout: float) -> bool:
+    """GET the health endpoint once; True for any 2xx response."""
     try:
         # Make a quick GET request to health endpoint
-        response = requests.get(health_url, timeout=timeout)
+        response = _health_session().get(health_url, timeout=timeout)
 
         # Consider any 2xx response as server available
         # (Don't check for specific status - just that it's responding)
         return 200 <= response.status_code < 300
 
-    except requests.exceptions.Timeout:
-        # Server not responding within timeout
-        return False
-    except requests.exceptions.ConnectionError:
-        # Cannot connect to server
-        return False
     except Exception:
-        # Any other error means server is not available
+        # Timeouts, refused connections and any other error all mean the
+        # server is not available
         return False
 
 
+# Agent log directories this process has created, so repeat logs for the same
+# agent skip the mkdir(parents=True) walk
+_LOG_DIRS_CREATED: set = set()
+
+
+def _create_log_dir(path: Path) -> None:
+    """Create an agent log directory and remember that it exists."""
+    try:
+        path.mkdir(parents=True, exist_ok=True)
+    except OSError as e:
+        raise OSError(f"Failed to create log directory {path}: {e}")
+    _LOG_DIRS_CREATED.add(path)
+
+
 def save_response_log(
     adw_id: str,
     agent_name: str,
@@ -1294,6 +2288,7 @@ def save_response_log(
     model_id: Optional[str] = None,
     prompt_preview: Optional[str] = None,
     error_context: Optional[str] = None,
+    pretty: bool = False,
 ) -> Path:
     """
     Save OpenCode response to structured log file for debugging and audit.
@@ -1311,6 +2306,8 @@ def save_response_log(
         model_id: Optional model ID that was used
         prompt_preview: Optional first 200 chars of prompt for context
         error_context: Optional error description if this is an error log
+        pretty: Indent the JSON for reading by hand (default: compact, which
+            encodes several times faster for large responses)
 
     Returns:
         Path: Path to the created log file
@@ -1335,14 +2332,14 @@ def save_response_log(
 
     # Create log directory structure: ai_docs/logs/{adw_id}/{agent_name}/
     agent_log_dir = logs_dir / adw_id / agent_name
-
-    try:
-        agent_log_dir.mkdir(parents=True, exist_ok=True)
-    except OSError as e:
-        raise OSError(f"Failed to create log directory {agent_log_dir}: {e}")
+    if agent_log_dir not in _LOG_DIRS_CREATED:
+        _create_log_dir(agent_log_dir)
 
     # Generate timestamp for log file
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    # One clock read for the file name and both record timestamps
+    now = datetime.now()
+    timestamp = now.strftime("%Y%m%d_%H%M%S")
+    created_at = now.isoformat()
 
     # Determine log file name based on whether this is an error
     if error_context:
@@ -1354,7 +2351,7 @@ def save_response_log(
 
     # Build comprehensive log entry
     log_entry = {
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": created_at,
         "adw_id": adw_id,
         "agent_name": agent_name,
         "server_url": server_url,
@@ -1364,20 +2361,26 @@ def save_response_log(
         "response": response,
         "log_metadata": {
             "log_file": str(log_file_path),
-            "created_at": datetime.now().isoformat(),
+            "created_at": created_at,
             "log_type": "error" if error_context else "response",
         },
     }
 
+    # Serialize up front so an unserializable entry never leaves a partial file
+    log_bytes = _encode_json(log_entry, indent=pretty)
+
     # Write log file
     try:
-        with open(log_file_path, "w", encoding="utf-8") as f:
-            json.dump(log_entry, f, indent=2, ensure_ascii=False)
+        try:
+            with open(log_file_path, "wb") as f:
+                f.write(log_bytes)
+        except FileNotFoundError:
+            # The directory was removed after this process created it
+            _create_log_dir(agent_log_dir)
+            with open(log_file_path, "wb") as f:
+                f.write(log_bytes)
     except OSError as e:
-        print(
-            f"Warning: Failed to write response log to {log_file_path}: {e}",
-            file=sys.stderr,
-        )
+        logger.warning("Failed to write response log to %s: %s", log_file_path, e)
         raise
 
     return log_file_path
@@ -5,13 +5,34 @@ identifying discrepancies and missing steps.
 """
 
 import re
+import functools
 import logging
 from typing import List, Dict, Optional, Tuple
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 
 
 logger = logging.getLogger(__name__)
 
+# Step sections in a plan:
+# - Markdown headers: ## Step 1: Description or ### 1. Description
+# - Numbered lists: 1. Description
+_PLAN_STEP_PATTERNS = [
+    re.compile(r'#{2,3}\s+(?:Step\s+)?(\d+)[.:]\s+(.+?)(?:\n|$)', re.MULTILINE | re.IGNORECASE),
+    re.compile(r'^\d+\.\s+(.+?)(?:\n|$)', re.MULTILINE | re.IGNORECASE),
+]
+
+# Completed step indicators in execution output
+_EXECUTED_STEP_PATTERNS = [
+    re.compile(r'(?:✓|✔|→|\*)\s*(?:Step\s+)?(\d+)[.:]\s*(.+?)(?:\n|$)', re.IGNORECASE),
+    re.compile(r'(?:✓|✔)\s+(.+?)(?:\n|$)', re.IGNORECASE),
+    re.compile(r'Completed[:\s]+(?:Step\s+)?(\d+)?:?\s*(.+?)(?:\n|$)', re.IGNORECASE),
+    re.compile(r'Successfully\s+(?:executed|ran|completed)[:\s]+(.+?)(?:\n|$)', re.IGNORECASE),
+    re.compile(r'(?:Step|step)\s+(\d+).*?:?\s*(.+?)(?:\n|$)', re.IGNORECASE),
+]
+
+_BOLD_RE = re.compile(r'\*\*(.+?)\*\*')
+_ITALIC_RE = re.compile(r'\*(.+?)\*')
+
 
 @dataclass
 class PlanStep:
@@ -44,23 +65,22 @@ def parse_plan_steps(plan_content: str) -> List[PlanStep]:
     - "### 1. Title"
     - "1. Title"
     
-    Returns list of PlanStep objects.
+    Returns list of PlanStep objects. The same plan is validated and
+    summarized several times per run, so parses are cached by content; each
+    call gets its own copies of the steps.
     """
+    return [replace(step) for step in _parse_plan_steps(plan_content)]
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_plan_steps(plan_content: str) -> Tuple[PlanStep, ...]:
+    """Parse plan steps once per distinct plan (see parse_plan_steps)."""
     steps = []
     
     # Try to find step sections with various formats
-    patterns = [
-        # Markdown headers: ## Step 1: Description or ### 1. Description
-        r'#{2,3}\s+(?:Step\s+)?(\d+)[.:]\s+(.+?)(?:\n|$)',
-        # Numbered lists: 1. Description
-        r'^\d+\.\s+(.+?)(?:\n|$)',
-    ]
-    
     step_number = 0
-    for pattern in patterns:
-        matches = re.finditer(pattern, plan_content, re.MULTILINE | re.IGNORECASE)
-        
-        for match in matches:
+    for pattern in _PLAN_STEP_PATTERNS:
+        for match in pattern.finditer(plan_content):
             step_number += 1
             
             if len(match.groups()) == 2:
@@ -72,8 +92,8 @@ def parse_plan_steps(plan_content: str) -> List[PlanStep]:
             optional = 'optional' in title.lower()
             
             # Clean up title (remove formatting)
-            title = re.sub(r'\*\*(.+?)\*\*', r'\1', title)  # Remove **bold**
-            title = re.sub(r'\*(.+?)\*', r'\1', title)      # Remove *italic*
+            title = _BOLD_RE.sub(r'\1', title)    # Remove **bold**
+            title = _ITALIC_RE.sub(r'\1', title)  # Remove *italic*
             
             steps.append(PlanStep(
                 step_number=step_number,
@@ -82,7 +102,7 @@ def parse_plan_steps(plan_content: str) -> List[PlanStep]:
                 optional=optional
             ))
     
-    return steps
+    return tuple(steps)
 
 
 def extract_executed_steps_from_output(output: str) -> List[str]:
@@ -97,17 +117,8 @@ def extract_executed_steps_from_output(output: str) -> List[str]:
     executed = []
     
     # Look for completed step indicators
-    patterns = [
-        r'(?:✓|✔|→|\*)\s*(?:Step\s+)?(\d+)[.:]\s*(.+?)(?:\n|$)',
-        r'(?:✓|✔)\s+(.+?)(?:\n|$)',
-        r'Completed[:\s]+(?:Step\s+)?(\d+)?:?\s*(.+?)(?:\n|$)',
-        r'Successfully\s+(?:executed|ran|completed)[:\s]+(.+?)(?:\n|$)',
-        r'(?:Step|step)\s+(\d+).*?:?\s*(.+?)(?:\n|$)',
-    ]
-    
-    for pattern in patterns:
-        matches = re.finditer(pattern, output, re.IGNORECASE)
-        for match in matches:
+    for pattern in _EXECUTED_STEP_PATTERNS:
+        for match in pattern.finditer(output):
             if len(match.groups()) >= 1:
                 step_text = match.group(0)
                 executed.append(step_text.strip())
@@ -144,22 +155,26 @@ def cross_reference_plan_output(
         # Extract executed steps from output
         executed_steps = extract_executed_steps_from_output(output)
         
+        # Lowercase the executed steps once and search them as one string.
+        # Step numbers and titles never contain a newline, so a match in the
+        # joined text is a match within a single executed step
+        executed_text = "\n".join(executed_steps).lower()
+        
         # Match executed steps to plan steps
         matched_steps = []
         missing_steps = []
         optional_skipped = []
         
         for plan_step in plan_steps:
-            step_matched = False
-            
             # Look for this step in executed steps
-            for executed in executed_steps:
-                if str(plan_step.step_number) in executed or plan_step.title.lower() in executed.lower():
-                    step_matched = True
-                    matched_steps.append(plan_step.title)
-                    break
+            step_matched = bool(executed_steps) and (
+                str(plan_step.step_number) in executed_text
+                or plan_step.title.lower() in executed_text
+            )
             
-            if not step_matched:
+            if step_matched:
+                matched_steps.append(plan_step.title)
+            else:
                 if plan_step.optional:
                     optional_skipped.append(plan_step.title)
                 else:
@@ -3,6 +3,7 @@ import requests
 import json
 from typing import Optional, Tuple, Dict, Any
 from urllib.parse import urlparse
+from requests.adapters import HTTPAdapter
 
 from .base import RepoProvider
 
@@ -10,6 +11,23 @@ from .base import RepoProvider
 class BitbucketProvider(RepoProvider):
     """Bitbucket implementation of RepoProvider."""
 
+    def __init__(self) -> None:
+        self._session: Optional[requests.Session] = None
+
+    def _get_session(self) -> requests.Session:
+        """
+        Get the HTTP session for Bitbucket API calls, creating it on first use.
+
+        A PR update checks for the PR and then PUTs to it, and a workflow checks
+        connectivity before that; one keep-alive connection to api.bitbucket.org
+        saves a TCP/TLS handshake on each call after the first.
+        """
+        if self._session is None:
+            session = requests.Session()
+            session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=4))
+            self._session = session
+        return self._session
+
     def get_credentials(self) -> Tuple[str, str, str]:
         """Get Bitbucket credentials from environment variables."""
         workspace = os.getenv("BITBUCKET_WORKSPACE")
@@ -48,11 +66,21 @@ class BitbucketProvider(RepoProvider):
                 "Accept": "application/json",
             }
 
+            # Let Bitbucket filter by source branch (BBQL) and trim the payload
+            # to the fields used below, instead of paging through every open PR
+            branch_literal = branch_name.replace("\\", "\\\\").replace('"', '\\"')
             params = {
                 "state": "OPEN",
+                "q": f'source.branch.name="{branch_literal}"',
+                "fields": (
+                    "values.id,values.title,values.links.html.href,"
+                    "values.source.branch.name"
+                ),
             }
 
-            response = requests.get(url, headers=headers, params=params, timeout=10)
+            response = self._get_session().get(
+                url, headers=headers, params=params, timeout=10
+            )
             response.raise_for_status()
 
             data = response.json()
@@ -108,7 +136,9 @@ class BitbucketProvider(RepoProvider):
                 },
             }
 
-            response = requests.post(url, headers=headers, json=payload, timeout=10)
+            response = self._get_session().post(
+                url, headers=headers, json=payload, timeout=10
+            )
             response.raise_for_status()
 
             pr_data = response.json()
@@ -150,7 +180,9 @@ class BitbucketProvider(RepoProvider):
                 "description": description,
             }
 
-            response = requests.put(url, headers=headers, json=payload, timeout=10)
+            response = self._get_session().put(
+                url, headers=headers, json=payload, timeout=10
+            )
             response.raise_for_status()
 
             pr_url = pr_info["url"]
@@ -177,7 +209,7 @@ class BitbucketProvider(RepoProvider):
                 "Accept": "application/json",
             }
 
-            response = requests.get(api_url, headers=headers, timeout=10)
+            response = self._get_session().get(api_url, headers=headers, timeout=10)
             response.raise_for_status()
 
             user_data = response.json()
@@ -9,13 +9,25 @@ from .base import RepoProvider
 class GitHubProvider(RepoProvider):
     """GitHub implementation of RepoProvider using 'gh' CLI."""
 
+    def __init__(self) -> None:
+        # Repo context resolved by the first get_credentials() call
+        self._credentials: Optional[Tuple[str, str, str]] = None
+
     def get_credentials(self) -> Tuple[str, str, str]:
         """
         Get GitHub credentials.
 
         For GitHub CLI, we assume authentication is already handled via 'gh auth login'.
         However, to satisfy the interface, we can try to retrieve the current user and repo context.
+        The repo context does not change during a run, so the 'gh repo view' lookup
+        runs once per provider and later calls return the same tuple.
         """
+        if self._credentials is None:
+            self._credentials = self._lookup_credentials()
+        return self._credentials
+
+    def _lookup_credentials(self) -> Tuple[str, str, str]:
+        """Resolve owner, repo and token via 'gh repo view' or env vars."""
         # We try to get the current repo from the git config or gh context
         try:
             # Get owner/repo
@@ -22,7 +22,8 @@ T = TypeVar('T')
 
 def make_adw_id() -> str:
     """Generate a short 8-character UUID for ADW tracking."""
-    return str(uuid.uuid4())[:8]
+    # Same 8 hex digits as str(uuid4())[:8], without formatting the dashes
+    return uuid.uuid4().hex[:8]
 
 
 def setup_logger(
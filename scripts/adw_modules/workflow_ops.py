@@ -1189,7 +1189,6 @@ def generate_e2e_test_scenario(
         Path to the generated E2E test file, or None if failed
     """
     from .config import config
-    import os
 
     # Skip if E2E auto-generation is disabled
     if not config.e2e_tests_auto_generate:
@@ -48,6 +48,15 @@ class TestParsePlanSteps:
         steps = parse_plan_steps(PLAN_WITH_OPTIONAL)
         assert any(s.optional for s in steps)
     
+    def test_parse_plan_returns_independent_copies(self):
+        """Test repeat parses of one plan do not share step objects."""
+        first = parse_plan_steps(SAMPLE_PLAN)
+        first[0].title = "changed"
+        first.pop()
+        second = parse_plan_steps(SAMPLE_PLAN)
+        assert second[0].title != "changed"
+        assert len(second) == len(first) + 1
+    
     def test_parse_empty_plan(self):
         """Test parsing empty plan."""
         steps = parse_plan_steps("")
@@ -123,6 +132,14 @@ class TestCrossReferencePlanOutput:
         assert result is not None
         # Optional steps may be skipped
         assert hasattr(result, 'optional_steps_skipped')
+    
+    def test_cross_reference_matches_titles_case_insensitively(self):
+        """Test titles match an executed step regardless of case."""
+        plan = "## Step 7: Add Login Form\n## Step 8: Write Docs\n"
+        output = "✓ add login form\n"
+        result = cross_reference_plan_output(plan, output)
+        assert result.executed_steps == 1
+        assert result.missing_steps == ["Write Docs"]
 
 
 class TestIdentifyMissingSteps:
@@ -49,3 +49,30 @@ def temp_logs_dir():
     """
     with tempfile.TemporaryDirectory() as tmpdir:
         yield Path(tmpdir)
+
+
+@pytest.fixture(autouse=True)
+def isolated_logs_dir(tmp_path_factory):
+    """Point the shared config's logs directory at a temporary path.
+
+    Agent and HTTP client code writes prompt and response logs under
+    ``config.logs_dir``; without this every test run would leave files in
+    the checkout's docs directory.
+
+    Yields:
+        Path: Temporary docs directory that ``config.logs_dir`` lives under
+    """
+    import sys
+    from unittest.mock import patch
+
+    docs_dir = tmp_path_factory.mktemp("docs")
+    patches = [
+        patch.dict(sys.modules[name].config._data, {"docs_dir": str(docs_dir)})
+        for name in ("adw_modules.config", "scripts.adw_modules.config")
+        if name in sys.modules
+    ]
+    for p in patches:
+        p.start()
+    yield docs_dir
+    for p in patches:
+        p.stop()
@@ -0,0 +1,64 @@
+import json
+import unittest
+from unittest.mock import patch, MagicMock
+from scripts.adw_modules.repo.bitbucket import BitbucketProvider
+from scripts.adw_modules.repo.github import GitHubProvider
+
+BITBUCKET_ENV = {
+    "BITBUCKET_WORKSPACE": "team",
+    "BITBUCKET_REPO_NAME": "repo",
+    "BITBUCKET_API_TOKEN": "token",
+}
+
+
+class TestGitHubProviderCredentials(unittest.TestCase):
+    @patch("subprocess.run")
+    def test_repo_context_looked_up_once(self, mock_run):
+        mock_run.return_value = MagicMock(
+            stdout=json.dumps({"owner": {"login": "octo"}, "name": "repo"})
+        )
+        provider = GitHubProvider()
+
+        self.assertEqual(provider.get_credentials()[:2], ("octo", "repo"))
+        self.assertEqual(provider.get_repo_url(), "https://github.com/octo/repo")
+        self.assertEqual(mock_run.call_count, 1)
+
+
+class TestBitbucketProviderSession(unittest.TestCase):
+    @patch.dict("os.environ", BITBUCKET_ENV)
+    @patch("requests.Session")
+    def test_api_calls_share_one_session(self, mock_session_class):
+        session = mock_session_class.return_value
+        session.get.return_value.json.return_value = {"values": []}
+        provider = BitbucketProvider()
+
+        self.assertIsNone(provider.check_pr_exists("feature"))
+        self.assertTrue(provider.check_connectivity()["success"])
+
+        mock_session_class.assert_called_once()
+        self.assertEqual(session.get.call_count, 2)
+        headers = session.get.call_args_list[0][1]["headers"]
+        self.assertEqual(headers["Authorization"], "Bearer token")
+
+    @patch.dict("os.environ", BITBUCKET_ENV)
+    @patch("requests.Session")
+    def test_pr_lookup_filtered_by_branch_on_server(self, mock_session_class):
+        session = mock_session_class.return_value
+        session.get.return_value.json.return_value = {
+            "values": [
+                {
+                    "id": 7,
+                    "title": "Add feature",
+                    "links": {"html": {"href": "https://bitbucket.org/pr/7"}},
+                    "source": {"branch": {"name": 'feat-"x"'}},
+                }
+            ]
+        }
+
+        pr = BitbucketProvider().check_pr_exists('feat-"x"')
+
+        self.assertEqual(pr["id"], 7)
+        self.assertEqual(pr["url"], "https://bitbucket.org/pr/7")
+        params = session.get.call_args[1]["params"]
+        self.assertEqual(params["state"], "OPEN")
+        self.assertEqual(params["q"], 'source.branch.name="feat-\\"x\\""')
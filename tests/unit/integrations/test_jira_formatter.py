@@ -0,0 +1,152 @@
+"""
+Tests for Jira comment formatting helpers.
+
+Covers the markdown produced by jira_formatter for implementation summaries
+and validation reports.
+"""
+
+import pytest
+from scripts.adw_modules.data_types import AgentPromptResponse
+from scripts.adw_modules.jira_formatter import (
+    format_error_summary,
+    format_implementation_summary,
+    format_metrics_only,
+    format_validation_report,
+)
+from scripts.adw_modules.plan_validator import PlanValidationResult
+
+
+class TestMetricsFormatting:
+    """Metrics must render consistently across the formatters."""
+
+    def test_metrics_only_skips_unset_metrics(self):
+        response = AgentPromptResponse(
+            output="", success=True, files_changed=3, lines_removed=2
+        )
+
+        assert format_metrics_only(response) == "3 files | -2 lines"
+
+    def test_metrics_only_without_metrics(self):
+        response = AgentPromptResponse(output="", success=True)
+
+        assert format_metrics_only(response) == "No metrics available"
+
+    def test_summary_lists_present_metrics(self):
+        response = AgentPromptResponse(
+            output="",
+            success=True,
+            files_changed=3,
+            lines_added=10,
+            test_results="5 passed",
+        )
+
+        summary = format_implementation_summary(response)
+
+        assert (
+            "### Implementation Metrics\n"
+            "- **Files Changed:** 3\n"
+            "- **Lines Added:** 10\n"
+            "- **Test Results:** 5 passed"
+        ) in summary
+
+    def test_report_table_defaults_unset_metrics_to_zero(self):
+        response = AgentPromptResponse(output="", success=True, lines_added=7)
+
+        report = format_validation_report(response)
+
+        assert "| Files Changed | 0 |" in report
+        assert "| Lines Added | 7 |" in report
+        assert "| Lines Removed | 0 |" in report
+
+
+class TestFormatValidationReport:
+    """Tests for format_validation_report."""
+
+    def test_issues_list_errors_before_warnings(self):
+        response = AgentPromptResponse(
+            output="",
+            success=False,
+            errors=["boom"],
+            warnings=["careful", "again"],
+        )
+
+        report = format_validation_report(response)
+
+        assert (
+            "### Issues Found\n"
+            "- 🔴 ERROR: boom\n"
+            "- ⚠️ WARNING: careful\n"
+            "- ⚠️ WARNING: again"
+        ) in report
+
+    def test_report_has_no_trailing_whitespace(self):
+        response = AgentPromptResponse(
+            output="", success=True, test_results="3 passed\n"
+        )
+
+        report = format_validation_report(response)
+
+        assert report.endswith("### Test Results\n3 passed")
+
+    def test_issues_section_omitted_without_errors_or_warnings(self):
+        response = AgentPromptResponse(
+            output="", success=True, errors=[], warnings=None
+        )
+
+        report = format_validation_report(response)
+
+        assert "### Issues Found" not in report
+
+
+class TestPlanExecutionFormatting:
+    """Plan validation details in summaries and reports."""
+
+    def test_summary_and_report_list_missing_steps(self):
+        response = AgentPromptResponse(output="", success=False)
+        plan_validation = PlanValidationResult(
+            plan_valid=False,
+            total_steps=4,
+            executed_steps=2,
+            missing_steps=["Add model", "Write docs"],
+            optional_steps_skipped=["Polish"],
+        )
+
+        summary = format_implementation_summary(response, plan_validation)
+        report = format_validation_report(response, plan_validation)
+
+        assert "- **Steps Executed:** 2/4" in summary
+        assert "- **Missing Steps:** Add model, Write docs" in summary
+        assert "- **Optional Steps Skipped:** Polish" in summary
+        assert "- Steps: 2/4\n- Missing: Add model, Write docs" in report
+
+
+class TestFormatImplementationSummary:
+    """Tests for format_implementation_summary."""
+
+    def test_plain_success_is_header_only(self):
+        response = AgentPromptResponse(output="done", success=True)
+
+        summary = format_implementation_summary(response)
+
+        assert summary == "## ✅ Implementation Completed Successfully"
+
+    def test_success_with_warnings_keeps_full_summary(self):
+        response = AgentPromptResponse(
+            output="done", success=True, warnings=["slow test"]
+        )
+
+        summary = format_implementation_summary(response)
+
+        assert summary.startswith("## ✅ Implementation Completed Successfully")
+        assert "### ⚠️ Warnings\n- slow test" in summary
+
+
+class TestFormatErrorSummary:
+    """Tests for format_error_summary."""
+
+    def test_uses_first_output_line_when_no_errors(self):
+        response = AgentPromptResponse(
+            output="Build broke\nstack trace...", success=False
+        )
+
+        assert format_error_summary(response) == "❌ Implementation failed: Build broke"
@@ -16,6 +16,23 @@ import sys
 # - temp_logs_dir
 
 
+@pytest.fixture(autouse=True)
+def reset_opencode_class_state():
+    """Keep health check state from leaking between tests.
+
+    The client is imported both as adw_modules.* and scripts.adw_modules.*,
+    so each loaded copy is reset.
+    """
+    yield
+    for name in (
+        "adw_modules.opencode_http_client",
+        "scripts.adw_modules.opencode_http_client",
+    ):
+        module = sys.modules.get(name)
+        if module is not None:
+            module.OpenCodeHTTPClient.reset_health_cache()
+
+
 @pytest.fixture
 def mock_opencode_http_client():
     """Mock OpenCodeHTTPClient for unit testing.
@@ -4,22 +4,28 @@ Tests for session management, connection, requests, timeouts, and context manage
 Story 1.1: Create OpenCodeHTTPClient class with session management
 """
 
+import gzip
 import pytest
 import uuid
 import json
 import requests
-from unittest.mock import Mock, patch, MagicMock
+import socket
+import threading
+from unittest.mock import Mock, patch, MagicMock, PropertyMock
 from pathlib import Path
 import sys
 
 # Add scripts to path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "scripts"))
 
+from adw_modules import opencode_http_client
 from adw_modules.opencode_http_client import (
     OpenCodeHTTPClient,
     OpenCodeHTTPClientError,
     OpenCodeConnectionError,
     OpenCodeAuthenticationError,
+    MODEL_HEAVY_LIFTING,
+    MODEL_LIGHTWEIGHT,
 )
 
 
@@ -46,10 +52,16 @@ class TestOpenCodeHTTPClientSessionManagement:
         mock_session_response = MagicMock()
         mock_session_response.status_code = 201
         mock_session_response.json.return_value = {"id": "test-session-uuid"}
+        mock_session_response.content = json.dumps(
+            mock_session_response.json.return_value
+        ).encode()
 
         mock_message_response = MagicMock()
         mock_message_response.status_code = 200
         mock_message_response.json.return_value = {"info": {}, "parts": []}
+        mock_message_response.content = json.dumps(
+            mock_message_response.json.return_value
+        ).encode()
 
         mock_session.post.side_effect = [mock_session_response, mock_message_response]
         client._session = mock_session
@@ -74,9 +86,13 @@ class TestOpenCodeHTTPClientSessionManagement:
         mock_session_resp1 = MagicMock()
         mock_session_resp1.status_code = 201
         mock_session_resp1.json.return_value = {"id": "session-uuid-1"}
+        mock_session_resp1.content = json.dumps(
+            mock_session_resp1.json.return_value
+        ).encode()
         mock_msg_resp1 = MagicMock()
         mock_msg_resp1.status_code = 200
         mock_msg_resp1.json.return_value = {"info": {}, "parts": []}
+        mock_msg_resp1.content = json.dumps(mock_msg_resp1.json.return_value).encode()
         mock_session1.post.side_effect = [mock_session_resp1, mock_msg_resp1]
         client1._session = mock_session1
 
@@ -84,9 +100,13 @@ class TestOpenCodeHTTPClientSessionManagement:
         mock_session_resp2 = MagicMock()
         mock_session_resp2.status_code = 201
         mock_session_resp2.json.return_value = {"id": "session-uuid-2"}
+        mock_session_resp2.content = json.dumps(
+            mock_session_resp2.json.return_value
+        ).encode()
         mock_msg_resp2 = MagicMock()
         mock_msg_resp2.status_code = 200
         mock_msg_resp2.json.return_value = {"info": {}, "parts": []}
+        mock_msg_resp2.content = json.dumps(mock_msg_resp2.json.return_value).encode()
         mock_session2.post.side_effect = [mock_session_resp2, mock_msg_resp2]
         client2._session = mock_session2
 
@@ -111,9 +131,13 @@ class TestOpenCodeHTTPClientSessionManagement:
         mock_session_resp = MagicMock()
         mock_session_resp.status_code = 201
         mock_session_resp.json.return_value = {"id": "test-session-id"}
+        mock_session_resp.content = json.dumps(
+            mock_session_resp.json.return_value
+        ).encode()
         mock_msg_resp = MagicMock()
         mock_msg_resp.status_code = 200
         mock_msg_resp.json.return_value = {"info": {}, "parts": []}
+        mock_msg_resp.content = json.dumps(mock_msg_resp.json.return_value).encode()
         mock_session.post.side_effect = [mock_session_resp, mock_msg_resp]
         client._session = mock_session
 
@@ -237,6 +261,23 @@ class TestOpenCodeHTTPClientErrorHandling:
             or "http" in str(exc_info.value).lower()
         )
 
+    @pytest.mark.parametrize(
+        "server_url",
+        ["localhost:4096", "http://", "http:// localhost", "//localhost:4096"],
+    )
+    def test_urls_without_scheme_and_host_are_rejected(self, server_url):
+        """Verify that URLs missing a scheme or host are rejected"""
+        with pytest.raises(ValueError, match="Invalid URL format"):
+            OpenCodeHTTPClient(server_url=server_url)
+
+    @pytest.mark.parametrize(
+        "server_url",
+        ["http://localhost:4096", "https://opencode.example.com/", "http://[::1]:80"],
+    )
+    def test_valid_urls_are_accepted(self, server_url):
+        """Verify that scheme://host URLs are accepted"""
+        assert OpenCodeHTTPClient(server_url=server_url).server_url == server_url
+
 
 class TestOpenCodeHTTPClientContextManager:
     """Test context manager support for OpenCodeHTTPClient"""
@@ -254,9 +295,13 @@ class TestOpenCodeHTTPClientContextManager:
             mock_session_resp = MagicMock()
             mock_session_resp.status_code = 201
             mock_session_resp.json.return_value = {"id": "test-session-id"}
+            mock_session_resp.content = json.dumps(
+                mock_session_resp.json.return_value
+            ).encode()
             mock_msg_resp = MagicMock()
             mock_msg_resp.status_code = 200
             mock_msg_resp.json.return_value = {"info": {}, "parts": []}
+            mock_msg_resp.content = json.dumps(mock_msg_resp.json.return_value).encode()
             mock_session.post.side_effect = [mock_session_resp, mock_msg_resp]
             client._session = mock_session
 
@@ -279,9 +324,15 @@ class TestOpenCodeHTTPClientContextManager:
                 mock_session_resp = MagicMock()
                 mock_session_resp.status_code = 201
                 mock_session_resp.json.return_value = {"id": "test-session-id"}
+                mock_session_resp.content = json.dumps(
+                    mock_session_resp.json.return_value
+                ).encode()
                 mock_msg_resp = MagicMock()
                 mock_msg_resp.status_code = 200
                 mock_msg_resp.json.return_value = {"info": {}, "parts": []}
+                mock_msg_resp.content = json.dumps(
+                    mock_msg_resp.json.return_value
+                ).encode()
                 mock_session.post.side_effect = [mock_session_resp, mock_msg_resp]
                 client._session = mock_session
 
@@ -327,6 +378,9 @@ class TestOpenCodeHTTPClientSendPromptCore:
         mock_http_response = MagicMock()
         mock_http_response.status_code = 200
         mock_http_response.json.return_value = mock_response
+        mock_http_response.content = json.dumps(
+            mock_http_response.json.return_value
+        ).encode()
         mock_session.post.return_value = mock_http_response
         client._session = mock_session
 
@@ -384,6 +438,7 @@ class TestOpenCodeHTTPClientSendPromptCore:
         mock_response = MagicMock()
         mock_response.status_code = 200
         mock_response.json.return_value = {"message": {"content": "test"}, "parts": []}
+        mock_response.content = json.dumps(mock_response.json.return_value).encode()
         mock_session.post.return_value = mock_response
         client._session = mock_session
 
@@ -393,6 +448,28 @@ class TestOpenCodeHTTPClientSendPromptCore:
         call_kwargs = mock_session.post.call_args[1]
         assert call_kwargs["timeout"] == 10.0
 
+    def test_send_prompt_uses_lightweight_timeout_for_configured_model(self):
+        """The configured lightweight model gets lightweight_timeout by ID, not name"""
+        client = OpenCodeHTTPClient(
+            server_url="http://localhost:8000",
+            timeout=30.0,
+            lightweight_timeout=10.0,
+        )
+
+        mock_session = MagicMock()
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {"message": {"content": "test"}, "parts": []}
+        mock_response.content = json.dumps(mock_response.json.return_value).encode()
+        mock_session.post.return_value = mock_response
+        client._session = mock_session
+
+        with patch("adw_modules.opencode_http_client.config") as mock_config:
+            mock_config.opencode_model_lightweight = "openai/gpt-4o-mini"
+            client.send_prompt(prompt="Hello", task_type="classify")
+
+        assert mock_session.post.call_args[1]["timeout"] == 10.0
+
     def test_send_prompt_uses_heavy_timeout_for_sonnet_model(self):
         """send_prompt() should use default timeout for Sonnet models"""
         server_url = "http://localhost:8000"
@@ -406,6 +483,7 @@ class TestOpenCodeHTTPClientSendPromptCore:
         mock_response = MagicMock()
         mock_response.status_code = 200
         mock_response.json.return_value = {"message": {"content": "test"}, "parts": []}
+        mock_response.content = json.dumps(mock_response.json.return_value).encode()
         mock_session.post.return_value = mock_response
         client._session = mock_session
 
@@ -428,6 +506,7 @@ class TestOpenCodeHTTPClientSendPromptCore:
         mock_response = MagicMock()
         mock_response.status_code = 200
         mock_response.json.return_value = {"message": {"content": "test"}, "parts": []}
+        mock_response.content = json.dumps(mock_response.json.return_value).encode()
         mock_session.post.return_value = mock_response
         client._session = mock_session
 
@@ -451,11 +530,17 @@ class TestOpenCodeHTTPClientSendPromptCore:
         mock_session_response = MagicMock()
         mock_session_response.status_code = 201
         mock_session_response.json.return_value = {"id": "test-session-uuid"}
+        mock_session_response.content = json.dumps(
+            mock_session_response.json.return_value
+        ).encode()
 
         # Mock message response
         mock_message_response = MagicMock()
         mock_message_response.status_code = 200
         mock_message_response.json.return_value = {"info": {}, "parts": []}
+        mock_message_response.content = json.dumps(
+            mock_message_response.json.return_value
+        ).encode()
 
         mock_session.post.side_effect = [mock_session_response, mock_message_response]
         client._session = mock_session
@@ -481,6 +566,7 @@ class TestOpenCodeHTTPClientSendPromptCore:
         mock_response = MagicMock()
         mock_response.status_code = 200
         mock_response.json.return_value = {"message": {"content": "test"}, "parts": []}
+        mock_response.content = json.dumps(mock_response.json.return_value).encode()
         mock_session.post.return_value = mock_response
         client._session = mock_session
 
@@ -502,11 +588,17 @@ class TestOpenCodeHTTPClientSendPromptCore:
         mock_session_response = MagicMock()
         mock_session_response.status_code = 201
         mock_session_response.json.return_value = {"id": "test-session-uuid"}
+        mock_session_response.content = json.dumps(
+            mock_session_response.json.return_value
+        ).encode()
 
         # Mock message response
         mock_message_response = MagicMock()
         mock_message_response.status_code = 200
         mock_message_response.json.return_value = {"info": {}, "parts": []}
+        mock_message_response.content = json.dumps(
+            mock_message_response.json.return_value
+        ).encode()
 
         mock_session.post.side_effect = [mock_session_response, mock_message_response]
         client._session = mock_session
@@ -519,7 +611,7 @@ class TestOpenCodeHTTPClientSendPromptCore:
         # Verify request body uses OpenCode message format
         # Second call is the message (first is session creation)
         message_call = mock_session.post.call_args_list[1]
-        request_body = message_call[1]["json"]
+        request_body = json.loads(message_call[1]["data"])
 
         # OpenCode format: {parts: [{type: "text", text: "..."}], model: {providerID: "...", modelID: "..."}}
         assert "parts" in request_body
@@ -531,6 +623,36 @@ class TestOpenCodeHTTPClientSendPromptCore:
         assert request_body["model"]["providerID"] == "github-copilot"
         assert request_body["model"]["modelID"] == "claude-sonnet-4"
 
+    @pytest.mark.parametrize("orjson_available", [True, False])
+    def test_encoded_message_body_matches_api_format(self, orjson_available):
+        """The pre-encoded body should decode to the OpenCode message dict"""
+        if orjson_available:
+            pytest.importorskip("orjson")
+        prompt = 'Quote " backslash \\ newline \n unicode é ✓'
+        cases = [
+            ("github-copilot/claude-sonnet-4", "github-copilot", "claude-sonnet-4"),
+            ("claude-haiku-4.5", "github-copilot", "claude-haiku-4.5"),
+        ]
+
+        with patch.object(opencode_http_client, "ORJSON_AVAILABLE", orjson_available):
+            for model_id, provider, model in cases:
+                body = opencode_http_client._encode_message_body(prompt, model_id)
+                assert json.loads(body) == {
+                    "parts": [{"type": "text", "text": prompt}],
+                    "model": {"providerID": provider, "modelID": model},
+                }
+
+    def test_encoded_message_body_keeps_lone_surrogates(self):
+        """A prompt orjson cannot encode should fall back to the stdlib encoder"""
+        pytest.importorskip("orjson")
+        prompt = "truncated emoji \ud83d"
+
+        body = opencode_http_client._encode_message_body(
+            prompt, "github-copilot/claude-sonnet-4"
+        )
+
+        assert json.loads(body)["parts"][0]["text"] == prompt
+
     def test_send_prompt_posts_to_correct_endpoint(self):
         """send_prompt() should POST to /session endpoint and /session/{id}/message endpoint"""
         server_url = "http://localhost:8000"
@@ -541,11 +663,17 @@ class TestOpenCodeHTTPClientSendPromptCore:
         mock_session_response = MagicMock()
         mock_session_response.status_code = 201
         mock_session_response.json.return_value = {"id": "test-session-uuid"}
+        mock_session_response.content = json.dumps(
+            mock_session_response.json.return_value
+        ).encode()
 
         # Mock message response
         mock_message_response = MagicMock()
         mock_message_response.status_code = 200
         mock_message_response.json.return_value = {"info": {}, "parts": []}
+        mock_message_response.content = json.dumps(
+            mock_message_response.json.return_value
+        ).encode()
 
         mock_session.post.side_effect = [mock_session_response, mock_message_response]
         client._session = mock_session
@@ -577,6 +705,7 @@ class TestOpenCodeHTTPClientSendPromptCore:
         mock_response = MagicMock()
         mock_response.status_code = 200
         mock_response.json.return_value = {"message": {"content": "test"}, "parts": []}
+        mock_response.content = json.dumps(mock_response.json.return_value).encode()
         mock_session.post.return_value = mock_response
         client._session = mock_session
 
@@ -587,6 +716,115 @@ class TestOpenCodeHTTPClientSendPromptCore:
         headers = call_kwargs["headers"]
         assert headers["Content-Type"] == "application/json"
 
+    def test_large_bodies_gzipped_when_compression_enabled(self):
+        """
+        Given a client with compress_requests enabled
+        When I send one large and one small prompt
+        Then only the large body is gzipped and marked with Content-Encoding
+        """
+        client = OpenCodeHTTPClient(
+            server_url="http://localhost:8000", compress_requests=True
+        )
+
+        mock_session = MagicMock()
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {"parts": []}
+        mock_response.content = json.dumps(mock_response.json.return_value).encode()
+        mock_session.post.return_value = mock_response
+        client._session = mock_session
+        client.session_id = "ses-1"
+
+        large = "diff --git a/x b/x\n" * 200
+        client.send_prompt(prompt=large, model_id="github-copilot/claude-sonnet-4")
+        kwargs = mock_session.post.call_args[1]
+        assert kwargs["headers"]["Content-Encoding"] == "gzip"
+        assert len(kwargs["data"]) < len(large)
+        body = json.loads(gzip.decompress(kwargs["data"]))
+        assert body["parts"][0]["text"] == large
+
+        client.send_prompt(prompt="Hi", model_id="github-copilot/claude-sonnet-4")
+        kwargs = mock_session.post.call_args[1]
+        assert "Content-Encoding" not in kwargs["headers"]
+        assert json.loads(kwargs["data"])["parts"][0]["text"] == "Hi"
+
+    def test_bodies_sent_uncompressed_by_default(self):
+        """Without compress_requests even large bodies go out as plain JSON"""
+        client = OpenCodeHTTPClient(server_url="http://localhost:8000")
+
+        mock_session = MagicMock()
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {"parts": []}
+        mock_response.content = json.dumps(mock_response.json.return_value).encode()
+        mock_session.post.return_value = mock_response
+        client._session = mock_session
+        client.session_id = "ses-1"
+
+        large = "x" * 4096
+        client.send_prompt(prompt=large, model_id="github-copilot/claude-sonnet-4")
+
+        kwargs = mock_session.post.call_args[1]
+        assert "Content-Encoding" not in kwargs["headers"]
+        assert json.loads(kwargs["data"])["parts"][0]["text"] == large
+
+    def test_health_check_sends_only_auth_header(self):
+        """_verify_connection() should hit /global/health with just the API key"""
+        client = OpenCodeHTTPClient(server_url="http://localhost:8000/", api_key="k")
+
+        mock_session = MagicMock()
+        mock_session.get.return_value.status_code = 200
+        client._session = mock_session
+
+        client._verify_connection()
+
+        call_args = mock_session.get.call_args
+        assert call_args[0][0] == "http://localhost:8000/global/health"
+        assert call_args[1]["headers"] == {"Authorization": "Bearer k"}
+
+    def test_health_check_result_reused_within_ttl(self):
+        """
+        Given a client that just verified the server
+        When another client for the same server and key verifies
+        Then no second /global/health request is made until the cache is reset
+        """
+        first = OpenCodeHTTPClient(server_url="http://localhost:8000", api_key="k")
+        first._session = MagicMock()
+        first._session.get.return_value.status_code = 200
+        first._verify_connection()
+
+        second = OpenCodeHTTPClient(server_url="http://localhost:8000", api_key="k")
+        second._session = MagicMock()
+        second._session.get.return_value.status_code = 200
+        second._verify_connection()
+        assert second._session.get.call_count == 0
+        assert second._is_authenticated is True
+
+        other_key = OpenCodeHTTPClient(
+            server_url="http://localhost:8000", api_key="other"
+        )
+        other_key._session = MagicMock()
+        other_key._session.get.return_value.status_code = 401
+        with pytest.raises(OpenCodeAuthenticationError):
+            other_key._verify_connection()
+
+        OpenCodeHTTPClient.reset_health_cache()
+        second._verify_connection()
+        assert second._session.get.call_count == 1
+
+    def test_zero_health_cache_ttl_checks_every_time(self):
+        """health_cache_ttl=0 should send the health check on every verify"""
+        client = OpenCodeHTTPClient(
+            server_url="http://localhost:8000", health_cache_ttl=0
+        )
+        client._session = MagicMock()
+        client._session.get.return_value.status_code = 200
+
+        client._verify_connection()
+        client._verify_connection()
+
+        assert client._session.get.call_count == 2
+
     def test_send_prompt_creates_session_if_not_exists(self):
         """send_prompt() should create a session if one doesn't exist"""
         server_url = "http://localhost:8000"
@@ -599,6 +837,7 @@ class TestOpenCodeHTTPClientSendPromptCore:
         mock_response = MagicMock()
         mock_response.status_code = 200
         mock_response.json.return_value = {"message": {"content": "test"}, "parts": []}
+        mock_response.content = json.dumps(mock_response.json.return_value).encode()
         mock_session.post.return_value = mock_response
 
         with patch("requests.Session", return_value=mock_session):
@@ -610,5 +849,298 @@ class TestOpenCodeHTTPClientSendPromptCore:
         assert client._session is not None
 
 
+
+class TestOpenCodeHTTPClientConnectionPool:
+    """Test suite for the connection pool shared across clients"""
+
+    def test_sessions_share_one_pooled_adapter(self):
+        """
+        Given two short-lived clients for the same OpenCode host
+        When each creates its requests.Session
+        Then both mount the same pooled adapter so keep-alive connections are reused
+        """
+        client1 = OpenCodeHTTPClient(server_url="http://localhost:8000")
+        client2 = OpenCodeHTTPClient(server_url="http://localhost:8000")
+
+        adapter1 = client1._get_session().get_adapter("http://localhost:8000/session")
+        adapter2 = client2._get_session().get_adapter("http://localhost:8000/session")
+
+        assert adapter1 is adapter2
+        # urllib3 retries nothing; every retry and wait is ours
+        assert adapter1.max_retries.total == 0
+
+    def test_pools_do_not_sleep_on_retry_after(self):
+        """
+        Given a 429 whose Retry-After is far beyond RATE_LIMIT_MAX_WAIT
+        When the shared requests and urllib3 pools see it
+        Then neither retries (and so sleeps) before send_prompt applies its cap
+        """
+        client = OpenCodeHTTPClient(server_url="http://localhost:8000")
+        adapter = client._get_session().get_adapter("http://localhost:8000")
+
+        pool = opencode_http_client._shared_pool()
+
+        for retry in (adapter.max_retries, pool.connection_pool_kw["retries"]):
+            assert not retry.is_retry("POST", 429, has_retry_after=True)
+
+    def test_pool_sizes_come_from_config(self):
+        """The shared adapter should be sized from ADWConfig when first built"""
+        config_type = type(opencode_http_client.config)
+        with patch.object(opencode_http_client, "_SHARED_ADAPTER", None):
+            with patch.object(
+                config_type, "opencode_pool_maxsize", new_callable=PropertyMock
+            ) as mock_maxsize:
+                mock_maxsize.return_value = 5
+                client = OpenCodeHTTPClient(server_url="http://localhost:8000")
+                adapter = client._get_session().get_adapter("http://localhost:8000")
+
+        assert adapter._pool_maxsize == 5
+
+    def test_pooled_sockets_disable_nagle_and_keep_alive(self):
+        """Both shared pools should open sockets with TCP_NODELAY and keepalive"""
+        client = OpenCodeHTTPClient(server_url="http://localhost:8000")
+        adapter = client._get_session().get_adapter("http://localhost:8000")
+
+        for pool_kwargs in (
+            adapter.poolmanager.connection_pool_kw,
+            opencode_http_client._shared_pool().connection_pool_kw,
+        ):
+            options = pool_kwargs["socket_options"]
+            assert (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1) in options
+            assert (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1) in options
+
+    def test_close_session_keeps_pool_for_other_clients(self):
+        """close_session() should not drop the connections other clients reuse"""
+        client = OpenCodeHTTPClient(server_url="http://localhost:8000")
+        adapter = client._get_session().get_adapter("http://localhost:8000")
+
+        with patch.object(adapter.poolmanager, "clear") as mock_clear:
+            client.close_session()
+            mock_clear.assert_not_called()
+
+            OpenCodeHTTPClient.shutdown_pool()
+            mock_clear.assert_called_once()
+
+        assert client._session is None
+
+    def test_health_checks_reuse_the_client_pool(self):
+        """check_opencode_server_available() should not open a fresh session per call"""
+        session = opencode_http_client._health_session()
+        client = OpenCodeHTTPClient(server_url="http://localhost:8000")
+
+        assert session is opencode_http_client._health_session()
+        assert session.get_adapter("http://localhost:8000") is (
+            client._get_session().get_adapter("http://localhost:8000")
+        )
+
+        with patch.object(session, "get") as mock_get:
+            mock_get.return_value.status_code = 200
+            assert opencode_http_client.check_opencode_server_available(
+                "http://localhost:8000/"
+            )
+        mock_get.assert_called_once_with(
+            "http://localhost:8000/global/health", timeout=5.0
+        )
+
+    def test_health_check_results_reused_briefly(self):
+        """Repeat checks of one server within the TTL share a single request"""
+        session = opencode_http_client._health_session()
+
+        with patch.object(session, "get") as mock_get, patch(
+            "adw_modules.opencode_http_client.time.monotonic"
+        ) as mock_clock:
+            mock_get.return_value.status_code = 200
+            mock_clock.return_value = 100.0
+            assert opencode_http_client.check_opencode_server_available(
+                "http://localhost:8000"
+            )
+            assert opencode_http_client.check_opencode_server_available(
+                "http://localhost:8000/"
+            )
+            assert mock_get.call_count == 1
+
+            mock_get.return_value.status_code = 503
+            mock_clock.return_value = 100.0 + opencode_http_client._HEALTH_CHECK_TTL
+            assert not opencode_http_client.check_opencode_server_available(
+                "http://localhost:8000"
+            )
+            assert mock_get.call_count == 2
+
+
+class TestOpenCodeHTTPClientDecisionCache:
+    """Test suite for the opt-in cache of lightweight prompt responses"""
+
+    def setup_method(self):
+        OpenCodeHTTPClient.clear_decision_cache()
+
+    def teardown_method(self):
+        OpenCodeHTTPClient.clear_decision_cache()
+
+    @staticmethod
+    def _mock_session():
+        mock_session = MagicMock()
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {"message": {"content": "feat"}, "parts": []}
+        mock_response.content = json.dumps(mock_response.json.return_value).encode()
+        mock_session.post.return_value = mock_response
+        return mock_session
+
+    def test_repeated_classify_prompt_is_served_from_cache(self):
+        """
+        Given a client with the decision cache enabled
+        When the same classify prompt is sent twice
+        Then only the first call reaches the server and callers get independent copies
+        """
+        client = OpenCodeHTTPClient(
+            server_url="http://localhost:8000", enable_decision_cache=True
+        )
+        client.session_id = "ses-1"
+        client._session = self._mock_session()
+
+        first = client.send_prompt(prompt="Issue text", task_type="classify")
+        first["message"]["content"] = "mutated"
+        second = client.send_prompt(prompt="Issue text", task_type="classify")
+
+        assert client._session.post.call_count == 1
+        assert second["message"]["content"] == "feat"
+
+    def test_heavy_tasks_and_disabled_cache_always_hit_server(self):
+        """implement prompts and clients without the flag are never cached"""
+        cached_client = OpenCodeHTTPClient(
+            server_url="http://localhost:8000", enable_decision_cache=True
+        )
+        plain_client = OpenCodeHTTPClient(server_url="http://localhost:8000")
+        cases = [(cached_client, "implement"), (plain_client, "classify")]
+        for client, task_type in cases:
+            client.session_id = "ses-1"
+            client._session = self._mock_session()
+
+            client.send_prompt(prompt="Same prompt", task_type=task_type)
+            client.send_prompt(prompt="Same prompt", task_type=task_type)
+
+            assert client._session.post.call_count == 2
+
+    def test_cache_evicts_least_recently_used(self):
+        """The cache should stay bounded by DECISION_CACHE_SIZE"""
+        client = OpenCodeHTTPClient(
+            server_url="http://localhost:8000", enable_decision_cache=True
+        )
+        client.DECISION_CACHE_SIZE = 2
+        client.session_id = "ses-1"
+        client._session = self._mock_session()
+
+        for prompt in ["a", "b", "a", "c", "a", "b"]:
+            client.send_prompt(prompt=prompt, task_type="commit_msg")
+
+        # "b" was evicted by "c" because "a" had just been used
+        assert client._session.post.call_count == 4
+
+    def test_cache_is_shared_between_clients(self):
+        """A new client per call (as agent.py does) should still get cache hits"""
+        sessions = []
+        for _ in range(2):
+            client = OpenCodeHTTPClient(
+                server_url="http://localhost:8000", enable_decision_cache=True
+            )
+            client.session_id = "ses-1"
+            client._session = self._mock_session()
+            client.send_prompt(prompt="Issue text", task_type="classify")
+            sessions.append(client._session)
+
+        assert sessions[0].post.call_count == 1
+        assert sessions[1].post.call_count == 0
+
+    def test_concurrent_identical_prompts_share_one_request(self):
+        """
+        Given one classify prompt still waiting on the server
+        When another client sends the same prompt
+        Then it waits for the in-flight response instead of sending its own
+        """
+        started, release = threading.Event(), threading.Event()
+        clients = []
+        for _ in range(2):
+            client = OpenCodeHTTPClient(
+                server_url="http://localhost:8000", enable_decision_cache=True
+            )
+            client.session_id = "ses-1"
+            client._session = self._mock_session()
+            clients.append(client)
+        reply = clients[0]._session.post.return_value
+
+        def slow_post(*args, **kwargs):
+            started.set()
+            release.wait(5)
+            return reply
+
+        clients[0]._session.post.side_effect = slow_post
+        results = [None, None]
+
+        def send(index):
+            results[index] = clients[index].send_prompt(
+                prompt="Issue text", task_type="classify"
+            )
+
+        threads = [threading.Thread(target=send, args=(i,)) for i in range(2)]
+        threads[0].start()
+        assert started.wait(5)
+        threads[1].start()
+        threads[1].join(0.1)
+        assert threads[1].is_alive()
+        release.set()
+        for thread in threads:
+            thread.join(5)
+
+        assert clients[0]._session.post.call_count == 1
+        assert clients[1]._session.post.call_count == 0
+        assert results[0] == results[1]
+        assert results[0] is not results[1]
+
+
+class TestOpenCodeHTTPClientTelemetry:
+    """Test suite for per-call timing telemetry"""
+
+    def setup_method(self):
+        OpenCodeHTTPClient.reset_telemetry()
+
+    def teardown_method(self):
+        OpenCodeHTTPClient.reset_telemetry()
+
+    def test_message_calls_are_summarized_per_tier(self):
+        """
+        Given a retried heavy-lifting call and a lightweight call
+        When I call dump_telemetry()
+        Then each tier reports its calls, errors, retries and latency percentiles
+        """
+        client = OpenCodeHTTPClient(server_url="http://localhost:8000")
+        client.session_id = "ses-1"
+
+        server_error = MagicMock()
+        server_error.status_code = 503
+        success = MagicMock()
+        success.status_code = 200
+        success.content = b'{"info": {}, "parts": []}'
+        mock_session = MagicMock()
+        mock_session.post.side_effect = [server_error, success, success]
+        client._session = mock_session
+
+        with patch("time.sleep"):
+            client.send_prompt(prompt="Hi", model_id=MODEL_HEAVY_LIFTING)
+            client.send_prompt(prompt="Hi", model_id=MODEL_LIGHTWEIGHT)
+
+        summary = OpenCodeHTTPClient.dump_telemetry()
+
+        assert summary["heavy_lifting"]["calls"] == 2
+        assert summary["heavy_lifting"]["errors"] == 1
+        assert summary["heavy_lifting"]["retried"] == 1
+        assert summary["lightweight"]["calls"] == 1
+        lightweight = summary["lightweight"]
+        assert 0 <= lightweight["p50_ms"] <= lightweight["p95_ms"]
+
+    def test_empty_telemetry_has_no_tiers(self):
+        """dump_telemetry() should omit tiers that have no recorded calls"""
+        assert OpenCodeHTTPClient.dump_telemetry() == {}
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
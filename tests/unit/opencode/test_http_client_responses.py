@@ -6,14 +6,17 @@ Story 1.2: API Communication with error handling and retries
 
 import pytest
 import json
+import io
 import requests
-from unittest.mock import Mock, patch, MagicMock
+import urllib3
+from unittest.mock import Mock, patch, MagicMock, PropertyMock
 from pathlib import Path
 import sys
 
 # Add scripts to path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "scripts"))
 
+from adw_modules import opencode_http_client
 from adw_modules.opencode_http_client import (
     OpenCodeHTTPClient,
     OpenCodeHTTPClientError,
@@ -39,6 +42,9 @@ class TestOpenCodeHTTPClientResponseErrors:
         mock_session_response = MagicMock()
         mock_session_response.status_code = 201
         mock_session_response.json.return_value = {"id": "test-session-id"}
+        mock_session_response.content = json.dumps(
+            mock_session_response.json.return_value
+        ).encode()
 
         mock_message_response = MagicMock()
         mock_message_response.status_code = 401
@@ -61,6 +67,9 @@ class TestOpenCodeHTTPClientResponseErrors:
         mock_session_response = MagicMock()
         mock_session_response.status_code = 201
         mock_session_response.json.return_value = {"id": "test-session-id"}
+        mock_session_response.content = json.dumps(
+            mock_session_response.json.return_value
+        ).encode()
 
         mock_message_response = MagicMock()
         mock_message_response.status_code = 403
@@ -100,6 +109,9 @@ class TestOpenCodeHTTPClientResponseErrors:
         mock_session_response = MagicMock()
         mock_session_response.status_code = 201
         mock_session_response.json.return_value = {"id": "test-session-id"}
+        mock_session_response.content = json.dumps(
+            mock_session_response.json.return_value
+        ).encode()
 
         mock_message_response = MagicMock()
         mock_message_response.status_code = 401
@@ -125,6 +137,9 @@ class TestOpenCodeHTTPClientResponseErrors:
         mock_session_response = MagicMock()
         mock_session_response.status_code = 201
         mock_session_response.json.return_value = {"id": "test-session-id"}
+        mock_session_response.content = json.dumps(
+            mock_session_response.json.return_value
+        ).encode()
 
         mock_message_response = MagicMock()
         mock_message_response.status_code = 403
@@ -170,6 +185,7 @@ class TestOpenCodeHTTPClientResponseErrors:
         mock_response.status_code = 200
         mock_response.json.side_effect = json.JSONDecodeError("Expecting value", "", 0)
         mock_response.text = "Not valid JSON"
+        mock_response.content = b"Not valid JSON"
         mock_session.post.return_value = mock_response
         client._session = mock_session
 
@@ -196,11 +212,17 @@ class TestOpenCodeHTTPClientRetryLogic:
         mock_session_response = MagicMock()
         mock_session_response.status_code = 201
         mock_session_response.json.return_value = {"id": "test-session-id"}
+        mock_session_response.content = json.dumps(
+            mock_session_response.json.return_value
+        ).encode()
 
         # First 2 message calls timeout, 3rd succeeds
         mock_success_response = MagicMock()
         mock_success_response.status_code = 200
         mock_success_response.json.return_value = {"info": {}, "parts": []}
+        mock_success_response.content = json.dumps(
+            mock_success_response.json.return_value
+        ).encode()
 
         mock_session.post.side_effect = [
             mock_session_response,  # Session creation
@@ -250,11 +272,17 @@ class TestOpenCodeHTTPClientRetryLogic:
         mock_session_response = MagicMock()
         mock_session_response.status_code = 201
         mock_session_response.json.return_value = {"id": "test-session-id"}
+        mock_session_response.content = json.dumps(
+            mock_session_response.json.return_value
+        ).encode()
 
         # First 2 message calls fail with connection error, 3rd succeeds
         mock_success_response = MagicMock()
         mock_success_response.status_code = 200
         mock_success_response.json.return_value = {"info": {}, "parts": []}
+        mock_success_response.content = json.dumps(
+            mock_success_response.json.return_value
+        ).encode()
 
         mock_session.post.side_effect = [
             mock_session_response,  # Session creation
@@ -305,11 +333,17 @@ class TestOpenCodeHTTPClientRetryLogic:
         mock_session_response = MagicMock()
         mock_session_response.status_code = 201
         mock_session_response.json.return_value = {"id": "test-session-id"}
+        mock_session_response.content = json.dumps(
+            mock_session_response.json.return_value
+        ).encode()
 
         # First 2 message calls return 500, 3rd succeeds
         mock_success_response = MagicMock()
         mock_success_response.status_code = 200
         mock_success_response.json.return_value = {"info": {}, "parts": []}
+        mock_success_response.content = json.dumps(
+            mock_success_response.json.return_value
+        ).encode()
 
         error_response = MagicMock()
         error_response.status_code = 500
@@ -343,6 +377,9 @@ class TestOpenCodeHTTPClientRetryLogic:
         mock_session_response = MagicMock()
         mock_session_response.status_code = 201
         mock_session_response.json.return_value = {"id": "test-session-id"}
+        mock_session_response.content = json.dumps(
+            mock_session_response.json.return_value
+        ).encode()
 
         # All message calls return 503
         error_response = MagicMock()
@@ -375,11 +412,17 @@ class TestOpenCodeHTTPClientRetryLogic:
         mock_session_response = MagicMock()
         mock_session_response.status_code = 201
         mock_session_response.json.return_value = {"id": "test-session-id"}
+        mock_session_response.content = json.dumps(
+            mock_session_response.json.return_value
+        ).encode()
 
         # First 2 message calls timeout, 3rd succeeds
         mock_success_response = MagicMock()
         mock_success_response.status_code = 200
         mock_success_response.json.return_value = {"info": {}, "parts": []}
+        mock_success_response.content = json.dumps(
+            mock_success_response.json.return_value
+        ).encode()
 
         mock_session.post.side_effect = [
             mock_session_response,  # Session creation
@@ -394,7 +437,10 @@ class TestOpenCodeHTTPClientRetryLogic:
         def track_sleep(duration):
             sleep_durations.append(duration)
 
-        with patch("time.sleep", side_effect=track_sleep):
+        # Disable jitter so the base delays are observable
+        with patch("time.sleep", side_effect=track_sleep), patch(
+            "random.uniform", return_value=0.0
+        ):
             client.send_prompt(
                 prompt="Hello", model_id="github-copilot/claude-sonnet-4"
             )
@@ -405,5 +451,418 @@ class TestOpenCodeHTTPClientRetryLogic:
         assert sleep_durations[1] == 2.0  # Second retry: 1 * 2^1 = 2s
 
 
+    def test_retry_delay_adds_bounded_jitter(self):
+        """Retry delays should carry up to 50% jitter on top of the base delay"""
+        client = OpenCodeHTTPClient(server_url="http://localhost:8000")
+
+        for attempt, base in [(1, 1.0), (2, 2.0), (3, 4.0)]:
+            delay = client._retry_delay(attempt)
+            assert base <= delay <= base * 1.5
+
+    def test_retry_delay_is_capped(self):
+        """Retry delays should never exceed the cap before jitter is applied"""
+        client = OpenCodeHTTPClient(server_url="http://localhost:8000")
+
+        with patch("random.uniform", return_value=0.0):
+            assert client._retry_delay(10) == client.RETRY_MAX_DELAY
+
+    def test_retry_is_reported_through_module_logger(self, caplog):
+        """Retries should be logged as warnings instead of printed to stderr"""
+        client = OpenCodeHTTPClient(server_url="http://localhost:8000")
+        client.session_id = "ses-1"
+
+        mock_session = MagicMock()
+        error_response = MagicMock()
+        error_response.status_code = 503
+        success_response = MagicMock()
+        success_response.status_code = 200
+        success_response.content = b'{"info": {}, "parts": []}'
+        success_response.json.return_value = {"info": {}, "parts": []}
+        mock_session.post.side_effect = [error_response, success_response]
+        client._session = mock_session
+
+        with patch("time.sleep"), patch("random.uniform", return_value=0.0):
+            with caplog.at_level("WARNING", logger="adw_modules.opencode_http_client"):
+                client.send_prompt(
+                    prompt="Hello", model_id="github-copilot/claude-sonnet-4"
+                )
+
+        assert "Server error 503 (attempt 1/3). Retrying in 1.0s..." in caplog.text
+
+    def test_retried_server_error_body_is_not_downloaded(self):
+        """5xx responses that are retried should be closed without reading the body"""
+        client = OpenCodeHTTPClient(server_url="http://localhost:8000")
+        client.session_id = "ses-1"
+
+        mock_session = MagicMock()
+        error_response = MagicMock()
+        error_response.status_code = 502
+        type(error_response).text = PropertyMock(side_effect=AssertionError("read"))
+        success_response = MagicMock()
+        success_response.status_code = 200
+        success_response.content = b'{"info": {}, "parts": []}'
+        success_response.json.return_value = {"info": {}, "parts": []}
+        mock_session.post.side_effect = [error_response, success_response]
+        client._session = mock_session
+
+        with patch("time.sleep"):
+            client.send_prompt(prompt="Hello", model_id="github-copilot/claude-sonnet-4")
+
+        assert mock_session.post.call_args[1]["stream"] is True
+        error_response.close.assert_called_once()
+        success_response.close.assert_called_once()
+
+    def test_mixed_transient_failures_share_one_retry_budget(self):
+        """
+        Given a timeout, then a dropped connection, then a 503
+        When I call send_prompt()
+        Then they count against the same MAX_RETRIES and the last kind is raised
+        """
+        client = OpenCodeHTTPClient(server_url="http://localhost:8000")
+        client.session_id = "ses-1"
+
+        mock_session = MagicMock()
+        error_response = MagicMock()
+        error_response.status_code = 503
+        error_response.text = "Service Unavailable"
+        mock_session.post.side_effect = [
+            requests.exceptions.Timeout("slow"),
+            requests.exceptions.ConnectionError("reset"),
+            error_response,
+        ]
+        client._session = mock_session
+
+        with patch("time.sleep") as mock_sleep:
+            with pytest.raises(OpenCodeHTTPClientError) as exc_info:
+                client.send_prompt(
+                    prompt="Hello", model_id="github-copilot/claude-sonnet-4"
+                )
+
+        assert "Server error 503: Service Unavailable" in str(exc_info.value)
+        assert "Max retries (3) exhausted" in str(exc_info.value)
+        assert mock_session.post.call_count == client.MAX_RETRIES
+        assert mock_sleep.call_count == client.MAX_RETRIES - 1
+
+    def test_retry_budget_is_not_bounded_by_stack_depth(self):
+        """
+        Given more retries than the interpreter's recursion limit
+        When every attempt times out
+        Then the retries run iteratively and the timeout error is raised
+        """
+        retries = sys.getrecursionlimit() + 100
+        client = OpenCodeHTTPClient(server_url="http://localhost:8000")
+        client.session_id = "ses-1"
+        mock_session = MagicMock()
+        mock_session.post.side_effect = requests.exceptions.Timeout("slow")
+        client._session = mock_session
+
+        with patch.object(OpenCodeHTTPClient, "MAX_RETRIES", retries):
+            with patch("time.sleep"):
+                with pytest.raises(TimeoutError):
+                    client.send_prompt(
+                        prompt="Hello", model_id="github-copilot/claude-sonnet-4"
+                    )
+
+        assert mock_session.post.call_count == retries
+
+    @pytest.mark.parametrize("status", [503, 429])
+    def test_response_closed_before_waiting(self, status):
+        """
+        Given a 503 or a 429 with Retry-After
+        When send_prompt() waits before the next attempt
+        Then the response (and its pooled connection) is released first
+        """
+        client = OpenCodeHTTPClient(server_url="http://localhost:8000")
+        client.session_id = "ses-1"
+        failed = MagicMock()
+        failed.status_code = status
+        failed.headers = {"Retry-After": "1"}
+        success = MagicMock()
+        success.status_code = 200
+        success.content = b'{"parts": []}'
+        mock_session = MagicMock()
+        mock_session.post.side_effect = [failed, success]
+        client._session = mock_session
+        closed_at_sleep = []
+
+        with patch(
+            "time.sleep",
+            side_effect=lambda delay: closed_at_sleep.append(failed.close.called),
+        ):
+            client.send_prompt(
+                prompt="Hello", model_id="github-copilot/claude-sonnet-4"
+            )
+
+        assert closed_at_sleep == [True]
+        failed.close.assert_called_once()
+
+    @pytest.mark.parametrize("compress_requests", [False, True])
+    def test_body_encoded_once_for_all_retries(self, compress_requests):
+        """
+        Given a large prompt whose first attempts time out
+        When I call send_prompt()
+        Then every attempt sends the same pre-encoded (and compressed) bytes
+        """
+        client = OpenCodeHTTPClient(
+            server_url="http://localhost:8000", compress_requests=compress_requests
+        )
+        client.session_id = "ses-1"
+        success = MagicMock()
+        success.status_code = 200
+        success.json.return_value = {"parts": []}
+        success.content = b'{"parts": []}'
+        mock_session = MagicMock()
+        mock_session.post.side_effect = [
+            requests.exceptions.Timeout("slow"),
+            requests.exceptions.Timeout("slow"),
+            success,
+        ]
+        client._session = mock_session
+        encode = opencode_http_client._encode_message_body
+
+        with patch.object(
+            opencode_http_client, "_encode_message_body", side_effect=encode
+        ) as mock_encode:
+            with patch("time.sleep"):
+                client.send_prompt(
+                    prompt="x" * 4096, model_id="github-copilot/claude-sonnet-4"
+                )
+
+        mock_encode.assert_called_once()
+        bodies = [c[1]["data"] for c in mock_session.post.call_args_list]
+        assert len(bodies) == 3
+        assert all(body is bodies[0] for body in bodies)
+
+
+class TestOpenCodeHTTPClientRateLimiting:
+    """Test suite for 429 handling with Retry-After"""
+
+    @staticmethod
+    def _rate_limited(retry_after):
+        response = MagicMock()
+        response.status_code = 429
+        response.text = "Too Many Requests"
+        response.headers = {"Retry-After": retry_after} if retry_after else {}
+        return response
+
+    def test_retry_after_wait_does_not_use_an_attempt(self):
+        """
+        Given the server answers 429 with Retry-After before each 503
+        When I call send_prompt()
+        Then it sleeps for Retry-After and still makes MAX_RETRIES real attempts
+        """
+        client = OpenCodeHTTPClient(server_url="http://localhost:8000")
+        client.session_id = "ses-1"
+
+        server_error = MagicMock()
+        server_error.status_code = 503
+        mock_session = MagicMock()
+        mock_session.post.side_effect = [
+            self._rate_limited("2"),
+            server_error,
+            server_error,
+            server_error,
+        ]
+        client._session = mock_session
+
+        with patch("time.sleep") as mock_sleep:
+            with pytest.raises(OpenCodeHTTPClientError, match="Server error 503"):
+                client.send_prompt(
+                    prompt="Hello", model_id="github-copilot/claude-sonnet-4"
+                )
+
+        assert mock_session.post.call_count == 1 + client.MAX_RETRIES
+        assert mock_sleep.call_args_list[0][0][0] == 2.0
+
+    def test_retry_after_beyond_cap_fails_fast(self):
+        """A Retry-After longer than RATE_LIMIT_MAX_WAIT should not be waited out"""
+        client = OpenCodeHTTPClient(server_url="http://localhost:8000")
+        client.session_id = "ses-1"
+
+        mock_session = MagicMock()
+        mock_session.post.return_value = self._rate_limited("120")
+        client._session = mock_session
+
+        with patch("time.sleep") as mock_sleep:
+            with pytest.raises(OpenCodeHTTPClientError, match="Client error 429"):
+                client.send_prompt(
+                    prompt="Hello", model_id="github-copilot/claude-sonnet-4"
+                )
+
+        mock_sleep.assert_not_called()
+        assert mock_session.post.call_count == 1
+
+    @pytest.mark.parametrize("retry_after", ["0", "Wed, 21 Oct 2015 07:28:00 GMT"])
+    def test_zero_retry_after_waits_are_bounded(self, retry_after):
+        """
+        Given a server that always answers 429 with a Retry-After of zero
+        (immediately, or an HTTP-date already in the past)
+        When I call send_prompt()
+        Then it gives up after RATE_LIMIT_MAX_RETRIES waits with the 429
+        """
+        client = OpenCodeHTTPClient(server_url="http://localhost:8000")
+        client.session_id = "ses-1"
+
+        mock_session = MagicMock()
+        mock_session.post.return_value = self._rate_limited(retry_after)
+        client._session = mock_session
+
+        with patch("time.sleep") as mock_sleep:
+            with pytest.raises(OpenCodeHTTPClientError, match="Client error 429"):
+                client.send_prompt(
+                    prompt="Hello", model_id="github-copilot/claude-sonnet-4"
+                )
+
+        assert mock_sleep.call_count == client.RATE_LIMIT_MAX_RETRIES
+        assert mock_session.post.call_count == client.RATE_LIMIT_MAX_RETRIES + 1
+
+    def test_retry_after_http_date_is_parsed(self):
+        """Retry-After given as an HTTP-date should become seconds from now"""
+        response = self._rate_limited("Wed, 21 Oct 2015 07:28:00 GMT")
+
+        assert opencode_http_client._retry_after_seconds(response) == 0.0
+        assert opencode_http_client._retry_after_seconds(
+            self._rate_limited("soon")
+        ) is None
+
+
+class TestOpenCodeHTTPClientCircuitBreaker:
+    """Test suite for failing fast while the server is unreachable"""
+
+    def test_circuit_opens_after_consecutive_connection_failures(self):
+        """
+        Given a server that refused CIRCUIT_FAILURE_THRESHOLD connections
+        When I call send_prompt() again within the cooldown
+        Then it fails immediately without another request or backoff sleep
+        """
+        client = OpenCodeHTTPClient(
+            server_url="http://localhost:8000", circuit_breaker=True
+        )
+        client.session_id = "ses-1"
+        client.CIRCUIT_FAILURE_THRESHOLD = client.MAX_RETRIES
+        mock_session = MagicMock()
+        refused = requests.exceptions.ConnectionError("refused")
+        mock_session.post.side_effect = refused
+        client._session = mock_session
+        model_id = "github-copilot/claude-sonnet-4"
+
+        with patch("time.sleep"):
+            with pytest.raises(OpenCodeConnectionError, match="after 3 retries"):
+                client.send_prompt(prompt="Hi", model_id=model_id)
+
+        with patch("time.sleep") as mock_sleep:
+            with pytest.raises(OpenCodeConnectionError, match="unreachable"):
+                client.send_prompt(prompt="Hi", model_id=model_id)
+
+        assert mock_session.post.call_count == client.MAX_RETRIES
+        mock_sleep.assert_not_called()
+
+    def test_response_resets_failure_count(self):
+        """A server that answers again should not keep counting old failures"""
+        client = OpenCodeHTTPClient(
+            server_url="http://localhost:8000", circuit_breaker=True
+        )
+        client.session_id = "ses-1"
+        success = MagicMock()
+        success.status_code = 200
+        success.content = b'{"info": {}, "parts": []}'
+        mock_session = MagicMock()
+        mock_session.post.side_effect = [
+            requests.exceptions.ConnectionError("refused"),
+            success,
+        ]
+        client._session = mock_session
+
+        with patch("time.sleep"):
+            client.send_prompt(prompt="Hi", model_id="github-copilot/claude-sonnet-4")
+
+        assert client._circuit_failures == 0
+
+    def test_circuit_breaker_is_opt_in(self):
+        """Without circuit_breaker, every send_prompt() runs the retry ladder"""
+        client = OpenCodeHTTPClient(server_url="http://localhost:8000")
+        client.session_id = "ses-1"
+        client.CIRCUIT_FAILURE_THRESHOLD = client.MAX_RETRIES
+        mock_session = MagicMock()
+        mock_session.post.side_effect = requests.exceptions.ConnectionError("refused")
+        client._session = mock_session
+
+        with patch("time.sleep"):
+            for _ in range(2):
+                with pytest.raises(OpenCodeConnectionError, match="after 3 retries"):
+                    client.send_prompt(
+                        prompt="Hi", model_id="github-copilot/claude-sonnet-4"
+                    )
+
+        assert mock_session.post.call_count == 2 * client.MAX_RETRIES
+
+
+class TestOpenCodeHTTPClientJSONDecoding:
+    """Test suite for response body decoding"""
+
+    def test_decode_json_parses_raw_bytes(self):
+        """decode_json() should decode the raw response body"""
+        pytest.importorskip("orjson")
+        from adw_modules.opencode_http_client import decode_json
+
+        response = MagicMock()
+        response.content = '{"parts": [{"type": "text", "content": "héllo"}]}'.encode()
+
+        assert decode_json(response) == {
+            "parts": [{"type": "text", "content": "héllo"}]
+        }
+
+    def test_decode_json_falls_back_to_stdlib_parser(self):
+        """Without orjson, decode_json() should parse the bytes, not .json()"""
+        from adw_modules import opencode_http_client
+
+        response = MagicMock()
+        response.content = b'{"id": "session-123"}'
+        response.json.side_effect = AssertionError("charset sniffing")
+
+        with patch.object(opencode_http_client, "ORJSON_AVAILABLE", False):
+            assert opencode_http_client.decode_json(response) == {"id": "session-123"}
+
+    @staticmethod
+    def _streamed_response(body: bytes) -> requests.Response:
+        response = requests.Response()
+        response.status_code = 200
+        response.raw = urllib3.HTTPResponse(
+            body=io.BytesIO(body), preload_content=False
+        )
+        return response
+
+    def test_streamed_body_is_read_in_one_pass(self):
+        """
+        Given a streamed requests.Response that has not been read yet
+        When its body is read
+        Then it comes straight from the raw stream, not from iter_content()
+        """
+        body = b'{"info": {"role": "assistant"}, "parts": []}'
+        response = self._streamed_response(body)
+
+        with patch.object(
+            requests.Response, "iter_content", side_effect=AssertionError("chunked")
+        ):
+            assert opencode_http_client._read_body(response) == body
+
+    def test_invalid_streamed_body_reported_from_read_bytes(self):
+        """
+        Given a streamed message response whose body is not JSON
+        When send_prompt() parses it
+        Then the error carries the body text read from the stream
+        """
+        client = OpenCodeHTTPClient(server_url="http://localhost:8000")
+        client.session_id = "ses-1"
+        mock_session = MagicMock()
+        mock_session.post.return_value = self._streamed_response(b"<html>oops</html>")
+        client._session = mock_session
+
+        with pytest.raises(OpenCodeHTTPClientError, match="Response: <html>oops"):
+            client.send_prompt(
+                prompt="Hello", model_id="github-copilot/claude-sonnet-4"
+            )
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,265 @@
+"""Unit tests for OpenCodeHTTPClient - Alternative transports
+
+Tests for selecting the transport and for driving the prompt flow through
+a urllib3 pool or an httpx.Client instead of requests.Session.
+"""
+
+import io
+import json
+import pytest
+import socket
+import urllib3
+from unittest.mock import MagicMock, patch
+from pathlib import Path
+import sys
+
+# Add scripts to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "scripts"))
+
+from adw_modules import opencode_http_client
+from adw_modules.opencode_http_client import (
+    OpenCodeConnectionError,
+    OpenCodeHTTPClient,
+    _Urllib3Session,
+)
+
+
+class TestTransportSelection:
+    """Test suite for the transport constructor flag"""
+
+    def test_requests_is_the_default_transport(self):
+        """Clients should keep using requests unless asked otherwise"""
+        client = OpenCodeHTTPClient(server_url="http://localhost:8000")
+
+        assert client.transport == "requests"
+        assert type(client._get_session()).__name__ == "Session"
+
+    def test_urllib3_transport_selected_from_config(self):
+        """from_config() should build the transport named by opencode.transport"""
+        config_type = type(opencode_http_client.config)
+
+        with patch.object(
+            config_type, "opencode_transport", property(lambda self: "urllib3")
+        ):
+            client = OpenCodeHTTPClient.from_config()
+
+        assert client.transport == "urllib3"
+        assert isinstance(client._get_session(), _Urllib3Session)
+
+    def test_unknown_transport_raises_error(self):
+        """Unsupported transport names should be rejected"""
+        with pytest.raises(ValueError, match="Unsupported transport"):
+            OpenCodeHTTPClient(server_url="http://localhost:8000", transport="aiohttp")
+
+    def test_http2_transport_requires_httpx(self):
+        """httpx-http2 should fail fast when httpx[http2] is not installed"""
+        with patch.object(opencode_http_client, "HTTPX_HTTP2_AVAILABLE", False):
+            with pytest.raises(ValueError, match="httpx"):
+                OpenCodeHTTPClient(
+                    server_url="https://localhost:8000", transport="httpx-http2"
+                )
+
+
+def _urllib3_response(status: int, payload: dict) -> urllib3.HTTPResponse:
+    """Build a preloaded urllib3 response carrying a JSON body."""
+    return urllib3.HTTPResponse(
+        body=io.BytesIO(json.dumps(payload).encode()),
+        status=status,
+        headers={"Content-Type": "application/json"},
+        preload_content=True,
+    )
+
+
+class TestUrllib3Transport:
+    """Test suite for prompts sent straight through urllib3"""
+
+    def test_send_prompt_over_urllib3_pool(self):
+        """
+        Given a client using the urllib3 transport
+        When I call send_prompt()
+        Then the session and message requests go through the pool manager
+        """
+        client = OpenCodeHTTPClient(
+            server_url="http://localhost:8000", api_key="k", transport="urllib3"
+        )
+        assert isinstance(client._get_session(), _Urllib3Session)
+        pool = MagicMock()
+        pool.request.side_effect = [
+            _urllib3_response(201, {"id": "ses-1"}),
+            _urllib3_response(200, {"info": {"role": "assistant"}, "parts": []}),
+        ]
+        client._session = _Urllib3Session(pool)
+
+        result = client.send_prompt(
+            prompt="Hello", model_id="github-copilot/claude-sonnet-4"
+        )
+
+        assert result["session_id"] == "ses-1"
+        method, url = pool.request.call_args[0]
+        kwargs = pool.request.call_args[1]
+        assert (method, url) == ("POST", "http://localhost:8000/session/ses-1/message")
+        assert kwargs["headers"]["Authorization"] == "Bearer k"
+        assert "gzip" in kwargs["headers"]["accept-encoding"]
+        assert json.loads(kwargs["body"])["parts"][0]["text"] == "Hello"
+
+    def test_urllib3_timeouts_are_retried(self):
+        """Exhausted urllib3 retries should surface as the underlying timeout"""
+        pool = MagicMock()
+        pool.request.side_effect = urllib3.exceptions.MaxRetryError(
+            None, "/", urllib3.exceptions.ReadTimeoutError(None, "/", "timed out")
+        )
+        client = OpenCodeHTTPClient(
+            server_url="http://localhost:8000", transport="urllib3"
+        )
+        client.session_id = "ses-1"
+        client._session = _Urllib3Session(pool)
+
+        with patch("time.sleep") as mock_sleep:
+            with pytest.raises(TimeoutError):
+                client.send_prompt(
+                    prompt="Hello", model_id="github-copilot/claude-sonnet-4"
+                )
+
+        assert mock_sleep.call_count == client.MAX_RETRIES - 1
+
+
+    def test_urllib3_health_check_timeout_reported_as_timeout(self):
+        """A timed-out health check should not be reported as a refused connection"""
+        pool = MagicMock()
+        pool.request.side_effect = urllib3.exceptions.MaxRetryError(
+            None, "/", urllib3.exceptions.ReadTimeoutError(None, "/", "timed out")
+        )
+        client = OpenCodeHTTPClient(
+            server_url="http://localhost:8000", transport="urllib3"
+        )
+        client._session = _Urllib3Session(pool)
+
+        with pytest.raises(OpenCodeConnectionError, match="Connection timeout"):
+            client._verify_connection()
+
+
+class TestRequestsTransport:
+    """Test suite for prompts sent over the shared requests adapter"""
+
+    def test_health_check_read_timeout_reported_as_timeout(self):
+        """
+        Given a server that accepts the connection but never answers
+        When the health check GET times out reading the response
+        Then it is reported as a timeout, not as a failed connection
+        """
+        with socket.socket() as server:
+            server.bind(("127.0.0.1", 0))
+            server.listen(1)
+            port = server.getsockname()[1]
+            client = OpenCodeHTTPClient(
+                server_url=f"http://127.0.0.1:{port}", timeout=0.2
+            )
+
+            with pytest.raises(OpenCodeConnectionError, match="Connection timeout"):
+                client._verify_connection()
+
+
+class TestHttpxTransport:
+    """Test suite for prompts sent over httpx"""
+
+    def test_send_prompt_over_httpx_client(self):
+        """
+        Given a client using the httpx-http2 transport
+        When I call send_prompt()
+        Then the session and message requests go through httpx.Client
+        """
+        httpx = pytest.importorskip("httpx")
+        pytest.importorskip("h2")
+        requests_seen = []
+
+        def handler(request):
+            requests_seen.append(request)
+            if request.url.path == "/session":
+                return httpx.Response(201, json={"id": "ses-1"})
+            return httpx.Response(
+                200, json={"info": {"role": "assistant"}, "parts": []}
+            )
+
+        client = OpenCodeHTTPClient(
+            server_url="https://localhost:8000", api_key="k", transport="httpx-http2"
+        )
+        assert isinstance(client._get_session(), httpx.Client)
+        client._session = httpx.Client(transport=httpx.MockTransport(handler))
+
+        result = client.send_prompt(
+            prompt="Hello", model_id="github-copilot/claude-sonnet-4"
+        )
+
+        assert result["session_id"] == "ses-1"
+        message = requests_seen[1]
+        assert message.url.path == "/session/ses-1/message"
+        assert message.headers["Authorization"] == "Bearer k"
+        assert json.loads(message.content)["parts"][0]["text"] == "Hello"
+
+    def test_httpx_pool_sized_from_config(self):
+        """The httpx connection limit should match opencode.pool_maxsize"""
+        pytest.importorskip("httpx")
+        pytest.importorskip("h2")
+        config_type = type(opencode_http_client.config)
+        client = OpenCodeHTTPClient(
+            server_url="http://localhost:8000", transport="httpx-http2"
+        )
+
+        with patch.object(
+            config_type, "opencode_pool_maxsize", property(lambda self: 40)
+        ), patch.object(opencode_http_client.httpx, "Client") as mock_client:
+            client._get_session()
+
+        limits = mock_client.call_args[1]["limits"]
+        assert limits.max_connections == 40
+        assert limits.max_keepalive_connections == 40
+
+    def test_httpx_transport_selected_from_config(self):
+        """from_config() should build the transport named by opencode.transport"""
+        pytest.importorskip("httpx")
+        pytest.importorskip("h2")
+        config_type = type(opencode_http_client.config)
+
+        with patch.object(
+            config_type, "opencode_transport", property(lambda self: "httpx-http2")
+        ):
+            client = OpenCodeHTTPClient.from_config()
+
+        assert client.transport == "httpx-http2"
+
+    def test_httpx_timeouts_are_retried(self):
+        """httpx timeouts should use the same retry ladder as requests timeouts"""
+        httpx = pytest.importorskip("httpx")
+        pytest.importorskip("h2")
+
+        def handler(request):
+            raise httpx.ReadTimeout("timed out", request=request)
+
+        client = OpenCodeHTTPClient(
+            server_url="https://localhost:8000", transport="httpx-http2"
+        )
+        client._session = httpx.Client(transport=httpx.MockTransport(handler))
+
+        with patch("time.sleep") as mock_sleep:
+            with pytest.raises(TimeoutError):
+                client.send_prompt(
+                    prompt="Hello", model_id="github-copilot/claude-sonnet-4"
+                )
+
+        assert mock_sleep.call_count == client.MAX_RETRIES - 1
+
+    def test_httpx_health_check_timeout_reported_as_timeout(self):
+        """A timed-out health check should not be reported as a refused connection"""
+        httpx = pytest.importorskip("httpx")
+        pytest.importorskip("h2")
+
+        def handler(request):
+            raise httpx.ReadTimeout("timed out", request=request)
+
+        client = OpenCodeHTTPClient(
+            server_url="https://localhost:8000", transport="httpx-http2"
+        )
+        client._session = httpx.Client(transport=httpx.MockTransport(handler))
+
+        with pytest.raises(OpenCodeConnectionError, match="Connection timeout"):
+            client._verify_connection()
@@ -5,13 +5,17 @@ Tests the intelligent model routing functionality that automatically selects
 appropriate models based on task types.
 """
 
+import json
 import pytest
+from collections.abc import Mapping
+from typing import get_args
 from unittest.mock import Mock, patch, MagicMock
 from scripts.adw_modules.opencode_http_client import (
     OpenCodeHTTPClient,
     MODEL_LIGHTWEIGHT,
     MODEL_HEAVY_LIFTING,
     TASK_TYPE_TO_MODEL,
+    TaskType,
 )
 
 
@@ -93,6 +97,17 @@ class TestModelRouting:
         assert len(lightweight_tasks) + len(heavy_tasks) == 9
         assert len(TASK_TYPE_TO_MODEL) == 9
 
+    def test_get_model_for_task_follows_config_changes(self):
+        """Routing decisions are precomputed but model IDs still come from config."""
+        with patch("scripts.adw_modules.opencode_http_client.config") as mock_config:
+            mock_config.opencode_model_heavy_lifting = "custom/heavy-v1"
+            mock_config.opencode_model_lightweight = "custom/light-v1"
+            assert OpenCodeHTTPClient.get_model_for_task("review") == "custom/heavy-v1"
+            assert OpenCodeHTTPClient.get_model_for_task("plan") == "custom/light-v1"
+
+            mock_config.opencode_model_heavy_lifting = "custom/heavy-v2"
+            assert OpenCodeHTTPClient.get_model_for_task("review") == "custom/heavy-v2"
+
     def test_get_model_for_task_raises_error_for_unsupported_task(self):
         """Test that unsupported task types raise ValueError with helpful message."""
         with pytest.raises(ValueError) as exc_info:
@@ -106,11 +121,11 @@ class TestModelRouting:
             assert task_type in error_msg
 
     def test_get_all_task_types_returns_complete_mapping(self):
-        """Test get_all_task_types returns copy of task type mapping."""
+        """Test get_all_task_types returns the read-only task type mapping."""
         result = OpenCodeHTTPClient.get_all_task_types()
 
-        # Should be a dict
-        assert isinstance(result, dict)
+        # Should be a mapping
+        assert isinstance(result, Mapping)
 
         # Should have 9 entries
         assert len(result) == 9
@@ -130,8 +145,9 @@ class TestModelRouting:
         for task_type in expected_tasks:
             assert task_type in result
 
-        # Should be a copy (modifying it doesn't affect original)
-        result["new_task"] = "new_model"
+        # Should be read-only (callers cannot alter routing)
+        with pytest.raises(TypeError):
+            result["new_task"] = "new_model"
         assert "new_task" not in TASK_TYPE_TO_MODEL
 
     def test_is_lightweight_task_correctly_identifies_lightweight_tasks(self):
@@ -197,6 +213,9 @@ class TestModelRouting:
         mock_session_response = Mock()
         mock_session_response.status_code = 201
         mock_session_response.json.return_value = {"id": "test-session-id"}
+        mock_session_response.content = json.dumps(
+            mock_session_response.json.return_value
+        ).encode()
 
         # Mock message response
         mock_message_response = Mock()
@@ -208,6 +227,9 @@ class TestModelRouting:
             },
             "parts": [{"type": "text", "content": "Test response"}],
         }
+        mock_message_response.content = json.dumps(
+            mock_message_response.json.return_value
+        ).encode()
         mock_session.post.side_effect = [mock_session_response, mock_message_response]
 
         # Test with lightweight task
@@ -219,7 +241,7 @@ class TestModelRouting:
 
         # Check message call (second call)
         message_call = mock_session.post.call_args_list[1]
-        request_body = message_call[1]["json"]
+        request_body = json.loads(message_call[1]["data"])
 
         # Verify OpenCode message format
         assert "model" in request_body
@@ -238,6 +260,9 @@ class TestModelRouting:
         mock_session_response = Mock()
         mock_session_response.status_code = 201
         mock_session_response.json.return_value = {"id": "test-session-id"}
+        mock_session_response.content = json.dumps(
+            mock_session_response.json.return_value
+        ).encode()
 
         # Mock message response
         mock_message_response = Mock()
@@ -249,6 +274,9 @@ class TestModelRouting:
             },
             "parts": [{"type": "text", "content": "Test response"}],
         }
+        mock_message_response.content = json.dumps(
+            mock_message_response.json.return_value
+        ).encode()
         mock_session.post.side_effect = [mock_session_response, mock_message_response]
 
         # Test with heavy task
@@ -260,7 +288,7 @@ class TestModelRouting:
 
         # Check message call (second call)
         message_call = mock_session.post.call_args_list[1]
-        request_body = message_call[1]["json"]
+        request_body = json.loads(message_call[1]["data"])
 
         # Verify OpenCode message format
         assert "model" in request_body
@@ -279,6 +307,9 @@ class TestModelRouting:
         mock_session_response = Mock()
         mock_session_response.status_code = 201
         mock_session_response.json.return_value = {"id": "test-session-id"}
+        mock_session_response.content = json.dumps(
+            mock_session_response.json.return_value
+        ).encode()
 
         # Mock message response
         mock_message_response = Mock()
@@ -287,6 +318,9 @@ class TestModelRouting:
             "info": {"role": "assistant", "model": "custom-model"},
             "parts": [{"type": "text", "content": "Test response"}],
         }
+        mock_message_response.content = json.dumps(
+            mock_message_response.json.return_value
+        ).encode()
         mock_session.post.side_effect = [mock_session_response, mock_message_response]
 
         # Provide both model_id and task_type
@@ -303,7 +337,7 @@ class TestModelRouting:
 
         # Check message call (second call)
         message_call = mock_session.post.call_args_list[1]
-        request_body = message_call[1]["json"]
+        request_body = json.loads(message_call[1]["data"])
 
         # Verify OpenCode message format with custom model
         assert "model" in request_body
@@ -370,6 +404,7 @@ class TestModelRouting:
             },
             "parts": [{"type": "text", "content": "Test response"}],
         }
+        mock_response.content = json.dumps(mock_response.json.return_value).encode()
         mock_session.post.return_value = mock_response
 
         # Test with lightweight task (should use lightweight_timeout)
@@ -403,6 +438,10 @@ class TestModelRoutingEdgeCases:
         with pytest.raises(ValueError):
             OpenCodeHTTPClient.get_model_for_task(None)  # type: ignore
 
+    def test_task_type_literal_matches_routing_table(self):
+        """TaskType and TASK_TYPE_TO_MODEL must list the same task types."""
+        assert set(get_args(TaskType)) == set(TASK_TYPE_TO_MODEL)
+
     def test_model_routing_functions_are_static(self):
         """Test that model routing functions can be called without instantiation."""
         # Should be able to call without creating an instance
@@ -219,6 +219,74 @@ class TestOpenCodeConfiguration:
                     config = ADWConfig()
                     assert config.opencode_read_timeout == 900
 
+    def test_opencode_decision_cache_default(self):
+        """Test the decision cache is off unless configured."""
+        with patch("builtins.open", mock_open(read_data="{}")):
+            with patch("pathlib.Path.exists", return_value=True):
+                with patch("pathlib.Path.is_file", return_value=True):
+                    config = ADWConfig()
+                    assert config.opencode_decision_cache is False
+
+    def test_opencode_compress_requests_default(self):
+        """Test request body compression is off unless configured."""
+        with patch("builtins.open", mock_open(read_data="{}")):
+            with patch("pathlib.Path.exists", return_value=True):
+                with patch("pathlib.Path.is_file", return_value=True):
+                    config = ADWConfig()
+                    assert config.opencode_compress_requests is False
+
+    def test_opencode_circuit_breaker_default(self):
+        """Test the OpenCode circuit breaker is off unless configured."""
+        with patch("builtins.open", mock_open(read_data="{}")):
+            with patch("pathlib.Path.exists", return_value=True):
+                with patch("pathlib.Path.is_file", return_value=True):
+                    config = ADWConfig()
+                    assert config.opencode_circuit_breaker is False
+
+    def test_opencode_health_cache_ttl_default(self):
+        """Test health checks are reused for 10 seconds unless configured."""
+        with patch("builtins.open", mock_open(read_data="{}")):
+            with patch("pathlib.Path.exists", return_value=True):
+                with patch("pathlib.Path.is_file", return_value=True):
+                    config = ADWConfig()
+                    assert config.opencode_health_cache_ttl == 10.0
+
+    def test_opencode_transport_default(self):
+        """Test the OpenCode client uses requests unless configured."""
+        with patch("builtins.open", mock_open(read_data="{}")):
+            with patch("pathlib.Path.exists", return_value=True):
+                with patch("pathlib.Path.is_file", return_value=True):
+                    config = ADWConfig()
+                    assert config.opencode_transport == "requests"
+
+    def test_opencode_transport_custom(self):
+        """Test a configured OpenCode transport is returned."""
+        config_data = {"opencode": {"transport": "httpx-http2"}}
+        with patch("builtins.open", mock_open(read_data=yaml.dump(config_data))):
+            with patch("pathlib.Path.exists", return_value=True):
+                with patch("pathlib.Path.is_file", return_value=True):
+                    config = ADWConfig()
+                    assert config.opencode_transport == "httpx-http2"
+
+    def test_opencode_pool_sizes_default(self):
+        """Test default OpenCode connection pool sizes."""
+        with patch("builtins.open", mock_open(read_data="{}")):
+            with patch("pathlib.Path.exists", return_value=True):
+                with patch("pathlib.Path.is_file", return_value=True):
+                    config = ADWConfig()
+                    assert config.opencode_pool_connections == 16
+                    assert config.opencode_pool_maxsize == 64
+
+    def test_opencode_pool_sizes_custom(self):
+        """Test custom OpenCode connection pool sizes."""
+        config_data = {"opencode": {"pool_connections": 4, "pool_maxsize": 128}}
+        with patch("builtins.open", mock_open(read_data=yaml.dump(config_data))):
+            with patch("pathlib.Path.exists", return_value=True):
+                with patch("pathlib.Path.is_file", return_value=True):
+                    config = ADWConfig()
+                    assert config.opencode_pool_connections == 4
+                    assert config.opencode_pool_maxsize == 128
+
     def test_comprehensive_opencode_config(self):
         """Test comprehensive OpenCode configuration with all keys."""
         config_data = {
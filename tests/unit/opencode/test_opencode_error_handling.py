@@ -7,8 +7,9 @@ for various error scenarios (authentication, timeout, JSON decode, etc).
 
 import json
 import tempfile
+import threading
 from pathlib import Path
-from unittest.mock import patch, Mock
+from unittest.mock import patch, Mock, PropertyMock
 import pytest
 import requests.exceptions
 
@@ -38,6 +39,7 @@ class TestOpenCodeHTTPClientErrorHandling:
             "message": {"role": "assistant"},
             "parts": [],
         }
+        mock_response.content = json.dumps(mock_response.json.return_value).encode()
         mock_session.post.return_value = mock_response
 
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -112,6 +114,9 @@ class TestOpenCodeHTTPClientErrorHandling:
         mock_session_response = Mock()
         mock_session_response.status_code = 200
         mock_session_response.json.return_value = {"id": "session-123"}
+        mock_session_response.content = json.dumps(
+            mock_session_response.json.return_value
+        ).encode()
 
         # First message times out, second succeeds
         timeout_error = requests.exceptions.Timeout("Request timed out")
@@ -121,6 +126,9 @@ class TestOpenCodeHTTPClientErrorHandling:
             "info": {"role": "assistant"},
             "parts": [],
         }
+        mock_success_response.content = json.dumps(
+            mock_success_response.json.return_value
+        ).encode()
 
         mock_session.post.side_effect = [
             mock_session_response,
@@ -216,6 +224,7 @@ class TestOpenCodeHTTPClientErrorHandling:
                 "message": {"role": "assistant"},
                 "parts": [],
             }
+            mock_response.content = json.dumps(mock_response.json.return_value).encode()
             mock_session.post.return_value = mock_response
 
             with tempfile.TemporaryDirectory() as temp_dir:
@@ -248,11 +257,15 @@ class TestOpenCodeHTTPClientErrorHandling:
         mock_session_response = Mock()
         mock_session_response.status_code = 200
         mock_session_response.json.return_value = {"id": "session-123"}
+        mock_session_response.content = json.dumps(
+            mock_session_response.json.return_value
+        ).encode()
 
         # Message returns invalid JSON
         mock_message_response = Mock()
         mock_message_response.status_code = 200
         mock_message_response.text = "Invalid JSON response"
+        mock_message_response.content = b"Invalid JSON response"
         mock_message_response.json.side_effect = json.JSONDecodeError(
             "Invalid JSON", "doc", 0
         )
@@ -288,3 +301,127 @@ class TestOpenCodeHTTPClientErrorHandling:
                     "Invalid JSON response"
                     in log_data["response"]["additional_context"]["response_text"]
                 )
+
+    @patch("scripts.adw_modules.opencode_http_client.requests.Session")
+    def test_async_logging_writes_response_log_in_background(
+        self, mock_session_class
+    ):
+        """Test async_logging defers the response log until flush_logs()."""
+        mock_session = Mock()
+        mock_session_class.return_value = mock_session
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {"message": {"role": "assistant"}, "parts": []}
+        mock_response.content = json.dumps(mock_response.json.return_value).encode()
+        mock_session.post.return_value = mock_response
+        client = OpenCodeHTTPClient("http://test-server.com", async_logging=True)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            with patch(
+                "scripts.adw_modules.opencode_http_client.config"
+            ) as mock_config:
+                mock_config.logs_dir = Path(temp_dir)
+
+                response = client.send_prompt(
+                    prompt="Test prompt",
+                    model_id="test-model",
+                    adw_id="async123",
+                    agent_name="async_agent",
+                )
+                response["parts"].append("mutated by caller")
+                OpenCodeHTTPClient.flush_logs()
+
+                log_dir = Path(temp_dir) / "async123" / "async_agent"
+                log_files = list(log_dir.glob("response_*.json"))
+                assert len(log_files) == 1
+                with open(log_files[0], "r") as f:
+                    assert json.load(f)["response"]["parts"] == []
+
+    @patch("scripts.adw_modules.opencode_http_client.requests.Session")
+    @patch("scripts.adw_modules.opencode_http_client.time.sleep")
+    def test_retry_logs_written_inline_without_async_logging(
+        self, mock_sleep, mock_session_class
+    ):
+        """Test retry logs are written on the calling thread by default."""
+        mock_session = Mock()
+        mock_session_class.return_value = mock_session
+        mock_session.post.side_effect = requests.exceptions.Timeout("timed out")
+        writer_threads = []
+
+        def record_thread(**kwargs):
+            writer_threads.append(threading.current_thread().name)
+
+        with patch(
+            "scripts.adw_modules.opencode_http_client.log_error_with_context",
+            side_effect=record_thread,
+        ):
+            with pytest.raises(TimeoutError):
+                self.client.send_prompt(
+                    prompt="Test prompt",
+                    model_id="test-model",
+                    adw_id="bg123",
+                    agent_name="bg_agent",
+                )
+
+        # Two retry logs plus the final one
+        assert writer_threads == [threading.current_thread().name] * 3
+
+    @patch("scripts.adw_modules.opencode_http_client.requests.Session")
+    @patch("scripts.adw_modules.opencode_http_client.time.sleep")
+    def test_async_logging_queues_retry_logs(self, mock_sleep, mock_session_class):
+        """Test async_logging hands retry logs to the writer thread."""
+        mock_session = Mock()
+        mock_session_class.return_value = mock_session
+        mock_session.post.side_effect = requests.exceptions.Timeout("timed out")
+        client = OpenCodeHTTPClient("http://test-server.com", async_logging=True)
+        writer_threads = []
+
+        def record_thread(**kwargs):
+            writer_threads.append(threading.current_thread().name)
+
+        with patch(
+            "scripts.adw_modules.opencode_http_client.log_error_with_context",
+            side_effect=record_thread,
+        ):
+            with pytest.raises(TimeoutError):
+                client.send_prompt(
+                    prompt="Test prompt",
+                    model_id="test-model",
+                    adw_id="bg123",
+                    agent_name="bg_agent",
+                )
+            OpenCodeHTTPClient.flush_logs()
+
+        assert writer_threads == ["opencode-log-writer"] * 3
+
+    @patch("scripts.adw_modules.opencode_http_client.requests.Session")
+    @patch("scripts.adw_modules.opencode_http_client.time.sleep")
+    def test_logged_server_error_body_decoded_once_per_attempt(
+        self, mock_sleep, mock_session_class
+    ):
+        """Test a logged 5xx body is read once for both message and context."""
+        mock_session = Mock()
+        mock_session_class.return_value = mock_session
+        error_response = Mock()
+        error_response.status_code = 503
+        text = PropertyMock(return_value="Service Unavailable")
+        type(error_response).text = text
+        mock_session.post.return_value = error_response
+        self.client.session_id = "ses-1"
+
+        with patch(
+            "scripts.adw_modules.opencode_http_client.log_error_with_context"
+        ) as mock_log:
+            with pytest.raises(OpenCodeHTTPClientError):
+                self.client.send_prompt(
+                    prompt="Test prompt",
+                    model_id="test-model",
+                    adw_id="text123",
+                    agent_name="text_agent",
+                )
+
+        assert mock_log.call_count == 3
+        assert text.call_count == 3
+        final = mock_log.call_args[1]
+        assert final["prompt_preview"] == "Test prompt"
+        assert final["additional_context"]["response_text"] == "Service Unavailable"
@@ -6,8 +6,10 @@ for response logging in OpenCodeHTTPClient.
 """
 
 import json
+import shutil
 import tempfile
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from unittest.mock import patch, Mock, MagicMock
@@ -123,6 +125,31 @@ class TestSaveResponseLog:
                 assert log_data["error_context"] == error_context
                 assert log_data["log_metadata"]["log_type"] == "error"
 
+    def test_save_response_log_compact_unless_pretty(self):
+        """Logs are written compact by default and indented on request."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            with patch(
+                "scripts.adw_modules.opencode_http_client.config"
+            ) as mock_config:
+                mock_config.logs_dir = Path(temp_dir)
+                response = {"parts": [{"type": "text", "content": "héllo"}], 1: "x"}
+
+                with patch(
+                    "scripts.adw_modules.opencode_http_client.datetime"
+                ) as mock_datetime:
+                    mock_datetime.now.return_value = datetime(2026, 1, 1, 0, 0, 0)
+                    compact_path = save_response_log("test1234", "agent", response)
+                    compact = compact_path.read_bytes()
+                    pretty_path = save_response_log(
+                        "test1234", "agent", response, pretty=True
+                    )
+                    pretty = pretty_path.read_bytes()
+
+                assert b"\n" not in compact
+                assert b'\n  "adw_id"' in pretty
+                assert json.loads(compact) == json.loads(pretty)
+                assert json.loads(compact)["response"]["1"] == "x"
+
     def test_save_response_log_input_validation(self):
         """Test input validation for save_response_log."""
         response = {"test": "data"}
@@ -162,6 +189,78 @@ class TestSaveResponseLog:
                 assert log_dir.exists()
                 assert log_path.parent == log_dir
 
+    def test_save_response_log_creates_directory_once(self):
+        """Repeat logs for an agent skip mkdir but survive the directory vanishing."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            with patch(
+                "scripts.adw_modules.opencode_http_client.config"
+            ) as mock_config:
+                mock_config.logs_dir = Path(temp_dir)
+                log_dir = Path(temp_dir) / "once_adw" / "once_agent"
+
+                with patch.object(
+                    Path, "mkdir", autospec=True, side_effect=Path.mkdir
+                ) as mkdir:
+
+                    def agent_dir_mkdirs():
+                        # Top-level calls only; mkdir recurses for parents
+                        return [
+                            c
+                            for c in mkdir.call_args_list
+                            if c.args[0] == log_dir and c.kwargs.get("parents")
+                        ]
+
+                    save_response_log("once_adw", "once_agent", {"n": 1})
+                    save_response_log("once_adw", "once_agent", {"n": 2})
+                    assert len(agent_dir_mkdirs()) == 1
+
+                    shutil.rmtree(log_dir)
+                    log_path = save_response_log("once_adw", "once_agent", {"n": 3})
+                    assert len(agent_dir_mkdirs()) == 2
+
+                assert log_path.exists()
+
+    def test_save_response_log_concurrent_first_writes(self):
+        """Threads racing to create the same agent directory all succeed."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            with patch(
+                "scripts.adw_modules.opencode_http_client.config"
+            ) as mock_config:
+                mock_config.logs_dir = Path(temp_dir)
+                with ThreadPoolExecutor(max_workers=8) as pool:
+                    paths = list(
+                        pool.map(
+                            lambda n: save_response_log(
+                                "race_adw", f"agent_{n % 2}", {"n": n}
+                            ),
+                            range(16),
+                        )
+                    )
+
+            assert all(path.parent.is_dir() for path in paths)
+            assert {path.parent.name for path in paths} == {"agent_0", "agent_1"}
+
+    def test_save_response_log_timestamps_from_one_clock_read(self):
+        """File name, timestamp and created_at all come from one datetime.now()."""
+        fixed = datetime(2026, 1, 2, 3, 4, 5, 678901)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            with patch(
+                "scripts.adw_modules.opencode_http_client.config"
+            ) as mock_config, patch(
+                "scripts.adw_modules.opencode_http_client.datetime"
+            ) as mock_datetime:
+                mock_config.logs_dir = Path(temp_dir)
+                mock_datetime.now.return_value = fixed
+
+                log_path = save_response_log("clock_adw", "clock_agent", {"n": 1})
+
+            mock_datetime.now.assert_called_once_with()
+            assert log_path.name == "response_20260102_030405.json"
+            with open(log_path, "r") as f:
+                log_data = json.load(f)
+            assert log_data["timestamp"] == fixed.isoformat()
+            assert log_data["log_metadata"]["created_at"] == fixed.isoformat()
+
     def test_save_response_log_config_fallback(self):
         """Test fallback behavior when config module is not available."""
         with tempfile.TemporaryDirectory() as temp_dir:
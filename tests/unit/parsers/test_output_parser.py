@@ -253,6 +253,7 @@ class TestExtractToolExecutionDetails:
         assert result["tool_use_count"] == 4
         assert len(result["tools_used"]) == 2  # Only unique tools
         assert set(result["tools_used"]) == {"write", "read"}
+        assert result["tools_used"] == ["write", "read"]  # First-use order
 
     def test_mixed_part_types_filtered(self):
         """Test that non-tool parts are filtered out correctly."""
@@ -416,6 +417,40 @@ class TestEstimateMetricsFromParts:
         assert result["files_changed"] >= 1
         assert result["files_changed"] <= 3  # Should not excessively double-count
 
+    def test_full_extension_counted_once(self):
+        """Test that "a.json" is one file, not "a.js" plus "a.json"."""
+        parts = [
+            {"type": "tool_result", "output": "Updating: config/app.json\nsrc/app.tsx"}
+        ]
+        result = estimate_metrics_from_parts(parts)
+
+        assert result["files_changed"] == 2
+
+    def test_overlapping_deletion_patterns_each_counted(self):
+        """Test that a TODO removal marker also counts its "remove" keyword."""
+        parts = [{"type": "tool_result", "output": "// TODO: remove old\n- rm x"}]
+        result = estimate_metrics_from_parts(parts)
+
+        # "// TODO: remove", "remove ", "- " and "rm " -> 4 deletions x 2 lines
+        assert result["lines_removed"] == 8
+
+    def test_file_tracking_capped_but_deletions_still_counted(self):
+        """Test that files_changed stops at the cap and is flagged as truncated."""
+        paths = " ".join(f"src/mod_{i}.py" for i in range(300))
+        parts = [
+            {"type": "tool_result", "output": f"{paths} rm a"},
+            {"type": "tool_result", "output": "src/extra.py\ndelete b"},
+        ]
+        result = estimate_metrics_from_parts(parts)
+
+        assert result["files_changed"] == 256
+        assert result["files_changed_truncated"] is True
+        # Deletions after the cap, in the same part and in later parts
+        assert result["lines_removed"] == 4
+        assert "files_changed_truncated" not in estimate_metrics_from_parts(
+            [{"type": "text", "content": "Created src/app.py"}]
+        )
+
     def test_code_blocks_boost_file_estimate(self):
         """Test that code blocks boost file estimates when no file patterns found."""
         parts = [